@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+
+# Vector fields built with NumPy instead of one Arrow per sample.
+#
+# ArrowVectorField calls the field function once per grid point and builds a full
+# Arrow (Line + tip Triangle, rotations, scaling) for each sample: 729 times for a
+# 9x9x9 grid. GridArrowVectorField samples the same grid, evaluates the function
+# once on the whole (N, 3) array and computes every shaft and tip in one batched
+# pass; each arrow is then a bare VMobject whose points are filled in directly.
+#
+# The field functions used in the scenes (e.g. `lambda pos: np.array([-pos[1], pos[0], pos[2]])`)
+# work unchanged: they get the grid as a (3, N) array, so pos[0] is every x at once.
+# Functions that cannot handle that are evaluated point by point, and so are
+# functions whose batched result differs from the point-by-point one on a few sample
+# points (e.g. `pos / np.linalg.norm(pos)` normalizes by the norm of the whole grid).
+#
+# FieldMorph replaces Transform between two such fields with the same number of
+# arrows (the same grid): instead of aligning the points of every arrow pair and
+# copying the field at the start, each frame turns and rescales all (N, 3) vectors
+# and blends their colors at once, writing into arrays the arrows share.
+#
+#   self.play(FieldMorph(vector_field_5, vector_field_4), run_time=2)
+
+import numpy as np
+from manim import *
+from manim.mobject.vector_field import DEFAULT_SCALAR_FIELD_COLORS
+from manim.utils.simple_functions import sigmoid
+
+
+def field_grid(x_range=None, y_range=None, z_range=None, three_dimensions=False):
+    """Sample points in the same order and spacing as ArrowVectorField, as an (N, 3) array"""
+    x_range = list(x_range or [np.floor(-config["frame_width"] / 2), np.ceil(config["frame_width"] / 2)])
+    y_range = list(y_range or [np.floor(-config["frame_height"] / 2), np.ceil(config["frame_height"] / 2)])
+    ranges = [x_range, y_range]
+    if three_dimensions or z_range:
+        ranges.append(list(z_range or y_range))
+    else:
+        ranges.append([0, 0])
+    axes = []
+    for axis_range in ranges:
+        # Two-element ranges default to a 0.5 step, and the end is inclusive, as in manim
+        start, stop, step = (axis_range + [0.5])[:3]
+        axes.append(np.arange(start, stop + step, step))
+    xs, ys, zs = np.meshgrid(*axes, indexing="ij")
+    return np.stack([xs.ravel(), ys.ravel(), zs.ravel()], axis=1)
+
+
+# Sample points on which a batched evaluation must agree with the point-by-point one
+CHECK_POINTS = 5
+
+
+def _evaluate_points(func, points):
+    with np.errstate(all="ignore"):
+        values = np.array([func(point) for point in points], dtype=float)
+    return np.nan_to_num(values, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def evaluate_field(func, points):
+    """Evaluate func on all points at once when it broadcasts to the same values, else point by point"""
+    try:
+        with np.errstate(all="ignore"):
+            values = np.asarray(func(points.T), dtype=float)
+        if values.shape == (3, len(points)):
+            values = np.nan_to_num(values.T, nan=0.0, posinf=0.0, neginf=0.0)
+            # A function that reduces over its argument also returns (3, N), with wrong vectors
+            checked = np.unique(np.linspace(0, len(points) - 1, CHECK_POINTS).astype(int))
+            if np.allclose(values[checked], _evaluate_points(func, points[checked]), rtol=1e-9, atol=1e-12):
+                return values
+    except (ValueError, TypeError, IndexError):
+        pass
+    return _evaluate_points(func, points)
+
+
+def scale_to_length(values, length_func):
+    """Rescale every vector to length_func(norm); zero vectors stay zero like in manim"""
+    norms = np.linalg.norm(values, axis=1)
+    try:
+        lengths = np.broadcast_to(np.asarray(length_func(norms), dtype=float), norms.shape)
+    except (ValueError, TypeError):
+        lengths = np.array([length_func(norm) for norm in norms], dtype=float)
+    factors = np.divide(lengths, norms, out=np.zeros_like(norms), where=norms != 0)
+    return values * factors[:, None]
+
+
+def magnitude_rgbs(values, colors, min_value=0, max_value=2, color_scheme=None):
+    """Per-vector rgb along the colors list, driven by |value| (or color_scheme on the (N, 3) array)"""
+    rgbs = np.array([color_to_rgb(color) for color in colors])
+    scheme_values = color_scheme(values) if color_scheme else np.linalg.norm(values, axis=1)
+    alphas = (np.clip(scheme_values, min_value, max_value) - min_value) / (max_value - min_value)
+    alphas = alphas * (len(rgbs) - 1)
+    low = alphas.astype(int)
+    high = np.minimum(low + 1, len(rgbs) - 1)
+    return rgbs[low] + (rgbs[high] - rgbs[low]) * (alphas % 1)[:, None]
+
+
+def _line_points(starts, ends):
+    # Straight cubic bezier for every row: (N, 4, 3)
+    delta = (ends - starts) / 3
+    return np.stack([starts, starts + delta, ends - delta, ends], axis=1)
+
+
+def arrow_geometry(starts, vectors, tip_length=DEFAULT_ARROW_TIP_LENGTH, max_tip_length_to_length_ratio=0.25,
+                   stroke_width=6, max_stroke_width_to_length_ratio=5):
+    """Shaft points (N, 4, 3), tip triangle points (N, 12, 3) and stroke widths (N,) of Arrow(start, start + vector)"""
+    lengths = np.linalg.norm(vectors, axis=1)
+    units = np.divide(vectors, lengths[:, None], out=np.tile(RIGHT, (len(vectors), 1)), where=lengths[:, None] != 0)
+    tip_lengths = np.minimum(tip_length, max_tip_length_to_length_ratio * lengths)
+
+    # The tip triangle lies in the plane of the arrow and the horizontal perpendicular to it,
+    # like TipableVMobject.position_tip
+    sides = np.cross(units, OUT)
+    side_norms = np.linalg.norm(sides, axis=1)
+    sides = np.divide(sides, side_norms[:, None], out=np.tile(DOWN, (len(vectors), 1)), where=side_norms[:, None] > 1e-8)
+
+    ends = starts + vectors
+    bases = ends - units * tip_lengths[:, None]
+    half_widths = sides * (tip_lengths / 2)[:, None]
+    corner_1 = bases + half_widths
+    corner_2 = bases - half_widths
+    shafts = _line_points(starts, bases)
+    tips = np.concatenate([
+        _line_points(ends, corner_1), _line_points(corner_1, corner_2), _line_points(corner_2, ends),
+    ], axis=1)
+    stroke_widths = np.minimum(stroke_width, max_stroke_width_to_length_ratio * lengths)
+    return shafts, tips, stroke_widths
+
+
+def style_arrow(arrow, rgb, stroke_width, opacity=1.0):
+    """Write stroke/fill arrays of a shaft and its tip directly, skipping set_color's tree walk"""
+    tip = arrow.submobjects[0]
+    arrow.stroke_rgbas = np.array([[*rgb, opacity]])
+    arrow.fill_rgbas = np.array([[*rgb, 0.0]])
+    arrow.stroke_width = stroke_width
+    tip.stroke_rgbas = np.array([[*rgb, opacity]])
+    tip.fill_rgbas = np.array([[*rgb, opacity]])
+    tip.stroke_width = 0
+
+
+def make_arrow(shaft_points, tip_points):
+    arrow = VMobject()
+    tip = VMobject()
+    arrow.points = shaft_points
+    tip.points = tip_points
+    arrow.add(tip)
+    return arrow
+
+
+class GridArrowVectorField(VGroup):
+    """Drop-in for ArrowVectorField on a regular grid, built from (N, 3) arrays"""
+
+    def __init__(
+        self,
+        func,
+        color=None,
+        color_scheme=None,
+        min_color_scheme_value=0,
+        max_color_scheme_value=2,
+        colors=DEFAULT_SCALAR_FIELD_COLORS,
+        x_range=None,
+        y_range=None,
+        z_range=None,
+        three_dimensions=False,
+        length_func=lambda norm: 0.45 * sigmoid(norm),
+        opacity=1.0,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.func = func
+        self.length_func = length_func
+        self.opacity = opacity
+        self.sample_points = field_grid(x_range, y_range, z_range, three_dimensions)
+        self.values = evaluate_field(func, self.sample_points)
+        self.vectors = scale_to_length(self.values, length_func)
+        if color is not None:
+            self.rgbs = np.tile(color_to_rgb(color), (len(self.values), 1))
+        else:
+            self.rgbs = magnitude_rgbs(
+                self.values, colors, min_color_scheme_value, max_color_scheme_value, color_scheme,
+            )
+
+        shafts, tips, stroke_widths = arrow_geometry(self.sample_points, self.vectors)
+        for shaft_points, tip_points, rgb, stroke_width in zip(shafts, tips, self.rgbs, stroke_widths):
+            arrow = make_arrow(shaft_points, tip_points)
+            style_arrow(arrow, rgb, stroke_width, opacity)
+            self.add(arrow)
+
+
+def arrow_state(field):
+    """Starts (N, 3), vectors (N, 3) and colors (N, 4, 4) of a field's arrows as they are drawn now"""
+    arrows = field.submobjects
+    for arrow in arrows:
+        if len(arrow.points) != 4 or len(arrow.submobjects) != 1 or len(arrow.submobjects[0].points) != 12:
+            raise ValueError("FieldMorph needs fully drawn GridArrowVectorField arrows; use Transform instead")
+    starts = np.array([arrow.points[0] for arrow in arrows])
+    ends = np.array([arrow.submobjects[0].points[0] for arrow in arrows])
+    # Shaft stroke and fill, tip stroke and fill
+    colors = np.array([
+        [arrow.stroke_rgbas[0], arrow.fill_rgbas[0], arrow.submobjects[0].stroke_rgbas[0], arrow.submobjects[0].fill_rgbas[0]]
+        for arrow in arrows
+    ])
+    return starts, ends - starts, colors
+
+
+def _units(vectors):
+    lengths = np.linalg.norm(vectors, axis=1)
+    units = np.divide(vectors, lengths[:, None], out=np.zeros_like(vectors), where=lengths[:, None] != 0)
+    return units, lengths
+
+
+class FieldMorph(Animation):
+    """Transform between two fields on the same grid, interpolating their vector and color arrays"""
+
+    def __init__(self, field, target, **kwargs):
+        if len(field.submobjects) != len(target.submobjects):
+            raise ValueError(
+                f"FieldMorph needs fields with the same grid ({len(field.submobjects)} and "
+                f"{len(target.submobjects)} arrows); use Transform instead"
+            )
+        super().__init__(field, **kwargs)
+        self.target = target
+
+    def begin(self):
+        self.start_points, start_vectors, self.start_colors = arrow_state(self.mobject)
+        self.end_points, end_vectors, self.end_colors = arrow_state(self.target)
+        self.start_units, self.start_lengths = _units(start_vectors)
+        self.end_units, self.end_lengths = _units(end_vectors)
+
+        # Every arrow reads its points and colors from rows of these arrays, so a frame
+        # is a handful of array operations instead of one update per arrow
+        count = len(self.mobject.submobjects)
+        self.shafts = np.empty((count, 4, 3))
+        self.tips = np.empty((count, 12, 3))
+        self.colors = np.empty((count, 4, 4))
+        for index, arrow in enumerate(self.mobject.submobjects):
+            tip = arrow.submobjects[0]
+            arrow.points = self.shafts[index]
+            tip.points = self.tips[index]
+            arrow.stroke_rgbas = self.colors[index, 0:1]
+            arrow.fill_rgbas = self.colors[index, 1:2]
+            tip.stroke_rgbas = self.colors[index, 2:3]
+            tip.fill_rgbas = self.colors[index, 3:4]
+        self.stroke_widths = None
+        if self.suspend_mobject_updating:
+            self.mobject.suspend_updating()
+        self.interpolate(0)
+
+    def get_all_mobjects(self):
+        # No starting copy of the field: the start state is kept as arrays
+        return (self.mobject,)
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        # Directions turn and lengths change linearly, so arrows don't shrink halfway
+        # through like with a straight interpolation of their points
+        directions, _ = _units(self.start_units + (self.end_units - self.start_units) * alpha)
+        lengths = self.start_lengths + (self.end_lengths - self.start_lengths) * alpha
+        starts = self.start_points + (self.end_points - self.start_points) * alpha
+        shafts, tips, stroke_widths = arrow_geometry(starts, directions * lengths[:, None])
+        self.shafts[...] = shafts
+        self.tips[...] = tips
+        self.colors[...] = self.start_colors + (self.end_colors - self.start_colors) * alpha
+        if self.stroke_widths is None or not np.array_equal(stroke_widths, self.stroke_widths):
+            for arrow, stroke_width in zip(self.mobject.submobjects, stroke_widths):
+                arrow.stroke_width = stroke_width
+            self.stroke_widths = stroke_widths
+
+    def finish(self):
+        super().finish()
+        # The field now shows the target: later morphs and readers of its arrays see that
+        for name in ("func", "length_func", "sample_points", "values", "vectors", "rgbs"):
+            if hasattr(self.target, name):
+                value = getattr(self.target, name)
+                setattr(self.mobject, name, value.copy() if isinstance(value, np.ndarray) else value)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+# Render benchmark over the scenes of this folder.
+#
+# Every scene is rendered on its own, one after the other, at a fixed small size
+# (426x240, 15 fps, caching off) into media/benchmarks/media, with the timing
+# profile of profiling.py switched on (MANIM_PROFILE=timing). For each scene it
+# records:
+#   wall             seconds for the whole manim process
+#   construct        seconds of construct() outside play() calls
+#   tex              seconds spent building Tex/MathTex (LaTeX and SVG parsing)
+#   draw_ms          milliseconds of rasterization per frame
+#   encode_ms        milliseconds handing a frame to the encoder
+#   peak_rss_mb      peak resident memory of the manim process (Unix only)
+#   output_kb        size of the movie
+# Results go to media/benchmarks/<date-time>.json and are compared with the stored
+# baseline; a metric more than --threshold (default 15 %) above it is a regression
+# and makes the script exit with status 1. Nothing needs the network: TeX comes
+# from the local LaTeX install or the tex_cache.py store.
+#
+# Usage (from this folder):
+#   python benchmark.py --save-baseline        record the baseline
+#   python benchmark.py                        compare every scene against it
+#   python benchmark.py vector_resolve.py --scenes VectorResolution --repeat 3
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from render_all import HERE, find_scenes, job_key
+
+BENCH_DIR = HERE / "media" / "benchmarks"
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+RESOLUTION = "426,240"
+FRAME_RATE = 15
+# Differences below these are noise, whatever the ratio
+NOISE_FLOORS = {"wall": 0.5, "construct": 0.2, "tex": 0.2, "draw_ms": 0.5, "encode_ms": 0.5,
+                "peak_rss_mb": 20, "output_kb": 50}
+
+
+def run_measured(command, cwd, log_file, env):
+    """Return code and peak RSS in MB (None where os.wait4 is not available) of a command"""
+    with open(log_file, "w", encoding="utf-8") as log:
+        process = subprocess.Popen(command, cwd=cwd, stdout=log, stderr=subprocess.STDOUT, env=env)
+        if not hasattr(os, "wait4"):
+            return process.wait(), None
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in kB on Linux and in bytes on macOS
+    peak = usage.ru_maxrss / (1024 ** 2 if sys.platform == "darwin" else 1024)
+    return process.returncode, peak
+
+
+def benchmark(job, extra_args):
+    """Metrics of one render of a scene, or None if it failed"""
+    file, scene = job
+    media_dir = BENCH_DIR / "media"
+    log_dir = BENCH_DIR / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_file = log_dir / f"{file.stem}.{scene}.log"
+    env = {key: value for key, value in os.environ.items() if key not in ("MANIM_DRAFT", "MANIM_EXTRA_QUALITIES")}
+    env["MANIM_PROFILE"] = "timing"
+    command = [
+        sys.executable, "-m", "manim", "render", "-ql", "-r", RESOLUTION, "--frame_rate", str(FRAME_RATE),
+        "--disable_caching", "--media_dir", str(media_dir), *extra_args, file.name, scene,
+    ]
+    # A profile left by an earlier run must not pass for this run's
+    profile_file = media_dir / "profiles" / f"{scene}.json"
+    profile_file.unlink(missing_ok=True)
+    # Whole seconds: some filesystems store mtimes at that resolution
+    started = int(time.time())
+    start = time.perf_counter()
+    returncode, peak_rss = run_measured(command, file.parent, log_file, env)
+    wall = time.perf_counter() - start
+    if returncode != 0:
+        print(f"  {job_key(job)} FAILED, see {log_file}")
+        return None
+
+    if not profile_file.exists():
+        print(f"  {job_key(job)}: no profile written (does the scene call install_all()?)")
+        return None
+    profile = json.loads(profile_file.read_text(encoding="utf-8"))
+    plays = profile["plays"]
+    frames = max(1, profile["frames"])
+    movies = sorted(
+        (path for path in (media_dir / "videos" / file.stem).glob(f"*/{scene}.mp4") if path.stat().st_mtime >= started),
+        key=lambda path: path.stat().st_mtime,
+    )
+    return {
+        "wall": round(wall, 3),
+        "construct": round(profile["construct"]["wall"], 3),
+        "tex": round(profile["tex"], 3),
+        "draw_ms": round(1000 * sum(play["draw"] for play in plays) / frames, 3),
+        "encode_ms": round(1000 * sum(play["encode"] for play in plays) / frames, 3),
+        "frames": profile["frames"],
+        "peak_rss_mb": None if peak_rss is None else round(peak_rss, 1),
+        "output_kb": round(movies[-1].stat().st_size / 1024, 1) if movies else None,
+    }
+
+
+def best_of(runs):
+    """Per metric, the lowest value over repeated runs"""
+    runs = [run for run in runs if run is not None]
+    if not runs:
+        return None
+    return {key: min((run[key] for run in runs if run[key] is not None), default=None) for key in runs[0]}
+
+
+def regressions(results, baseline, threshold):
+    """(scene, metric, baseline, now) for every metric that got worse by more than threshold"""
+    found = []
+    for key, metrics in results.items():
+        reference = baseline.get(key)
+        if reference is None or metrics is None:
+            continue
+        for metric, floor in NOISE_FLOORS.items():
+            old, new = reference.get(metric), metrics.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > floor:
+                found.append((key, metric, old, new))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scene renders against a stored baseline.")
+    parser.add_argument("files", nargs="*", help="scene files (default: every .py file in this folder)")
+    parser.add_argument("--scenes", nargs="+", default=(), help="only these scene class names")
+    parser.add_argument("--repeat", type=int, default=1, help="renders per scene, best of (default: 1)")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative slowdown (default: 0.15)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    # Any other option is passed on to manim
+    args, extra_args = parser.parse_known_args()
+
+    files = [Path(file).resolve() for file in args.files] or sorted(HERE.glob("*.py"))
+    jobs = find_scenes(files)
+    if args.scenes:
+        jobs = [job for job in jobs if job[1] in args.scenes]
+    if not jobs:
+        sys.exit("No scenes found")
+
+    results = {}
+    print(f"Benchmarking {len(jobs)} scenes at {RESOLUTION.replace(',', 'x')}, {FRAME_RATE} fps")
+    for job in jobs:
+        metrics = best_of([benchmark(job, extra_args) for _ in range(max(1, args.repeat))])
+        results[job_key(job)] = metrics
+        if metrics is not None:
+            print(f"  {job_key(job):<60} {metrics['wall']:8.1f} s  {metrics['draw_ms']:7.1f} ms/frame"
+                  f"  TeX {metrics['tex']:6.1f} s  {metrics['peak_rss_mb'] or 0:7.0f} MB")
+
+    BENCH_DIR.mkdir(parents=True, exist_ok=True)
+    run_file = BENCH_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    run_file.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    found = regressions(results, baseline, args.threshold)
+    for key, metric, old, new in found:
+        print(f"REGRESSION {key} {metric}: {old} -> {new}")
+    failed = [key for key, metrics in results.items() if metrics is None]
+    if found or failed:
+        sys.exit(f"{len(found)} regression(s), {len(failed)} failed render(s)")
+    print(f"No regressions above {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# set_color_by_gradient and set_opacity as array writes.
+#
+# manim's set_color_by_gradient builds one ManimColor per submobject with
+# color_gradient() and then calls set_color on each, which walks that submobject's
+# family twice (fill, stroke) and builds a new rgba array per call; set_opacity
+# walks the whole family three times. Titles and labels are gradient-coloured all
+# over the scenes, some of them in updaters on every frame. With
+# install_bulk_styling() the gradient for all submobjects is computed as one
+# (N, 3) array and written into each one's existing fill/stroke rgba arrays in
+# place, and set_opacity writes the alpha column of every family member in one
+# pass. The result is the same colours and opacities as manim's.
+#
+# InstancedArrows keeps all its colours in one buffer and has its own, faster
+# versions of both (see instanced_arrows.py).
+
+from manim import VMobject
+
+from instanced_arrows import gradient_rgbs
+
+
+def _has_rgbas(mobject):
+    return isinstance(mobject, VMobject) and len(mobject.fill_rgbas) > 0 and len(mobject.stroke_rgbas) > 0
+
+
+def set_color_by_gradient(mobject, *colors):
+    """Colour the family members with points of mobject along colors; False if it can't be done in bulk"""
+    if len(colors) < 2:
+        return False
+    members = mobject.family_members_with_points()
+    if not members:
+        # Nothing to colour, as in manim
+        return True
+    if not all(_has_rgbas(member) for member in members):
+        return False
+    for member, rgb in zip(members, gradient_rgbs(colors, len(members))):
+        # Like update_rgbas_array: the rgb of every row changes, the alphas stay
+        member.fill_rgbas[:, :3] = rgb
+        member.stroke_rgbas[:, :3] = rgb
+    return True
+
+
+def set_opacity(mobject, opacity):
+    """VMobject.set_opacity for the whole family in one pass; False if it can't be done in bulk"""
+    family = mobject.get_family()
+    if not all(_has_rgbas(member) and len(member.background_stroke_rgbas) > 0 for member in family):
+        return False
+    for member in family:
+        member.fill_rgbas[:, 3] = opacity
+        member.stroke_rgbas[:, 3] = opacity
+        member.background_stroke_rgbas[:, 3] = opacity
+        member.fill_opacity = member.stroke_opacity = member.background_stroke_opacity = opacity
+    return True
+
+
+def install_bulk_styling():
+    """Patch VMobject to compute gradients and opacities with NumPy for the whole family"""
+    if getattr(VMobject.set_submobject_colors_by_gradient, "_bulk", False):
+        return
+    original_gradient = VMobject.set_submobject_colors_by_gradient
+    original_opacity = VMobject.set_opacity
+
+    def set_submobject_colors_by_gradient(self, *colors):
+        if not set_color_by_gradient(self, *colors):
+            original_gradient(self, *colors)
+        return self
+
+    def set_opacity_patched(self, opacity, family=True):
+        if not family or not set_opacity(self, opacity):
+            original_opacity(self, opacity, family)
+        return self
+
+    set_submobject_colors_by_gradient._bulk = True
+    VMobject.set_submobject_colors_by_gradient = set_submobject_colors_by_gradient
+    VMobject.set_opacity = set_opacity_patched
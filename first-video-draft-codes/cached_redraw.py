@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# always_redraw that only rebuilds when something it reads has changed.
+#
+# manim's always_redraw calls its function and become()s the result on every
+# frame. The axis labels in the 3D scenes,
+#   always_redraw(lambda: MathTex("x").next_to(axes.x_axis.get_end(), RIGHT, buff=0.2).rotate(PI/2, axis=RIGHT))
+# read nothing but `axes`, which never moves, so each frame builds a MathTex that is
+# identical to the previous one. This version fingerprints the mobjects the closure
+# refers to (points and colours of their whole family, so ValueTrackers count too)
+# and skips the call when neither they nor the label itself changed since the last
+# build. Labels that follow a moving vector or a tracker still redraw every frame.
+#
+# Closures that capture anything it cannot fingerprint (functions, the scene, lists
+# of arbitrary objects) fall back to redrawing every frame, exactly like manim.
+# Scenes use it by importing it after `from manim import *`:
+#   from cached_redraw import always_redraw
+
+import hashlib
+import numbers
+
+import numpy as np
+from manim import Mobject
+
+# Immutable values that can be captured without ever changing the result
+_CONSTANT_TYPES = (str, bytes, numbers.Number, type(None), type)
+
+
+class Uncacheable(Exception):
+    pass
+
+
+def _update_with_mobject(digest, mob):
+    for member in mob.get_family():
+        for array in (member.points, getattr(member, "stroke_rgbas", None), getattr(member, "fill_rgbas", None)):
+            if array is not None:
+                digest.update(np.ascontiguousarray(array).data)
+        digest.update(b"|")
+
+
+def _update_with_value(digest, value):
+    if isinstance(value, Mobject):
+        _update_with_mobject(digest, value)
+    elif isinstance(value, np.ndarray):
+        digest.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (tuple, frozenset)):
+        for item in value:
+            _update_with_value(digest, item)
+    elif isinstance(value, _CONSTANT_TYPES):
+        digest.update(repr(value).encode())
+    else:
+        raise Uncacheable(type(value).__name__)
+
+
+def dependencies(func):
+    """Values a function reads that are not fixed when it is defined: closure cells and global mobjects"""
+    values = []
+    for cell in func.__closure__ or ():
+        try:
+            values.append(cell.cell_contents)
+        except ValueError:
+            # Cell not filled in yet (the variable is assigned after the lambda)
+            raise Uncacheable("empty cell")
+    for name in func.__code__.co_names:
+        value = func.__globals__.get(name)
+        if isinstance(value, Mobject):
+            values.append(value)
+    return values
+
+
+def fingerprint(values, mob=None):
+    """Digest of every dependency plus the current state of the redrawn mobject itself"""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _update_with_value(digest, value)
+    if mob is not None:
+        digest.update(b"#")
+        _update_with_mobject(digest, mob)
+    return digest.digest()
+
+
+def always_redraw(func):
+    """manim's always_redraw, reusing the previous result while the function's inputs are unchanged"""
+    mob = func()
+    try:
+        fingerprint(dependencies(func))
+    except Uncacheable:
+        mob.add_updater(lambda _: mob.become(func()))
+        return mob
+
+    # The label itself is part of the key too: if an animation restyled it, rebuild
+    # it just like manim would on the next frame
+    state = {"key": fingerprint(dependencies(func), mob)}
+
+    def redraw(_):
+        try:
+            values = dependencies(func)
+            if fingerprint(values, mob) == state["key"]:
+                return
+            mob.become(func())
+            state["key"] = fingerprint(values, mob)
+        except Uncacheable:
+            # A captured variable was rebound to something that cannot be fingerprinted
+            mob.become(func())
+            state["key"] = None
+
+    mob.add_updater(redraw)
+    return mob
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+# Faster frames while only the 3D camera moves.
+#
+# During move_camera() orbits and waits with ambient rotation nothing but the
+# camera changes, yet ThreeDCamera walks every mobject per frame: it projects each
+# one's points separately, recomputes its shading and gradient, splits it into
+# subpaths and sorts all of them by depth with a Python key function.
+#
+# install_camera_fast_path() recognises those plays (every animation is a Wait or
+# animates a camera tracker, and the scene itself has no updaters). On their first
+# frame the static part of the scene is packed once: all points in one array, with
+# each mobject's subpath layout, shaded colours, stroke widths, gradient end points
+# and depth reference point. Every frame then projects all points and gradient ends
+# with one project_points() call, computes every depth key with one matrix product
+# and sorts with one argsort; only the cairo drawing calls remain per mobject.
+# Mobjects with updaters (always_redraw labels, ...) and fixed-orientation ones are
+# drawn the usual way each frame, in their place in the depth order. An updater can
+# also move or restyle other mobjects, so every frame the points and colours of the
+# packed mobjects are compared (as packed arrays) with what was packed; a mobject that
+# changed is drawn the usual way for the rest of the play. Anything the fast path
+# doesn't handle (images, point clouds, background images, z_index) falls back to
+# manim's own capture.
+
+import functools
+
+import numpy as np
+from manim import Mobject, ThreeDScene, VMobject, Wait
+from manim.camera.three_d_camera import ThreeDCamera
+from manim.constants import LINE_JOIN_MAP, LineJointType
+
+
+def is_camera_only(scene):
+    """True if the current play can only change the camera"""
+    camera = scene.renderer.camera
+    camera_mobjects = [*camera.get_value_trackers(), camera._frame_center]
+    return not scene.updaters and all(
+        isinstance(animation, Wait) or any(animation.mobject is mob for mob in camera_mobjects)
+        for animation in scene.animations or ()
+    )
+
+
+def drawable(camera, mob):
+    """True for VMobjects the fast path can draw, None for mobjects manim never draws, else False"""
+    if camera.type_or_raise(mob) is Mobject:
+        # ValueTrackers and other plain Mobjects
+        return None
+    return isinstance(mob, VMobject) and not mob.get_background_image() and mob.z_index == 0
+
+
+def subpath_layout(vmobject, points):
+    """(start, end, closed) of every subpath, as VMobject.gen_subpaths_from_points_2d splits them"""
+    count = len(points) - len(points) % 4
+    if count == 0:
+        return []
+    starts = np.arange(4, count, 4)
+    gaps = ~np.all(np.isclose(points[starts - 1], points[starts], atol=vmobject.tolerance_for_point_equality), axis=1)
+    splits = [0, *starts[gaps].tolist(), count]
+    return [
+        (start, end, vmobject.consider_points_equals_2d(points[start], points[end - 1]))
+        for start, end in zip(splits[:-1], splits[1:])
+        if end - start >= 4
+    ]
+
+
+def member_state(members):
+    """Points, raw rgbas and stroke widths of the members as packed arrays"""
+    if not members:
+        return np.zeros((0, 3)), np.zeros((0, 4)), np.zeros((0, 2))
+    points = np.concatenate([member.points for member in members])
+    rgbas = np.concatenate([
+        rgbas for member in members
+        for rgbas in (member.fill_rgbas, member.stroke_rgbas, member.background_stroke_rgbas)
+    ])
+    widths = np.array([(member.stroke_width, member.background_stroke_width) for member in members], dtype=float)
+    return points, rgbas, widths
+
+
+def _same(a, b):
+    return a.shape == b.shape and np.array_equal(a, b)
+
+
+class StaticLayer:
+    """Everything needed to redraw the non-updating VMobjects of a scene from one packed array"""
+
+    def __init__(self, camera, members):
+        self.members = members
+        lengths = [len(member.points) for member in members]
+        self.bounds = np.concatenate([[0], np.cumsum(lengths)]).astype(int)
+        self.points, self.rgbas, self.widths = member_state(members)
+        # Copies: the members' arrays may be changed in place later
+        self.points, self.rgbas = self.points.copy(), self.rgbas.copy()
+        rgba_lengths = [
+            len(member.fill_rgbas) + len(member.stroke_rgbas) + len(member.background_stroke_rgbas)
+            for member in members
+        ]
+        self.rgba_bounds = np.concatenate([[0], np.cumsum(rgba_lengths)]).astype(int)
+        self.fixed_in_frame = np.zeros(len(self.points), dtype=bool)
+        self.layouts = []
+        self.styles = []
+        gradient_ends = []
+        for i, member in enumerate(members):
+            start, end = self.bounds[i], self.bounds[i + 1]
+            if member in camera.fixed_in_frame_mobjects:
+                self.fixed_in_frame[start:end] = True
+            self.layouts.append(subpath_layout(member, member.points))
+            styles = []
+            for rgbas, width in (
+                (camera.get_stroke_rgbas(member, background=True), member.get_stroke_width(True)),
+                (camera.get_fill_rgbas(member), None),
+                (camera.get_stroke_rgbas(member), member.get_stroke_width(False)),
+            ):
+                gradient = None
+                if len(rgbas) > 1:
+                    gradient = len(gradient_ends)
+                    gradient_ends.extend(member.get_gradient_start_and_end_points())
+                styles.append((np.array(rgbas), width, gradient))
+            self.styles.append(styles)
+        self.gradient_ends = np.array(gradient_ends).reshape(-1, 3)
+        self.gradient_fixed = np.zeros(len(self.gradient_ends), dtype=bool)
+        for i, member in enumerate(members):
+            if member in camera.fixed_in_frame_mobjects:
+                for _, _, gradient in self.styles[i]:
+                    if gradient is not None:
+                        self.gradient_fixed[gradient:gradient + 2] = True
+        self.z_points = np.array([member.get_z_index_reference_point() for member in members]).reshape(-1, 3)
+        self.shaded = np.array([bool(getattr(member, "shade_in_3d", False)) for member in members], dtype=bool)
+
+    def changed_members(self):
+        """The members whose points or style differ from when they were packed"""
+        points, rgbas, widths = member_state(self.members)
+        if _same(points, self.points) and _same(rgbas, self.rgbas) and _same(widths, self.widths):
+            return []
+        changed = []
+        for i, member in enumerate(self.members):
+            member_points, member_rgbas, member_widths = member_state([member])
+            if not (
+                _same(member_points, self.points[self.bounds[i]:self.bounds[i + 1]])
+                and _same(member_rgbas, self.rgbas[self.rgba_bounds[i]:self.rgba_bounds[i + 1]])
+                and _same(member_widths[0], self.widths[i])
+            ):
+                changed.append(member)
+        return changed
+
+    def project(self, camera, points, fixed):
+        projected = camera.project_points(points) if len(points) else points.copy()
+        projected[fixed] = points[fixed]
+        return projected
+
+    def depth_keys(self, camera):
+        keys = np.full(len(self.members), np.inf)
+        if self.shaded.any():
+            keys[self.shaded] = (self.z_points[self.shaded] @ camera.get_rotation_matrix().T)[:, 2]
+        return keys
+
+
+def _set_source(ctx, rgbas, ends):
+    if len(rgbas) == 1:
+        ctx.set_source_rgba(*rgbas[0][2::-1], rgbas[0][3])
+        return
+    import cairo
+
+    pattern = cairo.LinearGradient(*ends[0][:2], *ends[1][:2])
+    step = 1.0 / (len(rgbas) - 1)
+    for rgba, offset in zip(rgbas, np.arange(0, 1 + step, step)):
+        pattern.add_color_stop_rgba(offset, *rgba[2::-1], rgba[3])
+    ctx.set_source(pattern)
+
+
+def draw_static(camera, ctx, layer, i, points, ends):
+    """display_vectorized for packed member i, from already projected points"""
+    member = layer.members[i]
+    xy = points[layer.bounds[i]:layer.bounds[i + 1], :2].tolist()
+    if not xy:
+        return
+    ctx.new_path()
+    for start, end, closed in layer.layouts[i]:
+        ctx.new_sub_path()
+        ctx.move_to(*xy[start])
+        for k in range(start, end, 4):
+            ctx.curve_to(*xy[k + 1], *xy[k + 2], *xy[k + 3])
+        if closed:
+            ctx.close_path()
+    background_stroke, fill, stroke = layer.styles[i]
+    for rgbas, width, gradient in (background_stroke, fill, stroke):
+        gradient_ends = ends[gradient:gradient + 2] if gradient is not None else None
+        if width is None:
+            _set_source(ctx, rgbas, gradient_ends)
+            ctx.fill_preserve()
+        elif width != 0:
+            _set_source(ctx, rgbas, gradient_ends)
+            ctx.set_line_width(width * camera.cairo_line_width_multiple)
+            if member.joint_type != LineJointType.AUTO:
+                ctx.set_line_join(LINE_JOIN_MAP[member.joint_type])
+            ctx.stroke_preserve()
+
+
+def split_scene(camera, mobjects, moving=()):
+    """(order, static members) for a camera-only play, or None if the fast path can't draw it.
+
+    order lists, in family order, indices into the static members and the roots whose
+    families may change every frame (mobjects with updaters, fixed-orientation mobjects
+    and the ids in moving: mobjects other updaters were seen changing)."""
+    order = []
+    static = []
+
+    def visit(mob):
+        if mob.updaters or mob in camera.fixed_orientation_mobjects or id(mob) in moving:
+            order.append(mob)
+            return True
+        if len(mob.points) > 0:
+            kind = drawable(camera, mob)
+            if kind is False:
+                return False
+            if kind:
+                order.append(len(static))
+                static.append(mob)
+        return all(visit(submob) for submob in mob.submobjects)
+
+    if not all(visit(mob) for mob in mobjects):
+        return None
+    # A mobject reached twice would be drawn twice
+    if len({id(mob) for mob in static}) != len(static):
+        return None
+    return order, static
+
+
+def capture_fast(camera, mobjects):
+    """Draw the frame from the packed static layer; False if this frame needs manim's capture"""
+    # The static frame of a play is captured with other mobjects than its moving frames
+    key = tuple(id(mob) for mob in mobjects)
+    if camera._fast_key != key:
+        camera._fast_key = key
+        camera._fast_split = split_scene(camera, mobjects, camera._fast_moving)
+        if camera._fast_split is not None:
+            camera._fast_layer = StaticLayer(camera, camera._fast_split[1])
+    if camera._fast_split is None:
+        return False
+    changed = camera._fast_layer.changed_members()
+    if changed:
+        # Another mobject's updater moved or restyled these: draw them the usual way from now on
+        camera._fast_moving.update(id(member) for member in changed)
+        camera._fast_split = split_scene(camera, mobjects, camera._fast_moving)
+        if camera._fast_split is None:
+            return False
+        camera._fast_layer = StaticLayer(camera, camera._fast_split[1])
+    order, _ = camera._fast_split
+    layer = camera._fast_layer
+
+    dynamic = []
+    for entry in order:
+        if not isinstance(entry, int):
+            members = []
+            for member in entry.family_members_with_points():
+                kind = drawable(camera, member)
+                if kind is False:
+                    return False
+                if kind:
+                    members.append(member)
+            dynamic.append(members)
+
+    points = layer.project(camera, layer.points, layer.fixed_in_frame)
+    ends = layer.project(camera, layer.gradient_ends, layer.gradient_fixed)
+    static_keys = layer.depth_keys(camera)
+
+    # Same result as ThreeDCamera.get_mobjects_to_display: a stable sort by depth in family order
+    keys, items = [], []
+    dynamic_members = iter(dynamic)
+    for entry in order:
+        if isinstance(entry, int):
+            keys.append(static_keys[entry])
+            items.append(entry)
+            continue
+        for member in next(dynamic_members):
+            if getattr(member, "shade_in_3d", False):
+                keys.append(np.dot(member.get_z_index_reference_point(), camera.get_rotation_matrix().T)[2])
+            else:
+                keys.append(np.inf)
+            items.append(member)
+
+    ctx = camera.get_cairo_context(camera.pixel_array)
+    for index in np.argsort(np.array(keys), kind="stable"):
+        item = items[index]
+        if isinstance(item, int):
+            draw_static(camera, ctx, layer, item, points, ends)
+        else:
+            camera.display_vectorized(item, ctx)
+    return True
+
+
+_installed = False
+
+
+def install_camera_fast_path():
+    """Patch ThreeDCamera/ThreeDScene so camera-only plays render from a packed static layer"""
+    # A module flag, not a mark on the patched method: fixed_overlay.py wraps the same methods
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    original_capture = ThreeDCamera.capture_mobjects
+    original_begin = ThreeDScene.begin_animations
+
+    def begin_animations(self):
+        original_begin(self)
+        camera = self.renderer.camera
+        camera._camera_only = is_camera_only(self)
+        camera._fast_key = None
+        camera._fast_split = None
+        camera._fast_layer = None
+        camera._fast_moving = set()
+
+    @functools.wraps(original_capture)
+    def capture_mobjects(self, mobjects, **kwargs):
+        if getattr(self, "_camera_only", False) and not kwargs.get("excluded_mobjects"):
+            self.reset_rotation_matrix()
+            if capture_fast(self, list(mobjects)):
+                return
+        original_capture(self, mobjects, **kwargs)
+
+    ThreeDScene.begin_animations = begin_animations
+    ThreeDCamera.capture_mobjects = capture_mobjects
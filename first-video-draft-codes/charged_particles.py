@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+
+# Many charged particles pushed through E and B fields at once.
+#
+# The parabolic path scene moves one Charge along a hand-written closed form
+# (0.5 * a * t**2). simulate() integrates any number of particles together: their
+# positions and velocities are (N, 3) arrays and every step is one Boris push for
+# all of them (half electric kick, magnetic rotation, half kick, drift), so there is
+# no Python loop over particles. The fields are constant vectors or functions of
+# position written like the vector field functions of the scenes
+# (`lambda pos: np.array([-pos[1], pos[0], pos[2]])`, evaluated on a (3, N) array).
+#
+# The step is fixed (dt) or, with adaptive=True, shrunk so that no particle moves
+# more than max_displacement and none turns by more than max_rotation radians in a
+# step. All particles share each step, so they stay on one time grid. In a uniform
+# E field the Boris positions are exact, so the paths match the closed forms.
+#
+# The result exposes the motion as mobjects driven by a time ValueTracker:
+#
+#   trajectories = simulate(starts, velocities, q_over_m, E=RIGHT * 0.4, duration=5)
+#   time = ValueTracker(0)
+#   self.add(ParticleTrails(trajectories, time), ParticleSwarm(trajectories, time))
+#   self.play(time.animate.set_value(5), run_time=4, rate_func=linear)
+#
+# ParticleSwarm draws every particle of one colour as a single VMobject (one dot per
+# subpath) and ParticleTrails the paths travelled so far; trajectories.path(i) is a
+# plain VMobject for MoveAlongPath, and trajectories.follow(charge, i, time) pins an
+# existing mobject (e.g. a manim_physics Charge) to particle i.
+
+import numpy as np
+from manim import *
+
+from batched_fields import evaluate_field
+
+
+def field_values(field, positions):
+    """(N, 3) field at positions, from None, a constant vector or a function of position"""
+    if field is None:
+        return np.zeros_like(positions)
+    if callable(field):
+        return evaluate_field(field, positions)
+    return np.broadcast_to(np.asarray(field, dtype=float), positions.shape)
+
+
+def lorentz_acceleration(velocities, q_over_m, E, B):
+    return q_over_m[:, None] * (E + np.cross(velocities, B))
+
+
+def boris_push(positions, velocities, q_over_m, E, B, dt):
+    """One leapfrog step: velocities go from t - dt/2 to t + dt/2, positions from t to t + dt"""
+    half = (q_over_m * dt / 2)[:, None]
+    v_minus = velocities + half * E
+    t = half * B
+    s = 2 * t / (1 + np.sum(t * t, axis=1, keepdims=True))
+    v_prime = v_minus + np.cross(v_minus, t)
+    v_plus = v_minus + np.cross(v_prime, s)
+    new_velocities = v_plus + half * E
+    return positions + new_velocities * dt, new_velocities
+
+
+def adaptive_step(velocities, accelerations, q_over_m, B, dt, max_displacement, max_rotation):
+    """Largest step <= dt that keeps every particle's displacement and gyration angle small"""
+    steps = [dt]
+    speed = np.max(np.linalg.norm(velocities, axis=1), initial=0)
+    if speed > 0:
+        steps.append(max_displacement / speed)
+    acceleration = np.max(np.linalg.norm(accelerations, axis=1), initial=0)
+    if acceleration > 0:
+        steps.append(np.sqrt(2 * max_displacement / acceleration))
+    gyration = np.max(np.abs(q_over_m) * np.linalg.norm(B, axis=1), initial=0)
+    if gyration > 0:
+        steps.append(max_rotation / gyration)
+    return min(steps)
+
+
+class Trajectories:
+    """Sampled motion of N particles: times (T,), positions and velocities (T, N, 3)"""
+
+    def __init__(self, times, positions, velocities, q_over_m):
+        self.times = times
+        self.positions = positions
+        self.velocities = velocities
+        self.q_over_m = q_over_m
+
+    @property
+    def duration(self):
+        return self.times[-1]
+
+    def at(self, time, values=None):
+        """(N, 3) positions (or other per-sample values) at a time, interpolated linearly"""
+        values = self.positions if values is None else values
+        time = np.clip(time, self.times[0], self.times[-1])
+        index = np.clip(np.searchsorted(self.times, time, side="right") - 1, 0, len(self.times) - 2)
+        span = self.times[index + 1] - self.times[index]
+        alpha = (time - self.times[index]) / span if span > 0 else 0.0
+        return values[index] + (values[index + 1] - values[index]) * alpha
+
+    def resample(self, times):
+        """(len(times), N, 3) positions at the given times, all particles and times at once"""
+        times = np.clip(np.asarray(times, dtype=float), self.times[0], self.times[-1])
+        index = np.clip(np.searchsorted(self.times, times, side="right") - 1, 0, len(self.times) - 2)
+        spans = self.times[index + 1] - self.times[index]
+        alphas = np.divide(times - self.times[index], spans, out=np.zeros_like(times), where=spans > 0)
+        return self.positions[index] + (self.positions[index + 1] - self.positions[index]) * alphas[:, None, None]
+
+    def path(self, index, resolution=60, **kwargs):
+        """VMobject through particle index's positions, sampled `resolution` times per second"""
+        samples = self.resample(sample_times(self.duration, resolution))[:, index]
+        return VMobject(**kwargs).set_points_as_corners(samples)
+
+    def follow(self, mobject, index, time):
+        """Keep mobject centred on particle index at the time held by a ValueTracker"""
+        mobject.add_updater(lambda mob: mob.move_to(self.at(time.get_value())[index]), call_updater=True)
+        return mobject
+
+
+def sample_times(duration, resolution):
+    return np.linspace(0, duration, max(2, int(np.ceil(duration * resolution)) + 1))
+
+
+def simulate(positions, velocities, q_over_m, E=None, B=None, duration=1.0, dt=1 / 240, adaptive=False,
+             max_displacement=0.02, max_rotation=0.1, min_dt=1e-5):
+    """Integrate all particles together with the Boris pusher and return their Trajectories"""
+    positions = np.array(positions, dtype=float).reshape(-1, 3)
+    velocities = np.array(velocities, dtype=float).reshape(-1, 3)
+    velocities = np.broadcast_to(velocities, positions.shape).copy()
+    q_over_m = np.broadcast_to(np.asarray(q_over_m, dtype=float), len(positions)).copy()
+
+    E_now, B_now = field_values(E, positions), field_values(B, positions)
+    accelerations = lorentz_acceleration(velocities, q_over_m, E_now, B_now)
+    step = dt
+    if adaptive:
+        step = max(min_dt, adaptive_step(velocities, accelerations, q_over_m, B_now, dt, max_displacement, max_rotation))
+    # Leapfrog velocities live half a step behind the positions
+    staggered = velocities - accelerations * step / 2
+
+    times, samples, sample_velocities = [0.0], [positions], [velocities]
+    time = 0.0
+    while time < duration - 1e-12:
+        new_step = min(step, duration - time)
+        if adaptive:
+            accelerations = lorentz_acceleration(staggered, q_over_m, E_now, B_now)
+            new_step = min(duration - time, max(min_dt, adaptive_step(
+                staggered, accelerations, q_over_m, B_now, dt, max_displacement, max_rotation,
+            )))
+        if new_step != step:
+            # Re-stagger the velocities for the new step length
+            staggered = staggered + lorentz_acceleration(staggered, q_over_m, E_now, B_now) * (step - new_step) / 2
+            step = new_step
+        new_positions, new_staggered = boris_push(positions, staggered, q_over_m, E_now, B_now, step)
+        positions, time = new_positions, time + step
+        times.append(time)
+        samples.append(positions)
+        sample_velocities.append(new_staggered)
+        staggered = new_staggered
+        E_now, B_now = field_values(E, positions), field_values(B, positions)
+
+    velocities = np.array(sample_velocities)
+    # Velocity at each sample: mean of the half steps around it (the first one is the
+    # initial velocity, the last one stays half a step behind)
+    velocities[1:-1] = (velocities[1:-1] + velocities[2:]) / 2
+    return Trajectories(np.array(times), np.array(samples), velocities, q_over_m)
+
+
+def particle_colors(trajectories, colors=None):
+    """{colour: particle indices}; by default positive charges red and negative ones blue"""
+    if colors is None:
+        colors = [RED if q_over_m >= 0 else BLUE for q_over_m in trajectories.q_over_m]
+    elif isinstance(colors, (str, ManimColor)):
+        colors = [colors] * len(trajectories.q_over_m)
+    groups = {}
+    for index, color in enumerate(colors):
+        groups.setdefault(ManimColor(color).to_hex(), []).append(index)
+    return {color: np.array(indices) for color, indices in groups.items()}
+
+
+class ParticleSwarm(VGroup):
+    """Every particle as a dot at the time of a ValueTracker; one VMobject per colour"""
+
+    def __init__(self, trajectories, time, radius=0.05, colors=None, **kwargs):
+        super().__init__(**kwargs)
+        self.trajectories = trajectories
+        self.time = time
+        self.dot_points = Circle(radius=radius).points
+        self.indices = []
+        for color, indices in particle_colors(trajectories, colors).items():
+            self.add(VMobject().set_fill(color, opacity=1).set_stroke(width=0))
+            self.indices.append(indices)
+        self.add_updater(lambda swarm: swarm.move_to_time(swarm.time.get_value()), call_updater=True)
+
+    def move_to_time(self, time):
+        positions = self.trajectories.at(time)
+        for dots, indices in zip(self.submobjects, self.indices):
+            dots.points = (positions[indices][:, None, :] + self.dot_points[None]).reshape(-1, 3)
+        return self
+
+
+def polyline_points(samples):
+    """Bezier points of straight segments through (n, k, 3) samples: n subpaths of k - 1 segments"""
+    starts, ends = samples[:, :-1], samples[:, 1:]
+    delta = (ends - starts) / 3
+    return np.stack([starts, starts + delta, ends - delta, ends], axis=2).reshape(-1, 3)
+
+
+class ParticleTrails(VGroup):
+    """The path every particle has travelled up to the time of a ValueTracker (the last trail_time seconds if given)"""
+
+    def __init__(self, trajectories, time, resolution=30, trail_time=None, colors=None, stroke_width=2,
+                 stroke_opacity=0.6, **kwargs):
+        super().__init__(**kwargs)
+        self.trajectories = trajectories
+        self.time = time
+        self.trail_time = trail_time
+        self.sample_times = sample_times(trajectories.duration, resolution)
+        self.samples = trajectories.resample(self.sample_times)
+        self.indices = []
+        for color, indices in particle_colors(trajectories, colors).items():
+            self.add(VMobject().set_stroke(color, width=stroke_width, opacity=stroke_opacity).set_fill(opacity=0))
+            self.indices.append(indices)
+        self.add_updater(lambda trails: trails.move_to_time(trails.time.get_value()), call_updater=True)
+
+    def move_to_time(self, time):
+        end = np.searchsorted(self.sample_times, time, side="right")
+        start = 0 if self.trail_time is None else np.searchsorted(self.sample_times, time - self.trail_time)
+        head = self.trajectories.at(time)
+        for trail, indices in zip(self.submobjects, self.indices):
+            samples = np.concatenate([self.samples[start:end, indices], head[None, indices]])
+            if len(samples) < 2:
+                trail.points = np.zeros((0, 3))
+                continue
+            trail.points = polyline_points(samples.transpose(1, 0, 2))
+        return self
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+# Named checkpoints inside construct(), and resuming a render from one.
+#
+# A scene marks where an act starts:
+#   checkpoint(self, "act2")
+# On a full render this saves the movie of everything before the mark (joined from
+# the partial movie files, no re-encoding) and the index of the next play() call,
+# in media/videos/<file>/<quality>/checkpoints/. After editing only later acts:
+#   python checkpoints.py uniform-field.py UniformElectricField3D act2 -q h
+# renders from the mark on with `manim -n <index>`: construct() still runs, but
+# every call before the mark is skipped without drawing a frame (camera, ambient
+# rotation and updaters are advanced by the skipped time, so the scene reaches the
+# mark in the state it had). The saved movie and the new part are joined into the
+# usual <Scene>.mp4.
+#
+# The mobjects themselves are not written to disk: their updaters are closures over
+# construct()'s locals and cannot be pickled. Replaying with rendering skipped is
+# cheap in comparison. A checkpoint also stores a digest of everything in the scene
+# file except the rest of construct() after the mark (helpers defined below it
+# included), and resuming refuses to use a saved movie when any of that changed.
+
+import argparse
+import ast
+import hashlib
+import inspect
+import json
+import sys
+from pathlib import Path
+
+CHECKPOINT_DIR = "checkpoints"
+
+
+def source_digest(file_name, line_number):
+    """Digest of a file's text without the given (1-based) line and the rest of the function around it"""
+    text = Path(file_name).read_text(encoding="utf-8")
+    lines = text.splitlines()
+    enclosing = [
+        node for node in ast.walk(ast.parse(text))
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.lineno < line_number <= node.end_lineno
+    ]
+    # Innermost function around the mark: construct(), or a helper it calls checkpoint() from
+    end = max(enclosing, key=lambda node: node.lineno).end_lineno if enclosing else line_number
+    return hashlib.sha256("\n".join(lines[:line_number - 1] + lines[end:]).encode()).hexdigest()
+
+
+def checkpoint(scene, name):
+    """Mark the start of a named act; a full render saves everything before it for resuming"""
+    renderer = scene.renderer
+    file_writer = getattr(renderer, "file_writer", None)
+    movie_file_path = getattr(file_writer, "movie_file_path", None)
+    if movie_file_path is None:
+        # Dry runs and still images have nothing to resume from
+        return
+    partial_files = list(file_writer.partial_movie_files)
+    if None in partial_files:
+        # Part of this render was skipped (-n, or a resume); its movie is not the full prefix
+        return
+
+    caller = inspect.stack()[1]
+    checkpoint_dir = Path(movie_file_path).parent / CHECKPOINT_DIR
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    scene_name = type(scene).__name__
+    prefix_file = checkpoint_dir / f"{scene_name}.{name}.mp4"
+    if partial_files:
+        # Imported here: render_split pulls in the render driver, which scenes don't need
+        from render_split import concatenate
+        concatenate([Path(path) for path in partial_files], prefix_file)
+    elif prefix_file.exists():
+        prefix_file.unlink()
+
+    index_file = checkpoint_dir / f"{scene_name}.json"
+    index = json.loads(index_file.read_text(encoding="utf-8")) if index_file.exists() else {}
+    index[name] = {
+        "play": renderer.num_plays,
+        "time": round(renderer.time, 3),
+        "line": caller.lineno,
+        "source": source_digest(caller.filename, caller.lineno),
+        "movie": prefix_file.name if partial_files else None,
+    }
+    index_file.write_text(json.dumps(index, indent=2), encoding="utf-8")
+
+
+def video_dir(file, quality_flag):
+    from manim.constants import QUALITIES
+
+    quality = next(quality for quality in QUALITIES.values() if quality["flag"] == quality_flag)
+    return file.parent / "media" / "videos" / file.stem / f"{quality['pixel_height']}p{quality['frame_rate']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a scene from a named checkpoint on.")
+    parser.add_argument("file", help="scene file, e.g. uniform-field.py")
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("name", help="checkpoint name, e.g. act2")
+    parser.add_argument("-q", "--quality", default="h", choices="lmhpk", help="manim quality flag (default: h)")
+    # Any other option (e.g. --disable_caching) is passed on to manim
+    args, extra_args = parser.parse_known_args()
+
+    from render_all import render
+    from render_split import concatenate
+
+    file = Path(args.file).resolve()
+    checkpoint_dir = video_dir(file, args.quality) / CHECKPOINT_DIR
+    index_file = checkpoint_dir / f"{args.scene}.json"
+    index = json.loads(index_file.read_text(encoding="utf-8")) if index_file.exists() else {}
+    if args.name not in index:
+        sys.exit(f"No checkpoint {args.name!r} for {args.scene} at -q{args.quality}; render the whole scene once first")
+    mark = index[args.name]
+    if source_digest(file, mark["line"]) != mark["source"]:
+        sys.exit(f"{file.name} changed before checkpoint {args.name!r}; render the whole scene again")
+
+    print(f"{args.scene}: resuming at {args.name!r} (animation {mark['play']}, {mark['time']} s in)")
+    tail_name = f"{args.scene}_from_{args.name}"
+    seconds, returncode, log_file = render(
+        (file, args.scene), args.quality, ["-n", str(mark["play"]), "-o", tail_name, *extra_args],
+        log_name=f"{file.stem}.{tail_name}",
+    )
+    if returncode != 0:
+        sys.exit(f"Render failed, see {log_file}")
+
+    tail_file = checkpoint_dir.parent / f"{tail_name}.mp4"
+    output_file = checkpoint_dir.parent / f"{args.scene}.mp4"
+    parts = [checkpoint_dir / mark["movie"]] if mark["movie"] else []
+    concatenate(parts + [tail_file], output_file)
+    tail_file.unlink()
+    print(f"Rendered from {args.name!r} in {seconds:.1f} s: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
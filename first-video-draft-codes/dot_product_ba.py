@@ -2,9 +2,14 @@
 
 from manim import *  # 0.18.0
 import numpy as np
+from render_setup import install_all
+from cached_redraw import always_redraw
+from transform_updaters import add_transform_updater, orbit, rotation
 
 # Set background color
 config.background_color = ManimColor("#030303")
+# Render speed-ups and tools shared by every scene (see render_setup.py)
+install_all()
 
 class VectorDotProduct(Scene):
     def construct(self):
@@ -106,23 +111,16 @@ class VectorDotProduct(Scene):
         # Add the initial projections
         self.add(proj_b_y, perp_line_y)
         self.play(Write(math_text), Write (component_text), run_time=1.0, rate_func=smooth)
-        # Copy the vectors for smooth updates
-        vector_b_copy = vector_b.copy()
-        vector_b_label_copy = vector_b_label.copy()
+        # Where the label starts; it orbits the origin from there
+        vector_b_label_center = vector_b_label.get_center()
   
         # Updater to rotate vector B and keep the label oriented
-        vector_b.add_updater(
-          lambda vec: vec.become(
-            vector_b_copy.copy().rotate(theta_tracker.get_value() * DEGREES, about_point=plane.get_origin())
-          )
-        )
-        vector_b_label.add_updater(
-          lambda lbl: lbl.become(
-            vector_b_label_copy.copy()
-            .rotate(theta_tracker.get_value() * DEGREES, about_point=plane.get_origin())
-            .rotate(-theta_tracker.get_value() * DEGREES)  # Maintain label orientation
-          )
-        )
+        add_transform_updater(vector_b, lambda: rotation(
+          theta_tracker.get_value() * DEGREES, about_point=plane.get_origin()
+        ))
+        add_transform_updater(vector_b_label, lambda: orbit(
+          theta_tracker.get_value() * DEGREES, vector_b_label_center, about_point=plane.get_origin()
+        ))
         
         # Updater for the x-axis projection
         #       proj_b_x.add_updater(
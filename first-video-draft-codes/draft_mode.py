@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+# Draft (level-of-detail) mode for previewing scenes.
+#
+# With MANIM_DRAFT=1 in the environment, every scene that calls install_draft_mode()
+# renders a cheap stand-in of itself with exactly the same timing:
+#   - vector field grids (ArrowVectorField, GridArrowVectorField) have about
+#     MANIM_DRAFT_FACTOR times fewer intervals per axis over the same range
+#     (default 3: 27 arrows instead of 729),
+#   - Surface / PackedSurface resolutions are divided by the same factor,
+#   - manim_physics Charges are built without their glow,
+#   - MathTex is never typeset: each expression becomes a box about as wide as
+#     its text, so layout and animations stay recognisable.
+# Nothing about run_time, wait() or the camera changes, so a draft lines up frame
+# for frame with the final render. Combine with -ql for the fastest preview:
+#   MANIM_DRAFT=1 manim -pql vector_field_intro_3D_part_2.py VectorField3DTransform
+
+import functools
+import hashlib
+import inspect
+import os
+import re
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from manim import ArrowVectorField, Surface, logger
+from manim.mobject.text import tex_mobject
+
+import batched_fields
+
+PLACEHOLDER_DIR = Path(tempfile.gettempdir()) / "manim-draft-tex"
+# Roughly the size of one glyph in dvisvgm's output units (pt)
+GLYPH_WIDTH, GLYPH_HEIGHT = 5.5, 7.0
+
+
+def draft_enabled():
+    return os.environ.get("MANIM_DRAFT", "") not in ("", "0")
+
+
+def draft_factor():
+    return max(1, int(os.environ.get("MANIM_DRAFT_FACTOR", 3)))
+
+
+def _patch_init(cls, adjust):
+    """Wrap cls.__init__ so adjust(arguments) can rewrite its bound arguments first"""
+    original = cls.__init__
+    if getattr(original, "_draft_patched", False):
+        return
+    signature = inspect.signature(original)
+
+    @functools.wraps(original)
+    def __init__(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        adjust(bound.arguments)
+        original(*bound.args, **bound.kwargs)
+
+    __init__._draft_patched = True
+    cls.__init__ = __init__
+
+
+def coarsen_range(axis_range, factor):
+    """A field range with about factor times fewer intervals (two-element ranges step 0.5, as in manim).
+    The new step divides the sampled span, so the first and last samples stay where they were"""
+    if axis_range is None:
+        return None
+    start, stop, step = (list(axis_range) + [0.5])[:3]
+    intervals = int(np.floor((stop - start) / step + 1e-9))
+    if intervals < 1:
+        return [start, stop, step]
+    coarse = max(1, intervals // factor)
+    return [start, stop, intervals * step / coarse]
+
+
+def coarsen_resolution(resolution, factor):
+    def coarsen(count):
+        return min(count, max(4, count // factor))
+    if isinstance(resolution, (tuple, list)):
+        return tuple(coarsen(count) for count in resolution)
+    return coarsen(resolution)
+
+
+def visible_length(expression):
+    """Approximate number of glyphs a TeX expression typesets to"""
+    text = re.sub(r"\\(text|mathrm|textit|operatorname)\{([^}]*)\}", r"\2", expression)
+    text = re.sub(r"\\(left|right|,|;|!|quad|qquad)", "", text)
+    text = re.sub(r"\\[a-zA-Z]+", "x", text)
+    text = re.sub(r"[{}^_&\s]", "", text)
+    return max(1, len(text))
+
+
+def placeholder_tex_file(expression, environment=None, tex_template=None):
+    """An SVG box the size of the expression's text, written outside manim's tex folder"""
+    PLACEHOLDER_DIR.mkdir(parents=True, exist_ok=True)
+    path = PLACEHOLDER_DIR / (hashlib.sha256(expression.encode()).hexdigest()[:16] + ".svg")
+    if not path.exists():
+        width = visible_length(expression) * GLYPH_WIDTH
+        path.write_text(
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{GLYPH_HEIGHT}" '
+            f'viewBox="0 0 {width} {GLYPH_HEIGHT}"><path d="M0 0 H{width} V{GLYPH_HEIGHT} H0 Z" '
+            f'fill-opacity="0.35"/></svg>',
+            encoding="utf-8",
+        )
+    return path
+
+
+def install_draft_mode():
+    """Switch this process to draft rendering if MANIM_DRAFT is set; otherwise do nothing"""
+    if not draft_enabled():
+        return False
+    factor = draft_factor()
+
+    def coarsen_field(arguments):
+        for name in ("x_range", "y_range", "z_range"):
+            if name in arguments:
+                arguments[name] = coarsen_range(arguments[name], factor)
+
+    def coarsen_surface(arguments):
+        if "resolution" in arguments:
+            arguments["resolution"] = coarsen_resolution(arguments["resolution"], factor)
+
+    _patch_init(ArrowVectorField, coarsen_field)
+    _patch_init(Surface, coarsen_surface)
+    if not getattr(batched_fields.field_grid, "_draft_patched", False):
+        full_grid = batched_fields.field_grid
+
+        def field_grid(x_range=None, y_range=None, z_range=None, three_dimensions=False):
+            return full_grid(
+                coarsen_range(x_range, factor), coarsen_range(y_range, factor),
+                coarsen_range(z_range, factor), three_dimensions,
+            )
+
+        field_grid._draft_patched = True
+        batched_fields.field_grid = field_grid
+
+    try:
+        from manim_physics import Charge
+    except ImportError:
+        pass
+    else:
+        _patch_init(Charge, lambda arguments: arguments.update(add_glow=False))
+
+    tex_mobject.tex_to_svg_file = placeholder_tex_file
+    logger.info(f"Draft mode: fields and surfaces decimated {factor}x, TeX drawn as boxes")
+    return True
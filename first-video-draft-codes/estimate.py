@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+
+# Estimate the render time and memory of a scene before rendering it.
+#
+# The scene runs once in this process with nothing rasterized or encoded: construct()
+# and every animation and updater run as in a real render, but update_frame() only
+# counts what it would draw (mobjects and bezier curves) and frames go nowhere. The
+# dry run reports, per play() call, frames, frames drawn (waits reused by
+# frozen_frames.py are not), mobjects and curves per drawn frame and become()
+# rebuilds (always_redraw), plus the number of Tex/MathTex built.
+#
+# The estimate is the time the dry run itself took (everything but drawing and
+# encoding) plus, per drawn frame, calibrated costs per mobject, per curve and per
+# megapixel, and an encoding cost per frame and megapixel. Peak memory is the dry
+# run's peak RSS plus the frame buffers of frame_stream.py plus a calibrated
+# remainder (extra_mb: what a real render holds beyond both).
+#
+# The costs start from rough defaults. `--calibrate` fits them to the last
+# benchmark.py run (draw and encode ms per frame and peak memory of each scene) and
+# stores them in media/estimator_costs.json.
+#
+# Usage (from this folder):
+#   python estimate.py parabolic_path.py ParabolicPathElectricField3D -q h
+#   python estimate.py --calibrate
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from render_all import HERE
+
+COSTS_FILE = HERE / "media" / "estimator_costs.json"
+DEFAULT_COSTS = {
+    "frame_ms_per_mpixel": 4.0,
+    "mobject_ms": 0.05,
+    "curve_ms": 0.004,
+    "encode_ms_per_mpixel": 5.0,
+    "extra_mb": 0.0,
+}
+
+
+def load_costs():
+    costs = dict(DEFAULT_COSTS)
+    if COSTS_FILE.exists():
+        costs.update(json.loads(COSTS_FILE.read_text(encoding="utf-8")))
+    return costs
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 ** 2 if sys.platform == "darwin" else 1024)
+
+
+def new_play(label):
+    return {"label": label, "frames": 0, "drawn": 0, "mobjects": 0, "curves": 0, "rebuilds": 0}
+
+
+def count_scene(file, scene_name, quality):
+    """Run a scene without drawing and count frames, primitives, rebuilds and TeX per play"""
+    from manim import Mobject, SingleStringMathTex, tempconfig
+    from manim.constants import QUALITIES
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    from scene_loader import load_scenes
+
+    quality_settings = next(settings for settings in QUALITIES.values() if settings["flag"] == quality)
+    (scene_class,) = load_scenes(file, [scene_name])
+    construct = new_play("construct")
+    plays = []
+    state = {"current": construct, "tex": 0, "tex_depth": 0, "counting": 0.0}
+
+    original_play = CairoRenderer.play
+    original_update_frame = CairoRenderer.update_frame
+    original_add_frame = CairoRenderer.add_frame
+    original_get_frame = CairoRenderer.get_frame
+    original_become = Mobject.become
+    original_tex_init = SingleStringMathTex.__init__
+
+    def play(self, scene, *args, **kwargs):
+        record = new_play(f"play {len(plays)}")
+        plays.append(record)
+        state["current"] = record
+        try:
+            original_play(self, scene, *args, **kwargs)
+        finally:
+            animations = ", ".join(type(animation).__name__ for animation in scene.animations or ())
+            record["label"] = f"play {len(plays) - 1} {animations}"
+            state["current"] = construct
+
+    def update_frame(self, scene, mobjects=None, **kwargs):
+        start = time.perf_counter()
+        record = state["current"]
+        record["drawn"] += 1
+        for mob in mobjects or scene.mobjects:
+            for member in mob.family_members_with_points():
+                record["mobjects"] += 1
+                record["curves"] += len(member.points) // 4
+        state["counting"] += time.perf_counter() - start
+
+    def add_frame(self, frame, num_frames=1):
+        # CairoRenderer.add_frame without writing the frame
+        if self.skip_animations:
+            return
+        state["current"]["frames"] += num_frames
+        self.time += num_frames / self.camera.frame_rate
+
+    def become(self, *args, **kwargs):
+        state["current"]["rebuilds"] += 1
+        return original_become(self, *args, **kwargs)
+
+    def tex_init(self, *args, **kwargs):
+        state["tex_depth"] += 1
+        try:
+            return original_tex_init(self, *args, **kwargs)
+        finally:
+            state["tex_depth"] -= 1
+            if state["tex_depth"] == 0:
+                state["tex"] += 1
+
+    CairoRenderer.play = play
+    CairoRenderer.update_frame = update_frame
+    CairoRenderer.add_frame = add_frame
+    # Nothing reads the frames, so don't copy the pixel array for each one
+    CairoRenderer.get_frame = lambda self: self.camera.pixel_array
+    Mobject.become = become
+    SingleStringMathTex.__init__ = tex_init
+    start = time.perf_counter()
+    try:
+        settings = {key: quality_settings[key] for key in ("pixel_height", "pixel_width", "frame_rate")}
+        with tempconfig({**settings, "dry_run": True}):
+            scene_class().render()
+    finally:
+        CairoRenderer.play = original_play
+        CairoRenderer.update_frame = original_update_frame
+        CairoRenderer.add_frame = original_add_frame
+        CairoRenderer.get_frame = original_get_frame
+        Mobject.become = original_become
+        SingleStringMathTex.__init__ = original_tex_init
+    return {
+        "scene": scene_name,
+        "quality": quality,
+        "pixels": quality_settings["pixel_height"] * quality_settings["pixel_width"],
+        "dry_run_seconds": time.perf_counter() - start - state["counting"],
+        "peak_rss_mb": peak_rss_mb(),
+        "tex": state["tex"],
+        "construct": construct,
+        "plays": plays,
+    }
+
+
+def buffer_mb(pixels):
+    """Memory of frame_stream.py's frame buffers at a frame size, which a dry run never allocates"""
+    from frame_stream import BUFFER_COUNT
+
+    return BUFFER_COUNT * pixels * 4 / 1024 ** 2
+
+
+def estimate(counts, costs):
+    """Estimated wall seconds and peak MB of a real render from the dry run's counts"""
+    megapixels = counts["pixels"] / 1e6
+    records = [counts["construct"], *counts["plays"]]
+    drawn = sum(record["drawn"] for record in records)
+    frames = sum(record["frames"] for record in records)
+    draw_ms = (
+        drawn * costs["frame_ms_per_mpixel"] * megapixels
+        + sum(record["mobjects"] for record in records) * costs["mobject_ms"]
+        + sum(record["curves"] for record in records) * costs["curve_ms"]
+    )
+    encode_ms = frames * costs["encode_ms_per_mpixel"] * megapixels
+    seconds = counts["dry_run_seconds"] + (draw_ms + encode_ms) / 1000
+    peak_mb = None
+    if counts["peak_rss_mb"] is not None:
+        peak_mb = counts["peak_rss_mb"] + buffer_mb(counts["pixels"]) + costs["extra_mb"]
+    return seconds, peak_mb
+
+
+def print_counts(counts, costs):
+    print(f"{counts['scene']} at -q{counts['quality']}: {counts['tex']} Tex/MathTex built")
+    print(f"  {'':<50} {'frames':>7} {'drawn':>7} {'mobjects/frame':>15} {'curves/frame':>13} {'rebuilds':>9}")
+    for record in [counts["construct"], *counts["plays"]]:
+        drawn = max(1, record["drawn"])
+        print(f"  {record['label'][:50]:<50} {record['frames']:7d} {record['drawn']:7d}"
+              f" {record['mobjects'] / drawn:15.0f} {record['curves'] / drawn:13.0f} {record['rebuilds']:9d}")
+    seconds, peak_mb = estimate(counts, costs)
+    memory = f"{peak_mb:.0f} MB" if peak_mb is not None else "unknown"
+    print(f"Estimated render: {seconds / 60:.1f} min, peak memory {memory}")
+
+
+def count_in_subprocess(file, scene, quality):
+    """count_scene() in a fresh process, so its peak RSS is that scene's alone"""
+    result = subprocess.run(
+        [sys.executable, __file__, str(file), scene, "-q", quality, "--json"],
+        cwd=HERE, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        print(f"  {file.name}:{scene}: dry run failed\n{result.stderr[-2000:]}")
+        return None
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def calibrate():
+    """Fit the per-primitive costs to the newest benchmark.py results"""
+    from benchmark import BENCH_DIR, FRAME_RATE, RESOLUTION
+
+    runs = sorted(path for path in BENCH_DIR.glob("*.json") if path.name != "baseline.json")
+    if not runs:
+        sys.exit("No benchmark results; run benchmark.py first")
+    results = json.loads(runs[-1].read_text(encoding="utf-8"))
+    width, height = (int(value) for value in RESOLUTION.split(","))
+    megapixels = width * height / 1e6
+
+    rows, draw_times, encode_costs, extra_memory = [], [], [], []
+    for key, metrics in results.items():
+        if metrics is None:
+            continue
+        file_name, scene = key.split(":")
+        # Benchmarks run at 426x240 / 15 fps: the closest quality flag is -ql (480p15)
+        counts = count_in_subprocess(HERE / file_name, scene, "l")
+        if counts is None:
+            continue
+        records = [counts["construct"], *counts["plays"]]
+        drawn = max(1, sum(record["drawn"] for record in records))
+        frames = max(1, sum(record["frames"] for record in records))
+        rows.append([
+            megapixels,
+            sum(record["mobjects"] for record in records) / drawn,
+            sum(record["curves"] for record in records) / drawn,
+        ])
+        # benchmark.py divides the drawing time by all frames, drawn or reused
+        draw_times.append(metrics["draw_ms"] * frames / drawn)
+        encode_costs.append(metrics["encode_ms"] / megapixels)
+        if metrics.get("peak_rss_mb") is not None and counts["peak_rss_mb"] is not None:
+            # estimate() adds the frame buffers itself; extra_mb is what remains
+            extra_memory.append(metrics["peak_rss_mb"] - counts["peak_rss_mb"] - buffer_mb(width * height))
+        print(f"  {key}: {rows[-1][1]:.0f} mobjects, {rows[-1][2]:.0f} curves, {draw_times[-1]:.2f} ms per drawn frame")
+
+    if len(rows) < 3:
+        sys.exit("Need at least three benchmarked scenes to calibrate")
+    coefficients, *_ = np.linalg.lstsq(np.array(rows), np.array(draw_times), rcond=None)
+    coefficients = np.maximum(coefficients, 0)
+    costs = {
+        "frame_ms_per_mpixel": float(coefficients[0]),
+        "mobject_ms": float(coefficients[1]),
+        "curve_ms": float(coefficients[2]),
+        "encode_ms_per_mpixel": float(np.median(encode_costs)),
+        "extra_mb": float(np.median(extra_memory)) if extra_memory else 0.0,
+    }
+    COSTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    COSTS_FILE.write_text(json.dumps(costs, indent=2), encoding="utf-8")
+    print(f"Costs from {len(rows)} scenes of {runs[-1].name} ({width}x{height}, {FRAME_RATE} fps) saved to {COSTS_FILE}")
+    for name, value in costs.items():
+        print(f"  {name:<22} {value:.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate render time and memory of a scene with a dry run.")
+    parser.add_argument("file", nargs="?", help="scene file, e.g. parabolic_path.py")
+    parser.add_argument("scene", nargs="?", help="scene class name")
+    parser.add_argument("-q", "--quality", default="h", choices="lmhpk", help="manim quality flag (default: h)")
+    parser.add_argument("--json", action="store_true", help="print the counts as JSON")
+    parser.add_argument("--calibrate", action="store_true", help="fit the costs to the last benchmark.py run")
+    args = parser.parse_args()
+
+    if args.calibrate:
+        calibrate()
+        return
+    if not args.file or not args.scene:
+        parser.error("give a scene file and a scene class, or --calibrate")
+    counts = count_scene(Path(args.file).resolve(), args.scene, args.quality)
+    if args.json:
+        print(json.dumps(counts))
+        return
+    print_counts(counts, load_costs())
+
+
+if __name__ == "__main__":
+    main()
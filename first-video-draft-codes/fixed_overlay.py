@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# Fixed-in-frame mobjects drawn once and pasted onto every frame.
+#
+# Titles, description boxes and formula panels added with add_fixed_in_frame_mobjects
+# stay put for long stretches while the 3D camera moves, but ThreeDCamera draws
+# every glyph of them as vectors on every frame. With install_fixed_overlay() the
+# fixed-in-frame mobjects that are neither animated in the current play nor carry
+# updaters are rasterized once into a transparent layer, which is composited over
+# each frame (only inside its bounding box). The layer is redrawn when their points
+# or colours change, or when one of them starts or stops being animated.
+#
+# The layer goes on top of the frame. manim draws fixed-in-frame mobjects late
+# anyway (they are never depth-sorted behind 3D objects), so this only differs if
+# an unshaded 3D mobject added after a panel overlapped it on screen.
+
+import functools
+import inspect
+
+import numpy as np
+from manim import ThreeDScene
+from manim.camera.three_d_camera import ThreeDCamera
+
+from cached_redraw import fingerprint
+
+
+def overlay_candidates(camera, mobjects):
+    """Top-level mobjects that are wholly fixed in frame, not animated and without updaters"""
+    animated = getattr(camera, "_animated_ids", set())
+    candidates = []
+    for mob in mobjects:
+        family = mob.get_family()
+        if all(
+            member in camera.fixed_in_frame_mobjects and not member.updaters and id(member) not in animated
+            for member in family
+        ):
+            candidates.append(mob)
+    return candidates
+
+
+def rasterize(camera, capture, mobjects):
+    """RGBA layer (premultiplied, like the camera's pixel array) of mobjects, and its bounding box"""
+    if getattr(camera, "_overlay_canvas", None) is None or camera._overlay_canvas.shape != camera.pixel_array.shape:
+        # One canvas for the camera's lifetime: cairo contexts are cached by the array's id
+        camera._overlay_canvas = np.zeros_like(camera.pixel_array)
+    canvas = camera._overlay_canvas
+    canvas[:] = 0
+    frame = camera.pixel_array
+    camera.pixel_array = canvas
+    try:
+        capture(camera, mobjects)
+    finally:
+        camera.pixel_array = frame
+    rows = np.flatnonzero(canvas[:, :, 3].any(axis=1))
+    columns = np.flatnonzero(canvas[:, :, 3].any(axis=0))
+    if len(rows) == 0:
+        return None
+    box = (slice(rows[0], rows[-1] + 1), slice(columns[0], columns[-1] + 1))
+    return canvas[box].astype(np.uint16), box
+
+
+def composite(frame, layer, box):
+    """Premultiplied 'over': frame = layer + frame * (1 - layer alpha)"""
+    region = frame[box]
+    alpha = layer[:, :, 3:4]
+    region[:] = layer + (region.astype(np.uint16) * (255 - alpha) + 127) // 255
+
+
+_installed = False
+
+
+def install_fixed_overlay():
+    """Patch ThreeDCamera to draw static fixed-in-frame mobjects from a cached raster layer"""
+    # A module flag, not a mark on the patched method: camera_fast_path.py wraps the same methods
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    original_capture = ThreeDCamera.capture_mobjects
+    # The layer is drawn by manim's own capture_mobjects, never through other caching
+    # patches (camera_fast_path.py would build its static layer from the overlay's mobjects)
+    base_capture = inspect.unwrap(original_capture)
+    original_begin = ThreeDScene.begin_animations
+
+    def begin_animations(self):
+        original_begin(self)
+        self.renderer.camera._animated_ids = {
+            id(member) for animation in self.animations or () for member in animation.mobject.get_family()
+        }
+
+    @functools.wraps(original_capture)
+    def capture_mobjects(self, mobjects, **kwargs):
+        mobjects = list(mobjects)
+        candidates = overlay_candidates(self, mobjects) if kwargs.get("include_submobjects", True) else []
+        if not candidates:
+            return original_capture(self, mobjects, **kwargs)
+        key = (fingerprint(candidates), tuple(id(mob) for mob in candidates), self.pixel_array.shape)
+        if getattr(self, "_overlay_key", None) != key:
+            self._overlay = rasterize(self, base_capture, candidates)
+            self._overlay_key = key
+        rest = [mob for mob in mobjects if not any(mob is candidate for candidate in candidates)]
+        original_capture(self, rest, **kwargs)
+        if self._overlay is not None:
+            composite(self.pixel_array, *self._overlay)
+
+    ThreeDScene.begin_animations = begin_animations
+    ThreeDCamera.capture_mobjects = capture_mobjects
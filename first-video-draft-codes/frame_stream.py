@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+# Hand finished frames to ffmpeg from a background thread.
+#
+# manim writes every frame to ffmpeg's stdin from the render loop (after a
+# frame.tobytes() copy), so drawing stops whenever the pipe is full and ffmpeg
+# idles while the next frame is drawn. With install_frame_streaming() each frame is
+# copied into one of a few preallocated buffers and queued; a writer thread per
+# movie pipe writes the buffers to stdin as memoryviews (no bytes copy) and returns
+# them to the pool. Rendering and encoding overlap, and when the encoder falls
+# behind the render loop waits for a free buffer instead of queueing without bound.
+#
+# A frame added several times in a row (freeze_current_frame, static waits) is
+# queued once and written again by the writer without another copy.
+#
+# MANIM_STREAM_BUFFERS sets the number of buffers (default 8: 66 MB at 1080p).
+# An encoder error is raised in the render loop on the next frame or when the
+# partial movie is closed.
+
+import os
+import queue
+import threading
+
+import numpy as np
+from manim import config
+from manim.constants import RendererType
+from manim.scene.scene_file_writer import SceneFileWriter
+
+BUFFER_COUNT = max(2, int(os.environ.get("MANIM_STREAM_BUFFERS", "8")))
+
+# Queue entries besides frame buffers
+REPEAT = "repeat"
+DONE = "done"
+
+
+class FrameStream:
+    """Bounded pool of frame buffers drained into an encoder's stdin by a writer thread"""
+
+    def __init__(self, stdin, buffer_count=BUFFER_COUNT, transform=None):
+        self.stdin = stdin
+        # Applied to each frame on the writer thread (e.g. downscaling, see multi_resolution.py)
+        self.transform = transform
+        self.buffer_count = buffer_count
+        self.free = queue.Queue()
+        self.pending = queue.Queue()
+        self.error = None
+        self.last_frame = None
+        self.thread = threading.Thread(target=self._write_loop, name="frame-stream", daemon=True)
+        self.thread.start()
+
+    def _allocate(self, frame):
+        for _ in range(self.buffer_count):
+            self.free.put(np.empty(frame.shape, dtype=frame.dtype))
+
+    def put(self, frame):
+        if self.error is not None:
+            raise self.error
+        if frame is self.last_frame:
+            self.pending.put(REPEAT)
+            return
+        if self.last_frame is None:
+            self._allocate(frame)
+        buffer = self.free.get()
+        np.copyto(buffer, frame)
+        # Kept only to recognise repeats; the caller's array is never written to
+        self.last_frame = frame
+        self.pending.put(buffer)
+
+    def _write_loop(self):
+        # The buffer written last stays out of the pool while REPEAT may still refer to it
+        last = None
+        last_data = None
+        while True:
+            item = self.pending.get()
+            if item is DONE:
+                return
+            if self.error is not None:
+                # Drain after a failure so that put() never blocks
+                if item is not REPEAT:
+                    self.free.put(item)
+                continue
+            try:
+                if item is REPEAT:
+                    self.stdin.write(memoryview(last_data).cast("B"))
+                    continue
+                data = item if self.transform is None else np.ascontiguousarray(self.transform(item))
+                self.stdin.write(memoryview(data).cast("B"))
+            except Exception as error:
+                # A dead encoder (BrokenPipeError) or a failing transform; reported by put() and close()
+                self.error = error
+                if item is not REPEAT:
+                    self.free.put(item)
+                continue
+            if last is not None:
+                self.free.put(last)
+            last, last_data = item, data
+
+    def close(self):
+        self.pending.put(DONE)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+
+_installed = False
+
+
+def install_frame_streaming():
+    """Patch SceneFileWriter so movie frames are written to ffmpeg from a writer thread"""
+    # A module flag, not a mark on the patched method: multi_resolution.py wraps the same methods
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    original_open = SceneFileWriter.open_movie_pipe
+    original_close = SceneFileWriter.close_movie_pipe
+    original_write = SceneFileWriter.write_frame
+
+    def open_movie_pipe(self, file_path=None):
+        original_open(self, file_path=file_path)
+        if config.renderer == RendererType.CAIRO:
+            self._frame_stream = FrameStream(self.writing_process.stdin)
+
+    def write_frame(self, frame_or_renderer):
+        stream = getattr(self, "_frame_stream", None)
+        if stream is None:
+            return original_write(self, frame_or_renderer)
+        stream.put(frame_or_renderer)
+
+    def close_movie_pipe(self):
+        stream = getattr(self, "_frame_stream", None)
+        self._frame_stream = None
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                self.writing_process.kill()
+                raise
+        original_close(self)
+
+    SceneFileWriter.open_movie_pipe = open_movie_pipe
+    SceneFileWriter.write_frame = write_frame
+    SceneFileWriter.close_movie_pipe = close_movie_pipe
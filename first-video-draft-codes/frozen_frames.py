@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# Reuse the previous frame during wait() when nothing on screen changes.
+#
+# manim only freezes a wait() when no mobject in the scene has an updater. Every
+# scene here has some (axis labels, trackers, ...), so each wait redraws every frame
+# even when the updaters leave everything where it was. With install_frame_elision()
+# the first frame of each wait is drawn and the mobjects that can still change
+# during it are noted: those with updaters (and their families) plus the camera's
+# trackers (phi, theta, zoom, frame center, ...). Every later frame of the wait only
+# fingerprints those, after the updaters ran; if nothing moved or changed colour,
+# the camera is not redrawn and the last image goes straight to the movie again.
+# Ambient camera rotation or an updater that moves its mobject changes the
+# fingerprint, so those frames are drawn. (An updater that changes some *other*
+# mobject during a wait is not noticed.)
+#
+# The number of reused frames is logged when the scene finishes and kept per
+# renderer, i.e. per scene, in frame_stats(renderer) for profiling.
+
+from manim import Mobject, Wait, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from cached_redraw import fingerprint
+
+
+def frame_stats(renderer):
+    """{"elided": ..., "drawn": ...} frames of one renderer (each scene has its own)"""
+    return renderer.__dict__.setdefault("_frame_stats", {"elided": 0, "drawn": 0})
+
+
+def camera_mobjects(camera):
+    """The trackers and frame mobjects that hold a camera's position and orientation"""
+    mobjects = [value for value in vars(camera).values() if isinstance(value, Mobject)]
+    if hasattr(camera, "get_value_trackers"):
+        mobjects += camera.get_value_trackers()
+    return mobjects
+
+
+def watched_mobjects(scene, camera):
+    """What can change during a wait: the mobjects with updaters and the camera's trackers"""
+    updating = [mob for mob in scene.get_mobject_family_members() if mob.updaters]
+    return [*updating, *camera_mobjects(camera)]
+
+
+def install_frame_elision():
+    """Patch the Cairo renderer to repeat the last frame of a wait() that shows no change"""
+    if getattr(CairoRenderer.render, "_elides_frames", False):
+        return
+    original_render = CairoRenderer.render
+    original_finished = CairoRenderer.scene_finished
+
+    def render(self, scene, time, moving_mobjects):
+        stats = frame_stats(self)
+        if not all(isinstance(animation, Wait) for animation in scene.animations or ()):
+            self._frozen_play = None
+            original_render(self, scene, time, moving_mobjects)
+            stats["drawn"] += 1
+            return
+        if getattr(self, "_frozen_play", None) != self.num_plays:
+            # First frame of this wait: draw it and note what could change during the rest
+            self._frozen_play = self.num_plays
+            self._frozen_watch = watched_mobjects(scene, self.camera)
+            original_render(self, scene, time, moving_mobjects)
+            self._frozen_key = fingerprint(self._frozen_watch)
+            stats["drawn"] += 1
+            return
+        key = fingerprint(self._frozen_watch)
+        if key == self._frozen_key:
+            # The camera still holds the previous image
+            self.add_frame(self.get_frame())
+            stats["elided"] += 1
+            return
+        original_render(self, scene, time, moving_mobjects)
+        self._frozen_key = key
+        stats["drawn"] += 1
+
+    def scene_finished(self, scene):
+        stats = frame_stats(self)
+        total = stats["elided"] + stats["drawn"]
+        if total:
+            logger.info(f"{type(scene).__name__}: {stats['elided']} of {total} frames reused from static waits")
+        original_finished(self, scene)
+
+    render._elides_frames = True
+    CairoRenderer.render = render
+    CairoRenderer.scene_finished = scene_finished
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+
+# Many copies of one arrow, stored as packed arrays.
+#
+# The uniform field scenes build ~126 identical arrows in a triple loop and call
+# .scale().rotate() on each. InstancedArrows builds the template arrow once and
+# places every instance with one broadcasted add (plus one batched rotation about
+# the arrow's tail when instances point in different directions). The anchor takes
+# the place of ORIGIN: a template built at ORIGIN the way the scenes built each arrow
+# (buffer, scale and rotation about its centre included) lands exactly where that
+# arrow did, and a re-aimed one keeps its tail there. The points and colours of all
+# instances live in single (N, ...) arrays and every instance's VMobjects hold
+# views into them, so there is one allocation per array instead of one per arrow,
+# and set_color / set_opacity / set_color_by_gradient are single array writes.
+# `field_vectors.animate.set_opacity(0.45).set_color_by_gradient(...)` interpolates
+# those buffers too: one array operation per frame instead of one Transform step
+# per shaft and tip. Drawing is unchanged: the Cairo camera still strokes and fills
+# every shaft and tip as its own mobject (instances can differ in colour and are
+# depth-sorted one by one in 3D).
+#
+#   field_vectors = InstancedArrows(
+#       Arrow(ORIGIN, field_direction * field_length, color=WHITE).scale(1.5).rotate(PI/2, axis=UP),
+#       anchors=grid_points,
+#   )
+
+import numpy as np
+from manim import *
+
+try:
+    # manim's .animate builder is private (this subclass is written against manim 0.18);
+    # without it InstancedArrows keeps the generic .animate (MoveToTarget)
+    from manim.mobject.mobject import _AnimationBuilder
+except ImportError:
+    _AnimationBuilder = None
+
+
+def rotation_matrices(source, targets):
+    """(N, 3, 3) rotations taking the unit vector source onto each unit row of targets"""
+    source = source / np.linalg.norm(source)
+    targets = targets / np.linalg.norm(targets, axis=1, keepdims=True)
+    axes = np.cross(source, targets)
+    cosines = targets @ source
+    cross_matrices = np.zeros((len(targets), 3, 3))
+    cross_matrices[:, 0, 1], cross_matrices[:, 0, 2] = -axes[:, 2], axes[:, 1]
+    cross_matrices[:, 1, 0], cross_matrices[:, 1, 2] = axes[:, 2], -axes[:, 0]
+    cross_matrices[:, 2, 0], cross_matrices[:, 2, 1] = -axes[:, 1], axes[:, 0]
+    # Rodrigues; opposite directions get a half turn about any perpendicular axis
+    factors = np.divide(1, 1 + cosines, out=np.zeros_like(cosines), where=cosines > -1 + 1e-9)
+    matrices = np.eye(3) + cross_matrices + cross_matrices @ cross_matrices * factors[:, None, None]
+    opposite = cosines <= -1 + 1e-9
+    if opposite.any():
+        perpendicular = np.cross(source, RIGHT if abs(source[0]) < 0.9 else UP)
+        perpendicular /= np.linalg.norm(perpendicular)
+        matrices[opposite] = 2 * np.outer(perpendicular, perpendicular) - np.eye(3)
+    return matrices
+
+
+def gradient_rgbs(colors, length):
+    """color_gradient(colors, length) as an (length, 3) array"""
+    rgbs = np.array([color_to_rgb(color) for color in colors])
+    if length == 0:
+        return np.zeros((0, 3))
+    if len(rgbs) == 1:
+        return np.tile(rgbs[0], (length, 1))
+    alphas = np.linspace(0, len(rgbs) - 1, length)
+    floors = alphas.astype(int)
+    alphas_mod1 = alphas % 1
+    # End edge case, as in manim's color_gradient
+    floors[-1] = len(rgbs) - 2
+    alphas_mod1[-1] = 1
+    return rgbs[floors] * (1 - alphas_mod1[:, None]) + rgbs[floors + 1] * alphas_mod1[:, None]
+
+
+class InstancedArrows(VGroup):
+    """N translated (and optionally re-aimed) copies of a template arrow with packed points and colours"""
+
+    def __init__(self, template, anchors, directions=None, template_direction=None, **kwargs):
+        super().__init__(**kwargs)
+        self.template = template
+        self.anchors = np.array(anchors, dtype=float)
+        parts = template.family_members_with_points()
+        count = len(self.anchors)
+
+        # Instances keep the template's offset from ORIGIN to their anchor
+        template_points = [part.points for part in parts]
+        if directions is not None:
+            start = template.get_start()
+            if template_direction is None:
+                template_direction = template.get_end() - start
+            self.directions = np.array(directions, dtype=float)
+            matrices = rotation_matrices(np.asarray(template_direction, dtype=float), self.directions)
+            # Re-aimed about the tail, so every tail stays where the template's is
+            template_points = [
+                np.einsum("nij,pj->npi", matrices, points - start) + start for points in template_points
+            ]
+        else:
+            self.directions = None
+            template_points = [np.broadcast_to(points, (count, *points.shape)) for points in template_points]
+
+        # One buffer per template part holding that part for every instance: (N, P, 3)
+        self.part_points = [points + self.anchors[:, None, :] for points in template_points]
+        # Colours are (N, parts, 4); each VMobject's rgbas array is a (1, 4) view into them
+        self.stroke_rgbas_buffer = np.array([[part.stroke_rgbas[0] for part in parts]] * count)
+        self.fill_rgbas_buffer = np.array([[part.fill_rgbas[0] for part in parts]] * count)
+        self.stroke_widths = [part.stroke_width for part in parts]
+
+        for i in range(count):
+            instance = None
+            for k in range(len(parts)):
+                piece = VMobject()
+                piece.points = self.part_points[k][i]
+                piece.stroke_width = self.stroke_widths[k]
+                if instance is None:
+                    instance = piece
+                else:
+                    instance.add(piece)
+            self.add(instance)
+        self._bind_styles()
+
+    def instance_parts(self):
+        return [[instance, *instance.submobjects] for instance in self.submobjects]
+
+    def _bind_styles(self):
+        for i, parts in enumerate(self.instance_parts()):
+            for k, part in enumerate(parts):
+                part.stroke_rgbas = self.stroke_rgbas_buffer[i, k:k + 1]
+                part.fill_rgbas = self.fill_rgbas_buffer[i, k:k + 1]
+
+    def _bind_points(self):
+        for i, parts in enumerate(self.instance_parts()):
+            for k, part in enumerate(parts):
+                part.points = self.part_points[k][i]
+
+    def _sync_points(self):
+        """Pull replaced point arrays back into the buffers; False if an instance no longer fits them"""
+        instances = self.instance_parts()
+        for i, parts in enumerate(instances):
+            if len(parts) != len(self.part_points):
+                return False
+            for k, part in enumerate(parts):
+                if part.points.base is not self.part_points[k]:
+                    if part.points.shape != self.part_points[k][i].shape:
+                        return False
+                    self.part_points[k][i] = part.points
+        self._bind_points()
+        return True
+
+    def _sync_styles(self):
+        # Animations replace the rgbas arrays of the pieces; pull them back into the buffers
+        for i, parts in enumerate(self.instance_parts()):
+            for k, part in enumerate(parts):
+                if part.stroke_rgbas.base is not self.stroke_rgbas_buffer:
+                    self.stroke_rgbas_buffer[i, k] = part.stroke_rgbas[0]
+                if part.fill_rgbas.base is not self.fill_rgbas_buffer:
+                    self.fill_rgbas_buffer[i, k] = part.fill_rgbas[0]
+        self._bind_styles()
+
+    def __deepcopy__(self, memo):
+        result = super().__deepcopy__(memo)
+        # deepcopy turns the views into independent arrays; point them at the copied buffers again
+        result._sync_styles()
+        result._sync_points()
+        return result
+
+    @property
+    def animate(self):
+        if _AnimationBuilder is None:
+            return super().animate
+        return _PackedAnimationBuilder(self)
+
+    def packable_with(self, other):
+        """Whether self and other (e.g. its .target) match the packed buffers piece for piece"""
+        return (
+            len(self.submobjects) == len(other.submobjects)
+            and len(self.part_points) == len(other.part_points)
+            and self._sync_points()
+            and other._sync_points()
+        )
+
+    def set_color(self, color=YELLOW_C, family=True):
+        self._sync_styles()
+        rgb = color_to_rgb(color)
+        self.stroke_rgbas_buffer[..., :3] = rgb
+        self.fill_rgbas_buffer[..., :3] = rgb
+        return self
+
+    def set_opacity(self, opacity, family=True):
+        self._sync_styles()
+        self.stroke_rgbas_buffer[..., 3] = opacity
+        self.fill_rgbas_buffer[..., 3] = opacity
+        return self
+
+    def set_color_by_gradient(self, *colors):
+        # Same colour per piece as the VGroup version: a gradient over every shaft and tip in order
+        self._sync_styles()
+        count, parts = self.stroke_rgbas_buffer.shape[:2]
+        rgbs = gradient_rgbs(colors, count * parts).reshape(count, parts, 3)
+        self.stroke_rgbas_buffer[..., :3] = rgbs
+        self.fill_rgbas_buffer[..., :3] = rgbs
+        return self
+
+
+class PackedMethodAnimation(Animation):
+    """Animate InstancedArrows into its .target by interpolating the packed point and colour buffers
+    as a whole, then apply the recorded methods to it (what .animate does with MoveToTarget)"""
+
+    def __init__(self, mobject, methods, path_func=straight_path(), **kwargs):
+        self.methods = methods
+        self.target_mobject = mobject.target
+        self.path_func = path_func
+        super().__init__(mobject, **kwargs)
+
+    def begin(self):
+        mobject, target = self.mobject, self.target_mobject
+        mobject._sync_points()
+        target._sync_points()
+        mobject._sync_styles()
+        target._sync_styles()
+        # No starting copy of the arrows: the start state is kept as arrays
+        self.start_points = [points.copy() for points in mobject.part_points]
+        self.moving = [not np.array_equal(start, end) for start, end in zip(self.start_points, target.part_points)]
+        self.start_stroke_rgbas = mobject.stroke_rgbas_buffer.copy()
+        self.start_fill_rgbas = mobject.fill_rgbas_buffer.copy()
+        self.start_widths = np.array([[part.stroke_width for part in parts] for parts in mobject.instance_parts()])
+        self.end_widths = np.array([[part.stroke_width for part in parts] for parts in target.instance_parts()])
+        self.widths_change = not np.array_equal(self.start_widths, self.end_widths)
+        if self.suspend_mobject_updating:
+            mobject.suspend_updating()
+        self.interpolate(0)
+
+    def get_all_mobjects(self):
+        return [self.mobject, self.target_mobject]
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        mobject, target = self.mobject, self.target_mobject
+        for points, start, end, moving in zip(mobject.part_points, self.start_points, target.part_points, self.moving):
+            if moving:
+                points[...] = self.path_func(start, end, alpha)
+        mobject.stroke_rgbas_buffer[...] = interpolate(self.start_stroke_rgbas, target.stroke_rgbas_buffer, alpha)
+        mobject.fill_rgbas_buffer[...] = interpolate(self.start_fill_rgbas, target.fill_rgbas_buffer, alpha)
+        if self.widths_change:
+            widths = interpolate(self.start_widths, self.end_widths, alpha)
+            for parts, row in zip(mobject.instance_parts(), widths):
+                for part, width in zip(parts, row):
+                    part.stroke_width = width
+
+    def finish(self):
+        for method, method_args, method_kwargs in self.methods:
+            method.__func__(self.mobject, *method_args, **method_kwargs)
+        super().finish()
+
+
+if _AnimationBuilder is not None:
+
+    class _PackedAnimationBuilder(_AnimationBuilder):
+        def build(self):
+            # Something changed the instances' structure, or the pieces should lag: let
+            # manim's MoveToTarget align them one by one
+            if (
+                self.overridden_animation
+                or self.anim_args.get("lag_ratio", 0)
+                or not self.mobject.packable_with(self.mobject.target)
+            ):
+                return super().build()
+            animation = PackedMethodAnimation(self.mobject, self.methods)
+            for attr, value in self.anim_args.items():
+                setattr(animation, attr, value)
+            return animation
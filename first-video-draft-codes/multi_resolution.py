@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+
+# Several output qualities from one render.
+#
+# Publishing a scene at 480p, 720p and 1080p used to mean running construct() three
+# times. With install_multi_resolution() and
+#   MANIM_EXTRA_QUALITIES=m,l manim -qh uniform-field.py UniformElectricField3D
+# the scene is drawn once at the rendered quality and every frame is also sent to one
+# extra ffmpeg per listed quality flag. Each extra output downsamples on its own
+# writer thread (area averaging in NumPy, see frame_stream.py) and keeps every n-th
+# frame when its frame rate is lower (60 -> 30 -> 15 fps). Which frames are kept is
+# counted from the start of the scene, not of each play, so the extra movies keep
+# the main movie's timing however the plays are cut. The extra movies go where
+# manim would put them: media/videos/<file>/720p30/<Scene>.mp4 and so on.
+#
+# Plays that manim takes from its cache draw no frames; their extra partial movies
+# are made from the cached full-size partial movie by ffmpeg instead. Qualities
+# larger than the rendered one are skipped with a warning.
+# The same variable works with render_all.py: MANIM_EXTRA_QUALITIES=h,l python render_all.py -q k
+
+import os
+import subprocess
+from pathlib import Path
+
+import numpy as np
+from manim import config, logger
+from manim.constants import QUALITIES, RendererType
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from frame_stream import FrameStream
+
+
+def extra_qualities():
+    """(height, width, frame_rate) of every quality flag in MANIM_EXTRA_QUALITIES smaller than the render"""
+    flags = [flag.strip() for flag in os.environ.get("MANIM_EXTRA_QUALITIES", "").split(",") if flag.strip()]
+    qualities = []
+    for flag in flags:
+        quality = next((quality for quality in QUALITIES.values() if quality["flag"] == flag), None)
+        if quality is None:
+            logger.warning(f"MANIM_EXTRA_QUALITIES: unknown quality flag {flag!r}")
+            continue
+        height, width = quality["pixel_height"], quality["pixel_width"]
+        if height > config.pixel_height or width > config.pixel_width:
+            logger.warning(f"MANIM_EXTRA_QUALITIES: -q{flag} is larger than the render, skipped")
+            continue
+        if (height, width) == (config.pixel_height, config.pixel_width) and quality["frame_rate"] == config.frame_rate:
+            continue
+        # A lower frame rate keeps every n-th frame, so it must divide the render's frame rate
+        step = max(1, round(config.frame_rate / quality["frame_rate"]))
+        qualities.append((height, width, config.frame_rate / step))
+    return qualities
+
+
+def _area_axis(values, size, axis):
+    count = values.shape[axis]
+    if count == size:
+        return values
+    if count % size == 0:
+        shape = values.shape[:axis] + (size, count // size) + values.shape[axis + 1:]
+        return values.reshape(shape).mean(axis=axis + 1)
+    # Integrate the pixels as a step function and take the difference at the output edges
+    zeros = np.zeros_like(values.take([0], axis=axis))
+    cumulative = np.concatenate([zeros, np.cumsum(values, axis=axis)], axis=axis)
+    edges = np.linspace(0, count, size + 1)
+    low = np.minimum(edges.astype(int), count - 1)
+    fraction = (edges - low).reshape([-1 if i == axis else 1 for i in range(values.ndim)])
+    below = cumulative.take(low, axis=axis)
+    above = cumulative.take(low + 1, axis=axis)
+    integral = below + (above - below) * fraction
+    return np.diff(integral, axis=axis) * (size / count)
+
+
+def area_resize(frame, height, width):
+    """Downsample an (H, W, 4) uint8 frame to (height, width, 4) by area averaging"""
+    values = frame.astype(np.float32)
+    values = _area_axis(values, height, axis=0)
+    values = _area_axis(values, width, axis=1)
+    return np.clip(values + 0.5, 0, 255).astype(np.uint8)
+
+
+def quality_dir(movie_file_path, height, frame_rate):
+    frame_rate = int(frame_rate) if frame_rate == int(frame_rate) else frame_rate
+    return Path(movie_file_path).parent.with_name(f"{height}p{frame_rate}")
+
+
+def decimation_step(frame_rate):
+    """Every how many rendered frames an output at frame_rate keeps one"""
+    return max(1, round(config.frame_rate / frame_rate))
+
+
+def scene_frame(file_writer):
+    """Index, at the rendered frame rate, of the next frame of the scene"""
+    return round(file_writer.renderer.time * config.frame_rate)
+
+
+def extra_path(path, movie_file_path, height, frame_rate, phase=0):
+    """Where the extra output keeps the counterpart of a file from the rendered quality's folder.
+    Partial movies that keep different frames of a play (phase) get their own file"""
+    source_root = Path(movie_file_path).parent
+    try:
+        relative = Path(path).relative_to(source_root)
+    except ValueError:
+        relative = Path("partial_movie_files") / Path(path).parent.name / Path(path).name
+    if phase:
+        relative = relative.with_name(f"{relative.stem}.phase{phase}{relative.suffix}")
+    return quality_dir(movie_file_path, height, frame_rate) / relative
+
+
+def encoder_command(width, height, frame_rate, file_path, input_args=None, first_frame=0):
+    """ffmpeg command encoding like manim's movie pipe, from raw RGBA frames or from input_args
+    (a full-rate movie starting at scene frame first_frame, decimated like ExtraOutput)"""
+    if input_args is None:
+        input_args = ["-f", "rawvideo", "-s", f"{width}x{height}", "-pix_fmt", "rgba", "-r", f"{frame_rate:g}", "-i", "-"]
+    else:
+        step = decimation_step(frame_rate)
+        keep = f"select='not(mod(n+{first_frame % step},{step}))',setpts=N/({frame_rate:g}*TB)," if step > 1 else ""
+        input_args = [*input_args, "-vf", f"{keep}scale={width}:{height}:flags=area", "-r", f"{frame_rate:g}"]
+    command = [config.ffmpeg_executable, "-y", *input_args, "-an", "-loglevel", config.ffmpeg_loglevel.lower()]
+    if config.format == "webm":
+        command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+    elif config.transparent:
+        command += ["-vcodec", "qtrle"]
+    else:
+        command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+    return command + [str(file_path)]
+
+
+class ExtraOutput:
+    """One extra partial movie: an ffmpeg process fed downsampled, decimated frames"""
+
+    def __init__(self, height, width, frame_rate, file_path, first_frame=0):
+        self.step = decimation_step(frame_rate)
+        # Counted in the whole scene, so every play continues the previous one's rhythm
+        self.frame_index = first_frame
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.process = subprocess.Popen(encoder_command(width, height, frame_rate, file_path), stdin=subprocess.PIPE)
+        self.stream = FrameStream(self.process.stdin, transform=lambda frame: area_resize(frame, height, width))
+
+    def write(self, frame):
+        if self.frame_index % self.step == 0:
+            self.stream.put(frame)
+        self.frame_index += 1
+
+    def close(self):
+        try:
+            self.stream.close()
+        finally:
+            self.process.stdin.close()
+            self.process.wait()
+
+
+_installed = False
+
+
+def install_multi_resolution():
+    """Patch SceneFileWriter to also encode the qualities in MANIM_EXTRA_QUALITIES from the same frames"""
+    # A module flag, not a mark on a patched method: frame_stream.py wraps the same methods
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    original_open = SceneFileWriter.open_movie_pipe
+    original_write = SceneFileWriter.write_frame
+    original_close = SceneFileWriter.close_movie_pipe
+    original_end = SceneFileWriter.end_animation
+    original_combine = SceneFileWriter.combine_to_movie
+
+    def open_movie_pipe(self, file_path=None):
+        original_open(self, file_path=file_path)
+        self._extra_outputs = []
+        if config.renderer != RendererType.CAIRO:
+            return
+        first_frame = scene_frame(self)
+        for height, width, frame_rate in extra_qualities():
+            phase = first_frame % decimation_step(frame_rate)
+            target = extra_path(self.partial_movie_file_path, self.movie_file_path, height, frame_rate, phase)
+            self._extra_outputs.append(ExtraOutput(height, width, frame_rate, target, first_frame))
+
+    def write_frame(self, frame_or_renderer):
+        original_write(self, frame_or_renderer)
+        for output in getattr(self, "_extra_outputs", ()):
+            output.write(frame_or_renderer)
+
+    def close_movie_pipe(self):
+        outputs, self._extra_outputs = getattr(self, "_extra_outputs", []), []
+        original_close(self)
+        for output in outputs:
+            output.close()
+
+    def end_animation(self, allow_write=False):
+        original_end(self, allow_write)
+        # Where each play ends in the scene, drawn or taken from the cache (whose plays
+        # advance the renderer's clock without frames): the next one starts there
+        if hasattr(self, "partial_movie_files"):
+            ends = self.__dict__.setdefault("_play_end_frames", {})
+            ends[len(self.partial_movie_files) - 1] = scene_frame(self)
+
+    def combine_to_movie(self):
+        original_combine(self)
+        if config.renderer != RendererType.CAIRO or config.format not in (None, "mp4", "webm", "mov"):
+            return
+        ends = getattr(self, "_play_end_frames", {})
+        partial_files = [
+            (Path(path), ends.get(index - 1, 0)) for index, path in enumerate(self.partial_movie_files)
+            if path is not None
+        ]
+        for height, width, frame_rate in extra_qualities():
+            step = decimation_step(frame_rate)
+            parts = []
+            for path, first_frame in partial_files:
+                part = extra_path(path, self.movie_file_path, height, frame_rate, first_frame % step)
+                if not part.exists():
+                    # A cached play: no frames were drawn, so scale and decimate the cached movie
+                    part.parent.mkdir(parents=True, exist_ok=True)
+                    command = encoder_command(width, height, frame_rate, part, ["-i", str(path)], first_frame)
+                    subprocess.run(command, check=True)
+                parts.append(part)
+            if not parts:
+                continue
+            # Imported here: render_split pulls in the render driver, which scenes don't need
+            from render_split import concatenate
+            output_file = extra_path(self.movie_file_path, self.movie_file_path, height, frame_rate)
+            concatenate(parts, output_file)
+            logger.info(f"Extra quality {height}p written to {output_file}")
+
+    SceneFileWriter.open_movie_pipe = open_movie_pipe
+    SceneFileWriter.write_frame = write_frame
+    SceneFileWriter.close_movie_pipe = close_movie_pipe
+    SceneFileWriter.end_animation = end_animation
+    SceneFileWriter.combine_to_movie = combine_to_movie
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+# Live-updating formulas that never re-typeset.
+#
+# always_redraw(lambda: MathTex(r"\vec{B} = " + f"{round(x, 2)} \\hat{{i}} + ..."))
+# builds a new MathTex on every frame, and every distinct value is a new TeX
+# expression (a LaTeX run, or at best a cache lookup and SVG parse). A
+# NumericFormula typesets its static parts once, with "0" standing in for every
+# number, and draws the numbers from a glyph atlas: the digits, "." and "-"
+# typeset once per font size. Updating a value only writes glyph points into the
+# formula and slides the parts after it, so a frame costs microseconds.
+#
+#   text = NumericFormula(r"\vec{B} = ", 2.0, r"\hat{i} + ", 0.0, r"\hat{j}")
+#   text.add_updater(lambda t: t.set_values(bx(), by()).next_to(header, DOWN), call_updater=True)
+#
+# Strings are TeX, numbers are slots (with their initial values). Values are shown
+# as f"{round(value, 2)}" like the scenes did; pass number_format to change that.
+# Other characters a format produces (e.g. "e" or "n") are typeset on first use.
+# Updates keep the formula where it was moved to; rotating or scaling it is not supported.
+
+import numpy as np
+from manim import *
+
+# "-" first (unary, as after "="), ten digits, then "0.0" to measure the period
+CALIBRATION = ["-", *"0123456789", "0", ".", "0"]
+
+_atlases = {}
+
+
+def _glyph_points(part):
+    members = part.family_members_with_points()
+    if not members:
+        return np.zeros((0, 3))
+    return np.concatenate([member.points for member in members])
+
+
+class GlyphAtlas:
+    """Outline and advance width of every number character at one font size, typeset once"""
+
+    def __init__(self, **tex_kwargs):
+        self.tex_kwargs = tex_kwargs
+        parts = MathTex(*CALIBRATION, **tex_kwargs).submobjects
+        centers = [part.get_center() for part in parts]
+        # Digits all have the same advance; measure it across ten of them
+        self.digit_width = (centers[11][0] - centers[1][0]) / 10
+        first_left = centers[1][0] - self.digit_width / 2
+        self.glyphs = {}
+        for k in range(10):
+            self._store(str(k), parts[1 + k], first_left + k * self.digit_width, self.digit_width, centers[1][1])
+        period_left = centers[11][0] + self.digit_width / 2
+        period_width = centers[13][0] - self.digit_width / 2 - period_left
+        self._store(".", parts[12], period_left, period_width, centers[1][1])
+        # The minus sign's ink is centred in its box
+        minus_width = 2 * (first_left - centers[0][0])
+        self._store("-", parts[0], first_left - minus_width, minus_width, centers[1][1])
+
+    def _store(self, char, part, box_left, advance, zero_y):
+        # Points relative to the left of the character's box and the centre height of a "0"
+        self.glyphs[char] = (_glyph_points(part) - np.array([box_left, zero_y, 0]), advance)
+
+    def glyph(self, char):
+        """(points, advance) of char, typesetting it between two zeros the first time it is needed"""
+        if char not in self.glyphs:
+            zero, middle, next_zero = MathTex("0", char, "0", **self.tex_kwargs).submobjects
+            box_left = zero.get_center()[0] + self.digit_width / 2
+            advance = next_zero.get_center()[0] - self.digit_width / 2 - box_left
+            self._store(char, middle, box_left, advance, zero.get_center()[1])
+        return self.glyphs[char]
+
+
+def get_atlas(font_size, **tex_kwargs):
+    key = (font_size, repr(sorted(tex_kwargs.items())))
+    if key not in _atlases:
+        _atlases[key] = GlyphAtlas(font_size=font_size, **tex_kwargs)
+    return _atlases[key]
+
+
+class NumericFormula(VGroup):
+    """A MathTex whose number slots change without re-typesetting"""
+
+    def __init__(self, *pieces, number_format=lambda value: f"{round(value, 2)}", **tex_kwargs):
+        super().__init__()
+        self.number_format = number_format
+        self.is_slot = [not isinstance(piece, str) for piece in pieces]
+        template = MathTex(*[piece if isinstance(piece, str) else "0" for piece in pieces], **tex_kwargs)
+        atlas_kwargs = {key: value for key, value in tex_kwargs.items() if key in ("tex_environment", "tex_template")}
+        self.atlas = get_atlas(template.font_size, **atlas_kwargs)
+
+        # Template coordinates: where each static point sits and where each slot's "0" box starts
+        self.static_points = {}
+        self.slot_origins = {}
+        self.slot_pools = {}
+        self.slot_styles = {}
+        for i, part in enumerate(template.submobjects):
+            if self.is_slot[i]:
+                center = part.get_center()
+                self.slot_origins[i] = np.array([center[0] - self.atlas.digit_width / 2, center[1], 0])
+                members = part.family_members_with_points()
+                self.slot_styles[i] = members[0] if members else VMobject()
+                self.slot_pools[i] = []
+                self.add(VGroup())
+            else:
+                self.static_points[i] = [(member, member.points.copy()) for member in part.family_members_with_points()]
+                self.add(part)
+        self._layout_center = None
+        self.set_values(*[piece for piece in pieces if not isinstance(piece, str)])
+
+    def _slot_glyphs(self, i, count):
+        pool = self.slot_pools[i]
+        while len(pool) < count:
+            pool.append(self.slot_styles[i].copy())
+        return pool[:count]
+
+    def set_values(self, *values):
+        """Show new numbers in the slots, in order, keeping the formula where it is"""
+        translation = self.get_center() - self._layout_center if self._layout_center is not None else ORIGIN
+        values = iter(values)
+        offset = 0.0
+        for i, part in enumerate(self.submobjects):
+            if not self.is_slot[i]:
+                for member, points in self.static_points[i]:
+                    if member.points.shape == points.shape:
+                        np.add(points, (offset, 0, 0), out=member.points)
+                    else:
+                        # Write/Unwrite left a partial path behind
+                        member.points = points + (offset, 0, 0)
+                continue
+            text = self.number_format(next(values))
+            glyphs = self._slot_glyphs(i, len(text))
+            x, y = self.slot_origins[i][:2]
+            x += offset
+            for glyph, char in zip(glyphs, text):
+                points, advance = self.atlas.glyph(char)
+                glyph.points = points + (x, y, 0)
+                x += advance
+            part.submobjects = list(glyphs)
+            offset = x - self.slot_origins[i][0] - self.atlas.digit_width
+        self._layout_center = self.get_center()
+        self.shift(translation)
+        return self
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+
+# Surface with vectorized, cached tessellation.
+#
+# Surface builds a flat uv grid of faces and then maps every bezier point through
+# func one at a time (~360k Python calls for a 150x150 surface). Because it first
+# pulls the handles towards their anchors by pre_function_handle_to_anchor_scale_factor,
+# each mapped handle is just func at an anchor nudged along u or v. PackedSurface
+# evaluates func on five meshgrids (the anchors and the four nudged copies) in
+# vectorized calls and assembles all faces into one packed (faces, 16, 3) array;
+# every face's points are a view into it.
+#
+# The packed array is cached in memory and on disk (MANIM_SURFACE_CACHE, default
+# ~/.cache/manim-surface-cache), keyed by the function's code and constants, the
+# values of the globals it reads (module constants, and recursively the code of
+# helper functions), the ranges and the resolution, so re-renders and repeated
+# morph targets skip it. A function that depends on something without a stable
+# content hash is tessellated every time instead. A 150x150 surface takes about
+# 9 MB on disk; the folder is kept under MANIM_SURFACE_CACHE_MAX_MB (default 256)
+# by dropping the least recently used entries.
+#
+# adaptive=True swaps the uniform grid for a quadtree that only refines where the
+# surface curves away from its flat faces on screen, within a face budget. Neighbouring
+# faces of different sizes meet at T-junctions; the fill and stroke hide the hairline gaps.
+
+import hashlib
+import os
+import types
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+DEFAULT_CACHE = Path.home() / ".cache" / "manim-surface-cache"
+DEFAULT_CACHE_MAX_MB = 256
+
+_tessellations = {}
+
+
+class Unhashable(Exception):
+    """A function depends on a value whose content can't be hashed stably across runs"""
+
+
+def function_fingerprint(func):
+    """Stable hash of what a function computes: bytecode, constants, defaults and closure values, and
+    recursively the globals it reads (module constants, helper functions) down to library modules"""
+    hasher = hashlib.sha256()
+    seen = set()
+
+    def feed_value(value):
+        if isinstance(value, types.FunctionType):
+            feed_function(value)
+        elif isinstance(value, types.MethodType):
+            feed_function(value.__func__)
+            feed_value(value.__self__)
+        elif isinstance(value, types.ModuleType):
+            # numpy, math, manim ...: assumed fixed; only which one is used matters
+            hasher.update(f"module {value.__name__}".encode())
+        elif isinstance(value, np.ndarray):
+            hasher.update(f"array {value.dtype} {value.shape}".encode())
+            hasher.update(np.ascontiguousarray(value).data)
+        elif isinstance(value, (tuple, list)):
+            hasher.update(f"{type(value).__name__} {len(value)}".encode())
+            for item in value:
+                feed_value(item)
+        elif isinstance(value, dict):
+            hasher.update(f"dict {len(value)}".encode())
+            for key, item in value.items():
+                feed_value(key)
+                feed_value(item)
+        elif isinstance(value, type) or callable(value) and hasattr(value, "__module__") and hasattr(value, "__qualname__"):
+            # Classes and builtins / ufuncs such as np.sin
+            hasher.update(f"{value.__module__}.{value.__qualname__}".encode())
+        else:
+            text = repr(value)
+            if " at 0x" in text:
+                raise Unhashable(type(value).__name__)
+            hasher.update(text.encode())
+
+    def feed_code(code, globals_):
+        hasher.update(code.co_code)
+        hasher.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                feed_code(const, globals_)
+            else:
+                hasher.update(repr(const).encode())
+        # Module-level values and helpers the code reads by name
+        for name in code.co_names:
+            if name in globals_:
+                hasher.update(f"global {name}".encode())
+                feed_value(globals_[name])
+
+    def feed_function(function):
+        if function in seen:
+            hasher.update(f"seen {function.__qualname__}".encode())
+            return
+        seen.add(function)
+        feed_code(function.__code__, function.__globals__)
+        feed_value(function.__defaults__)
+        for cell in function.__closure__ or ():
+            try:
+                feed_value(cell.cell_contents)
+            except ValueError:
+                raise Unhashable("empty closure cell")
+
+    feed_function(func)
+    return hasher.hexdigest()
+
+
+def evaluate_uv(func, us, vs):
+    """func on a whole uv meshgrid as (..., 3), point by point if func doesn't broadcast"""
+    try:
+        with np.errstate(all="ignore"):
+            values = np.asarray(func(us, vs), dtype=float)
+        if values.shape == (3, *us.shape):
+            return np.moveaxis(values, 0, -1)
+    except (ValueError, TypeError, IndexError):
+        pass
+    values = np.array([func(u, v) for u, v in zip(us.ravel(), vs.ravel())], dtype=float)
+    return values.reshape(*us.shape, 3)
+
+
+def uv_values(u_range, v_range, resolution):
+    u_res, v_res = (resolution, resolution) if np.isscalar(resolution) else resolution
+    return np.linspace(*u_range, u_res + 1), np.linspace(*v_range, v_res + 1)
+
+
+def _face_points(a00, a10, a11, a01, plus_u, minus_u, plus_v, minus_v):
+    # Corners (u1, v1) -> (u2, v1) -> (u2, v2) -> (u1, v2) -> (u1, v1), as set_points_as_corners.
+    # Each argument holds, per face, the anchor or the mapped handle at that corner
+    return np.stack([
+        a00, plus_u[0], minus_u[1], a10,
+        a10, plus_v[1], minus_v[2], a11,
+        a11, minus_u[2], plus_u[3], a01,
+        a01, minus_v[3], plus_v[0], a00,
+    ], axis=-2)
+
+
+def grid_cells(u_values, v_values):
+    """(u1, u2, v1, v2) of every grid face, u-major like Surface"""
+    u1s, v1s = np.meshgrid(u_values[:-1], v_values[:-1], indexing="ij")
+    u2s, v2s = np.meshgrid(u_values[1:], v_values[1:], indexing="ij")
+    return np.stack([u1s.ravel(), u2s.ravel(), v1s.ravel(), v2s.ravel()], axis=1)
+
+
+def tessellate(func, u_range, v_range, resolution, handle_factor=0.00001):
+    """Points of every Surface face in Surface's face and point order, (faces, 16, 3), and their uv cells"""
+    u_values, v_values = uv_values(u_range, v_range, resolution)
+    us, vs = np.meshgrid(u_values, v_values, indexing="ij")
+    # Handles sit a third of the way along each edge, pulled in by handle_factor
+    du = handle_factor * (u_values[1] - u_values[0]) / 3
+    dv = handle_factor * (v_values[1] - v_values[0]) / 3
+
+    anchors = evaluate_uv(func, us, vs)
+
+    def handles(offset_u, offset_v):
+        grid = anchors + (evaluate_uv(func, us + offset_u, vs + offset_v) - anchors) / handle_factor
+        # The same handle grid seen from each face corner: 00, 10, 11, 01
+        return grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:]
+
+    faces = _face_points(
+        anchors[:-1, :-1], anchors[1:, :-1], anchors[1:, 1:], anchors[:-1, 1:],
+        handles(du, 0), handles(-du, 0), handles(0, dv), handles(0, -dv),
+    )
+    return faces.reshape(-1, 16, 3), grid_cells(u_values, v_values)
+
+
+def tessellate_cells(func, cells, handle_factor=0.00001):
+    """Face points, (faces, 16, 3), for arbitrary uv cells given as rows of (u1, u2, v1, v2)"""
+    u1, u2, v1, v2 = cells.T
+    du = handle_factor * (u2 - u1) / 3
+    dv = handle_factor * (v2 - v1) / 3
+    corner_us = np.stack([u1, u2, u2, u1])
+    corner_vs = np.stack([v1, v1, v2, v2])
+    anchors = evaluate_uv(func, corner_us, corner_vs)
+
+    def handles(offset_u, offset_v):
+        return anchors + (evaluate_uv(func, corner_us + offset_u, corner_vs + offset_v) - anchors) / handle_factor
+
+    return _face_points(
+        anchors[0], anchors[1], anchors[2], anchors[3],
+        handles(du, 0), handles(-du, 0), handles(0, dv), handles(0, -dv),
+    )
+
+
+def cell_errors(func, cells):
+    """Screen-space deviation, in pixels, of each cell's surface from its flat interpolation"""
+    u1, u2, v1, v2 = cells.T
+    um, vm = (u1 + u2) / 2, (v1 + v2) / 2
+    corners = evaluate_uv(func, np.stack([u1, u2, u2, u1]), np.stack([v1, v1, v2, v2]))
+    # Centre and the four edge midpoints
+    samples = evaluate_uv(func, np.stack([um, um, u2, um, u1]), np.stack([vm, v1, vm, v2, vm]))
+    flat = np.stack([
+        corners.mean(axis=0),
+        (corners[0] + corners[1]) / 2, (corners[1] + corners[2]) / 2,
+        (corners[2] + corners[3]) / 2, (corners[3] + corners[0]) / 2,
+    ])
+    pixels_per_unit = config["pixel_width"] / config["frame_width"]
+    return np.linalg.norm(samples - flat, axis=-1).max(axis=0) * pixels_per_unit
+
+
+def adaptive_tessellate(func, u_range, v_range, resolution, handle_factor=0.00001,
+                        face_budget=None, tolerance=0.5, max_depth=3):
+    """Quadtree tessellation: refine the cells with the largest screen-space error until
+    they are all within tolerance (pixels), the face budget is used up, or they reach
+    the cell size of the uniform resolution"""
+    u_res, v_res = (resolution, resolution) if np.isscalar(resolution) else resolution
+    if face_budget is None:
+        face_budget = u_res * v_res // 4
+    coarse = (max(1, -(-u_res // 2 ** max_depth)), max(1, -(-v_res // 2 ** max_depth)))
+    cells = grid_cells(*uv_values(u_range, v_range, coarse))
+    depths = np.zeros(len(cells), dtype=int)
+    errors = cell_errors(func, cells)
+
+    while True:
+        refinable = np.flatnonzero((depths < max_depth) & (errors > tolerance))
+        room = (face_budget - len(cells)) // 3  # every split adds three faces
+        if room <= 0 or len(refinable) == 0:
+            break
+        chosen = refinable[np.argsort(errors[refinable])[::-1][:room]]
+        u1, u2, v1, v2 = cells[chosen].T
+        um, vm = (u1 + u2) / 2, (v1 + v2) / 2
+        children = np.concatenate([
+            np.stack([u1, um, v1, vm], axis=1), np.stack([um, u2, v1, vm], axis=1),
+            np.stack([u1, um, vm, v2], axis=1), np.stack([um, u2, vm, v2], axis=1),
+        ])
+        kept = np.ones(len(cells), dtype=bool)
+        kept[chosen] = False
+        cells = np.concatenate([cells[kept], children])
+        depths = np.concatenate([depths[kept], np.tile(depths[chosen] + 1, 4)])
+        errors = np.concatenate([errors[kept], cell_errors(func, children)])
+
+    cells = cells[np.lexsort((cells[:, 2], cells[:, 0]))]
+    return tessellate_cells(func, cells, handle_factor), cells
+
+
+def evict_tessellations(cache_dir, max_bytes):
+    """Drop least recently used cache files until the folder is at 90% of max_bytes"""
+    entries = []
+    for entry in cache_dir.glob("*.npz"):
+        if entry.name.endswith(".tmp.npz"):
+            # Another process is still writing it
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+    entries.sort()
+    size = sum(item[1] for item in entries)
+    if size <= max_bytes:
+        return
+    for _, entry_size, entry in entries:
+        if size <= 0.9 * max_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        size -= entry_size
+
+
+def cached_tessellation(func, u_range, v_range, resolution, handle_factor=0.00001, adaptive=None):
+    """(face points, uv cells) through the memory and disk caches; returns private copies.
+    adaptive is None for the uniform grid or a dict of adaptive_tessellate options"""
+    try:
+        fingerprint = function_fingerprint(func)
+    except Unhashable:
+        # No stable key: tessellate every time rather than risk serving another function's mesh
+        if adaptive is None:
+            return tessellate(func, u_range, v_range, resolution, handle_factor)
+        return adaptive_tessellate(func, u_range, v_range, resolution, handle_factor, **adaptive)
+    key_source = (
+        f"{fingerprint}|{list(u_range)}|{list(v_range)}|{resolution}|{handle_factor}"
+        f"|{sorted(adaptive.items()) if adaptive is not None else None}"
+    )
+    if adaptive is not None:
+        # Screen-space tolerance depends on the output resolution
+        key_source += f"|{config['pixel_width']}x{config['frame_width']}"
+    key = hashlib.sha256(key_source.encode()).hexdigest()
+    if key not in _tessellations:
+        cache_dir = Path(os.environ.get("MANIM_SURFACE_CACHE") or DEFAULT_CACHE)
+        cache_file = cache_dir / (key + ".npz")
+        try:
+            with np.load(cache_file) as data:
+                _tessellations[key] = (data["points"], data["cells"])
+            # Touch for LRU eviction
+            os.utime(cache_file)
+        except (OSError, KeyError, ValueError):
+            if adaptive is None:
+                _tessellations[key] = tessellate(func, u_range, v_range, resolution, handle_factor)
+            else:
+                _tessellations[key] = adaptive_tessellate(func, u_range, v_range, resolution, handle_factor, **adaptive)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_dir / f"{key}.{os.getpid()}.tmp.npz"
+            points, cells = _tessellations[key]
+            np.savez(temp_file, points=points, cells=cells)
+            os.replace(temp_file, cache_file)
+            max_mb = float(os.environ.get("MANIM_SURFACE_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB))
+            evict_tessellations(cache_dir, int(max_mb * 1024 ** 2))
+    points, cells = _tessellations[key]
+    return points.copy(), cells.copy()
+
+
+class PackedSurface(Surface):
+    """Surface whose faces are built from one vectorized, cached (faces, 16, 3) array.
+
+    With adaptive=True the uv grid is refined only where the surface bends away from
+    flat faces by more than tolerance pixels, up to face_budget faces (default: a quarter
+    of the uniform resolution's faces) and never finer than the uniform resolution.
+    Every function gets its own cell layout, so Transform between two adaptive surfaces
+    does not pair faces up the way it does between uniform ones.
+    """
+
+    def __init__(self, *args, adaptive=False, face_budget=None, tolerance=0.5, **kwargs):
+        self.adaptive = {"face_budget": face_budget, "tolerance": tolerance} if adaptive else None
+        super().__init__(*args, **kwargs)
+        self._skip_next_apply_function = False
+
+    def _setup_in_uv_space(self):
+        self.face_points, self.face_cells = cached_tessellation(
+            self._func, self.u_range, self.v_range, self.resolution,
+            self.pre_function_handle_to_anchor_scale_factor, self.adaptive,
+        )
+        u1s, u2s, v1s, v2s = self.face_cells.T
+        # Index of each face along u and v at its own cell size
+        u_indices = np.rint((u1s - self.u_range[0]) / (u2s - u1s)).astype(int)
+        v_indices = np.rint((v1s - self.v_range[0]) / (v2s - v1s)).astype(int)
+
+        # Style of every face in two packed arrays, checkerboard by (u_index + v_index) like Surface
+        face_count = len(self.face_points)
+        if self.checkerboard_colors:
+            fill_rgbs = np.array([color_to_rgb(color) for color in self.checkerboard_colors])
+            fill_rgbs = fill_rgbs[(u_indices + v_indices) % len(fill_rgbs)]
+        else:
+            fill_rgbs = np.tile(color_to_rgb(self.fill_color), (face_count, 1))
+        self.face_fill_rgbas = np.concatenate(
+            [fill_rgbs, np.full((face_count, 1), self.fill_opacity)], axis=1
+        )[:, None, :]
+        stroke_rgba = [*color_to_rgb(self.stroke_color), getattr(self, "stroke_opacity", 1.0)]
+        self.face_stroke_rgbas = np.tile(stroke_rgba, (face_count, 1, 1))
+
+        faces = []
+        for index in range(face_count):
+            face = ThreeDVMobject()
+            face.points = self.face_points[index]
+            face.fill_rgbas = self.face_fill_rgbas[index]
+            face.stroke_rgbas = self.face_stroke_rgbas[index]
+            face.stroke_width = self.stroke_width
+            face.u_index, face.v_index = u_indices[index], v_indices[index]
+            face.u1, face.u2, face.v1, face.v2 = self.face_cells[index]
+            faces.append(face)
+        self.add(*faces)
+        self._skip_next_apply_function = True
+
+    def apply_function(self, function):
+        if getattr(self, "_skip_next_apply_function", False):
+            # Surface.__init__ maps the flat uv grid through func next; the packed faces already are
+            self._skip_next_apply_function = False
+            return self
+        return super().apply_function(function)
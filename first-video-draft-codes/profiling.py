@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+
+# Where the render time of a scene goes.
+#
+# With MANIM_PROFILE=1 in the environment, every scene that calls install_profiling()
+# records, for each play()/wait()/move_camera() call:
+#   - wall time, frames written, net and peak Python allocations (tracemalloc),
+#   - time spent drawing frames (update_frame) and handing them to the encoder,
+#   - every updater that ran: calls, time and net allocations,
+#   - time spent building Tex/MathTex mobjects (LaTeX, SVG parsing) and their number,
+# and for the code of construct() between plays (building mobjects, typesetting TeX)
+# the same totals. At the end of the scene it writes
+#   media/profiles/<Scene>.json       the numbers above, per play and per updater
+#   media/profiles/<Scene>.collapsed  "Scene;play 3 Write(MathTex);updaters;dot_product_ba.py:171 <lambda> 1234"
+# The .collapsed file has one stack per line with its time in microseconds, for
+# flamegraph.pl or speedscope. Updaters are named by the file and line of their
+# function (for always_redraw, of the function it redraws), so two lambdas in one
+# scene show up separately. Frames reused by frozen_frames.py are counted too.
+#
+#   MANIM_PROFILE=1 manim -ql dot_product_ba.py VectorDotProduct
+#
+# tracemalloc makes the render several times slower; the split between the parts
+# is still representative. MANIM_PROFILE=timing records everything but allocations
+# at close to normal speed (used by benchmark.py).
+
+import inspect
+import json
+import os
+import time
+import tracemalloc
+import weakref
+from pathlib import Path
+
+from manim import Mobject, Scene, SingleStringMathTex, config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+
+
+def profiling_enabled():
+    return os.environ.get("MANIM_PROFILE", "") not in ("", "0")
+
+
+def allocations_tracked():
+    return os.environ.get("MANIM_PROFILE", "") != "timing"
+
+
+def traced_memory():
+    """(current, peak) bytes allocated, or zeros when allocations are not tracked"""
+    return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+
+
+def describe(function):
+    """'file.py:line name' of a function; always_redraw updaters are named after what they redraw"""
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return getattr(function, "__qualname__", repr(function))
+    if "func" in code.co_freevars and function.__closure__:
+        inner = function.__closure__[code.co_freevars.index("func")].cell_contents
+        if callable(inner) and getattr(inner, "__code__", None) is not code:
+            return f"always_redraw({describe(inner)})"
+    return f"{Path(code.co_filename).name}:{code.co_firstlineno} {function.__qualname__.rsplit('.', 1)[-1]}"
+
+
+# Per updater function: (whether it takes dt, describe() of it), looked up once
+_updater_info = weakref.WeakKeyDictionary()
+
+
+def updater_info(updater):
+    try:
+        return _updater_info[updater]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not weak-referenceable (e.g. a builtin): don't cache
+        return "dt" in inspect.signature(updater).parameters, describe(updater)
+    info = ("dt" in inspect.signature(updater).parameters, describe(updater))
+    _updater_info[updater] = info
+    return info
+
+
+def new_record(label):
+    return {
+        "label": label, "wall": 0.0, "frames": 0, "draw": 0.0, "encode": 0.0, "tex": 0.0, "tex_count": 0,
+        "tex_in_updaters": 0.0, "alloc_net": 0, "alloc_peak": 0, "updaters": {},
+    }
+
+
+class Profile:
+    """Timings of one scene render, collected by the patched manim methods"""
+
+    def __init__(self, scene_name):
+        self.scene_name = scene_name
+        self.construct = new_record("construct")
+        self.plays = []
+        self.current = self.construct
+        self.start = time.perf_counter()
+
+    def add_updater_call(self, name, seconds, allocated):
+        entry = self.current["updaters"].setdefault(name, {"calls": 0, "time": 0.0, "alloc_net": 0})
+        entry["calls"] += 1
+        entry["time"] += seconds
+        entry["alloc_net"] += allocated
+
+    def updater_totals(self):
+        totals = {}
+        for record in [self.construct, *self.plays]:
+            for name, entry in record["updaters"].items():
+                total = totals.setdefault(name, {"calls": 0, "time": 0.0, "alloc_net": 0})
+                for key in total:
+                    total[key] += entry[key]
+        return dict(sorted(totals.items(), key=lambda item: -item[1]["time"]))
+
+    def report(self, renderer=None):
+        total = time.perf_counter() - self.start
+        self.construct["wall"] = total - sum(play["wall"] for play in self.plays)
+        try:
+            from frozen_frames import frame_stats
+        except ImportError:
+            frames = {}
+        else:
+            frames = frame_stats(renderer) if renderer is not None else {}
+        return {
+            "scene": self.scene_name,
+            "wall": total,
+            "frames": sum(play["frames"] for play in self.plays),
+            "frames_reused": frames.get("elided", 0),
+            "tex": sum(record["tex"] + record["tex_in_updaters"] for record in [self.construct, *self.plays]),
+            "tex_count": sum(record["tex_count"] for record in [self.construct, *self.plays]),
+            "construct": self.construct,
+            "plays": self.plays,
+            "updaters": self.updater_totals(),
+        }
+
+    def collapsed_stacks(self):
+        lines = []
+
+        def add(stack, seconds):
+            microseconds = int(seconds * 1e6)
+            if microseconds > 0:
+                lines.append(";".join(part.replace(";", ",") for part in stack) + f" {microseconds}")
+
+        for record in [self.construct, *self.plays]:
+            stack = [self.scene_name, record["label"]]
+            updater_time = sum(entry["time"] for entry in record["updaters"].values())
+            for name, entry in record["updaters"].items():
+                add([*stack, "updaters", name], entry["time"])
+            add([*stack, "draw"], record["draw"])
+            add([*stack, "encode"], record["encode"])
+            add([*stack, "tex"], record["tex"])
+            add(stack, record["wall"] - record["draw"] - record["encode"] - record["tex"] - updater_time)
+        return "\n".join(lines) + "\n"
+
+
+def play_label(index, scene):
+    animations = ", ".join(
+        f"{type(animation).__name__}({type(animation.mobject).__name__})" for animation in scene.animations or ()
+    )
+    return f"play {index} {animations}"
+
+
+def write_report(profile, renderer=None):
+    profile_dir = Path(config.media_dir) / "profiles"
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    report = profile.report(renderer)
+    json_file = profile_dir / f"{profile.scene_name}.json"
+    json_file.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    (profile_dir / f"{profile.scene_name}.collapsed").write_text(profile.collapsed_stacks(), encoding="utf-8")
+    slowest = sorted(report["plays"], key=lambda play: -play["wall"])[:3]
+    logger.info(
+        f"{profile.scene_name}: {report['wall']:.1f} s, construct {report['construct']['wall']:.1f} s; slowest "
+        + "; ".join(f"{play['label']} {play['wall']:.1f} s" for play in slowest)
+        + f". Profile written to {json_file}"
+    )
+
+
+def install_profiling():
+    """Record per-play and per-updater timings if MANIM_PROFILE is set; otherwise do nothing"""
+    if not profiling_enabled():
+        return False
+    if getattr(Scene.render, "_profiled", False):
+        return True
+    original_render = Scene.render
+    original_play = CairoRenderer.play
+    original_update_frame = CairoRenderer.update_frame
+    original_add_frame = CairoRenderer.add_frame
+    original_tex_init = SingleStringMathTex.__init__
+    state = {"profile": None, "tex_depth": 0, "updater_depth": 0}
+
+    def render(self, *args, **kwargs):
+        if allocations_tracked() and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        state["profile"] = Profile(type(self).__name__)
+        try:
+            return original_render(self, *args, **kwargs)
+        finally:
+            write_report(state["profile"], self.renderer)
+            state["profile"] = None
+
+    def play(self, scene, *args, **kwargs):
+        profile = state["profile"]
+        if profile is None:
+            return original_play(self, scene, *args, **kwargs)
+        record = new_record(f"play {len(profile.plays)}")
+        profile.plays.append(record)
+        profile.current = record
+        allocated_before = traced_memory()[0]
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            return original_play(self, scene, *args, **kwargs)
+        finally:
+            record["wall"] = time.perf_counter() - start
+            current, peak = traced_memory()
+            record["alloc_net"] = current - allocated_before
+            record["alloc_peak"] = peak - allocated_before
+            record["label"] = play_label(len(profile.plays) - 1, scene)
+            profile.current = profile.construct
+
+    def update_frame(self, *args, **kwargs):
+        profile = state["profile"]
+        start = time.perf_counter()
+        try:
+            return original_update_frame(self, *args, **kwargs)
+        finally:
+            if profile is not None:
+                profile.current["draw"] += time.perf_counter() - start
+
+    def add_frame(self, frame, num_frames=1):
+        profile = state["profile"]
+        start = time.perf_counter()
+        try:
+            return original_add_frame(self, frame, num_frames)
+        finally:
+            if profile is not None and not self.skip_animations:
+                profile.current["encode"] += time.perf_counter() - start
+                profile.current["frames"] += num_frames
+
+    def tex_init(self, *args, **kwargs):
+        # MathTex builds on SingleStringMathTex; only the outermost call is timed
+        profile = state["profile"]
+        state["tex_depth"] += 1
+        start = time.perf_counter()
+        try:
+            return original_tex_init(self, *args, **kwargs)
+        finally:
+            state["tex_depth"] -= 1
+            if profile is not None and state["tex_depth"] == 0:
+                # TeX built by an updater is already part of that updater's time
+                bucket = "tex_in_updaters" if state["updater_depth"] else "tex"
+                profile.current[bucket] += time.perf_counter() - start
+                profile.current["tex_count"] += 1
+
+    def update(self, dt=0, recursive=True):
+        # Mobject.update, timing each updater on its own (the recursion is not counted twice)
+        if self.updating_suspended:
+            return self
+        profile = state["profile"]
+        for updater in self.updaters:
+            takes_dt, name = updater_info(updater)
+            allocated_before = traced_memory()[0]
+            start = time.perf_counter()
+            state["updater_depth"] += 1
+            try:
+                if takes_dt:
+                    updater(self, dt)
+                else:
+                    updater(self)
+            finally:
+                state["updater_depth"] -= 1
+            if profile is not None:
+                profile.add_updater_call(
+                    name, time.perf_counter() - start, traced_memory()[0] - allocated_before,
+                )
+        if recursive:
+            for submob in self.submobjects:
+                submob.update(dt, recursive)
+        return self
+
+    render._profiled = True
+    Scene.render = render
+    CairoRenderer.play = play
+    CairoRenderer.update_frame = update_frame
+    CairoRenderer.add_frame = add_frame
+    SingleStringMathTex.__init__ = tex_init
+    Mobject.update = update
+    return True
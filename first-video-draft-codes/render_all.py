@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+# Render every scene in this folder in parallel.
+#
+# Scenes are found by reading the files (any class deriving from a *Scene class),
+# then rendered by separate `manim` processes, as many at a time as there are
+# cores. Before that, the TeX of all scenes is typeset together in one batched
+# LaTeX run (see tex_batch.py), so workers never compile the same expression at the
+# same time; they all read the shared store of tex_cache.py. Each worker's output
+# goes to media/logs/<file>.<Scene>.log and the wall time of every scene is printed
+# at the end. Timings are kept in media/render_times.json so the next run starts
+# the longest scenes first.
+#
+# Usage (from this folder):
+#   python render_all.py                       every scene, -qh
+#   python render_all.py -q l -j 4             preview quality, four workers
+#   python render_all.py uniform-field.py parabolic_path.py --scenes UniformElectricField3D
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+TIMINGS_FILE = HERE / "media" / "render_times.json"
+LOG_DIR = HERE / "media" / "logs"
+
+
+def find_scenes(files):
+    """(file, class name) of every scene class in the given files, without importing them"""
+    jobs = []
+    for file in files:
+        tree = ast.parse(Path(file).read_text(encoding="utf-8"), filename=str(file))
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            base_names = [base.id if isinstance(base, ast.Name) else getattr(base, "attr", "") for base in node.bases]
+            if any(name.endswith("Scene") for name in base_names):
+                jobs.append((Path(file), node.name))
+    return jobs
+
+
+def job_key(job):
+    file, scene = job
+    return f"{file.name}:{scene}"
+
+
+def load_timings():
+    if TIMINGS_FILE.exists():
+        return json.loads(TIMINGS_FILE.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_timings(timings):
+    TIMINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    TIMINGS_FILE.write_text(json.dumps(timings, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def prewarm_tex(jobs):
+    """Typeset the TeX of every scene in one batched run before the workers start"""
+    # Imported here so a plain render list doesn't pay for importing every scene
+    from scene_loader import load_scenes
+    from tex_batch import collect_tex, compile_batched
+
+    requests = {}
+    for file, scene in jobs:
+        for scene_class in load_scenes(file, [scene]):
+            requests.update(collect_tex(scene_class))
+    if requests:
+        print(f"Typesetting {len(requests)} TeX expressions for {len(jobs)} scenes in one pass")
+        compile_batched(requests)
+
+
+def render(job, quality, extra_args, log_name=None):
+    file, scene = job
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_file = LOG_DIR / f"{log_name or f'{file.stem}.{scene}'}.log"
+    command = [sys.executable, "-m", "manim", "render", f"-q{quality}", *extra_args, file.name, scene]
+    start = time.perf_counter()
+    with open(log_file, "w", encoding="utf-8") as log:
+        result = subprocess.run(command, cwd=file.parent, stdout=log, stderr=subprocess.STDOUT)
+    return time.perf_counter() - start, result.returncode, log_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render all scenes of this folder in parallel.")
+    parser.add_argument("files", nargs="*", help="scene files (default: every .py file in this folder)")
+    parser.add_argument("--scenes", nargs="+", default=(), help="only these scene class names")
+    parser.add_argument("-q", "--quality", default="h", choices="lmhpk", help="manim quality flag (default: h)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="parallel workers (default: all cores)")
+    parser.add_argument("--no-prewarm", action="store_true", help="skip the shared TeX pre-pass")
+    # Any other option (e.g. --disable_caching) is passed on to manim
+    args, extra_args = parser.parse_known_args()
+
+    files = [Path(file).resolve() for file in args.files] or sorted(HERE.glob("*.py"))
+    jobs = find_scenes(files)
+    if args.scenes:
+        jobs = [job for job in jobs if job[1] in args.scenes]
+    if not jobs:
+        sys.exit("No scenes found")
+
+    if not args.no_prewarm:
+        prewarm_tex(jobs)
+
+    # Longest scenes first (by the last run), so a slow one doesn't start last
+    timings = load_timings()
+    jobs.sort(key=lambda job: timings.get(job_key(job), float("inf")), reverse=True)
+
+    workers = max(1, min(args.jobs, len(jobs)))
+    print(f"Rendering {len(jobs)} scenes with {workers} workers")
+    start = time.perf_counter()
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render, job, args.quality, extra_args): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            seconds, returncode, log_file = future.result()
+            results[job] = (seconds, returncode)
+            status = "ok" if returncode == 0 else f"FAILED, see {log_file}"
+            print(f"  {job_key(job):<60} {seconds:8.1f} s  {status}")
+            if returncode == 0:
+                timings[job_key(job)] = round(seconds, 1)
+    save_timings(timings)
+
+    total = time.perf_counter() - start
+    serial = sum(seconds for seconds, _ in results.values())
+    print(f"Wall time {total:.1f} s for {serial:.1f} s of rendering ({serial / total:.1f}x)")
+    failed = [job for job, (_, returncode) in results.items() if returncode != 0]
+    if failed:
+        sys.exit(f"{len(failed)} scene(s) failed: {', '.join(job_key(job) for job in failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+# Every render patch of this folder, installed once and in a fixed order.
+#
+# Scenes call install_all() right after their config lines:
+#   from render_setup import install_all
+#   install_all()
+# Each patch wraps manim methods and is idempotent on its own; installing them here
+# keeps the wrapping order the same in every process, however many scene files it
+# imports (render_all.py's TeX pre-pass, tex_batch.py, estimate.py):
+#   tex_cache.py         share typeset TeX between scenes and machines
+#   draft_mode.py        cheap previews with MANIM_DRAFT=1
+#   frozen_frames.py     repeat the last frame of waits where nothing changes
+#   frame_stream.py      encode on a writer thread while the next frames are drawn
+#   multi_resolution.py  also encode MANIM_EXTRA_QUALITIES (wraps frame_stream's writer)
+#   profiling.py         per-play and per-updater timings with MANIM_PROFILE=1
+#   bulk_style.py        gradients and opacity as array writes
+#   camera_fast_path.py  pack the static 3D scene once for camera-only plays
+#   fixed_overlay.py     static fixed-in-frame mobjects from a cached raster layer
+#                        (wraps the fast path, and rasterizes through manim's own capture)
+# The 3D patches only touch ThreeDCamera and ThreeDScene, so 2D scenes are unaffected.
+
+from bulk_style import install_bulk_styling
+from camera_fast_path import install_camera_fast_path
+from draft_mode import install_draft_mode
+from fixed_overlay import install_fixed_overlay
+from frame_stream import install_frame_streaming
+from frozen_frames import install_frame_elision
+from multi_resolution import install_multi_resolution
+from profiling import install_profiling
+from tex_cache import install_tex_cache
+
+_installed = False
+
+
+def install_all():
+    """Install every render patch once, in the order above"""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    install_tex_cache()
+    install_draft_mode()
+    install_frame_elision()
+    install_frame_streaming()
+    install_multi_resolution()
+    install_profiling()
+    install_bulk_styling()
+    install_camera_fast_path()
+    install_fixed_overlay()
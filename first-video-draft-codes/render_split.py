@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+# Render one long scene on several cores by splitting it at play() boundaries.
+#
+# A dry run of construct() (no frames) lists every play/wait/move_camera call with
+# its run time. The calls are cut into N contiguous ranges of about equal duration
+# and each range is rendered by its own `manim -n first,last` process: manim
+# replays construct() and skips every call before the range without drawing it
+# (updaters get the skipped time in one step), which puts the scene in the state it
+# had at the boundary, then renders only that range. Each worker keeps its partial
+# movie files in its own folder; the parts are joined with ffmpeg's concat demuxer
+# into the usual media/videos/<file>/<quality>/<Scene>.mp4.
+#
+# Usage (from this folder):
+#   python render_split.py parabolic_path.py ParabolicPathElectricField3D -q h -j 8
+#
+# Updaters that are not linear in dt (none of the current scenes have one) can land
+# slightly differently at a boundary than in a serial render.
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from manim import config, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from render_all import HERE, prewarm_tex, render
+from scene_loader import load_scenes
+
+
+def play_durations(scene_class):
+    """Run time of every play() call of the scene (wait and move_camera included), without rendering"""
+    durations = []
+    original = CairoRenderer.play
+
+    def play(renderer, scene, *args, **kwargs):
+        original(renderer, scene, *args, **kwargs)
+        durations.append(getattr(scene, "duration", 0))
+
+    CairoRenderer.play = play
+    try:
+        with tempconfig({"dry_run": True}):
+            scene_class(skip_animations=True).render()
+    finally:
+        CairoRenderer.play = original
+    return durations
+
+
+def split_ranges(durations, parts):
+    """(first, last) play indices of up to `parts` contiguous ranges of about equal total duration"""
+    total = sum(durations)
+    ranges = []
+    first = 0
+    elapsed = 0.0
+    for index, duration in enumerate(durations):
+        elapsed += duration
+        is_last = index == len(durations) - 1
+        # The last range takes the rest, so trailing zero-length calls don't add one. No
+        # range may end at play 0: manim reads `-n 0,0` as no upper bound and renders all
+        if is_last or (index > 0 and len(ranges) < parts - 1 and elapsed >= total * (len(ranges) + 1) / parts):
+            ranges.append((first, index))
+            first = index + 1
+    return ranges
+
+
+def worker_config(job, part):
+    """A manim config file giving this part its own partial movie folder"""
+    file, scene = job
+    config_file = Path(tempfile.gettempdir()) / f"render_split.{file.stem}.{scene}.part{part}.cfg"
+    config_file.write_text(
+        "[CLI]\n"
+        f"partial_movie_dir = {{video_dir}}/partial_movie_files/{{scene_name}}/part{part}\n",
+        encoding="utf-8",
+    )
+    return config_file
+
+
+def concatenate(part_files, output_file):
+    list_file = output_file.with_name(output_file.stem + "_parts.txt")
+    list_file.write_text("".join(f"file 'file:{path.as_posix()}'\n" for path in part_files), encoding="utf-8")
+    subprocess.run(
+        [config.ffmpeg_executable, "-y", "-f", "concat", "-safe", "0", "-i", str(list_file),
+         "-loglevel", "error", "-c", "copy", "-an", str(output_file)],
+        check=True,
+    )
+    list_file.unlink()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render one scene in parallel, split at play() boundaries.")
+    parser.add_argument("file", help="scene file, e.g. parabolic_path.py")
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("-q", "--quality", default="h", choices="lmhpk", help="manim quality flag (default: h)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of parts (default: all cores)")
+    parser.add_argument("--no-prewarm", action="store_true", help="skip the TeX pre-pass")
+    # Any other option (e.g. --disable_caching) is passed on to manim
+    args, extra_args = parser.parse_known_args()
+
+    file = Path(args.file).resolve()
+    job = (file, args.scene)
+    if not args.no_prewarm:
+        # Parts must not typeset the same expression at the same time
+        prewarm_tex([job])
+    (scene_class,) = load_scenes(file, [args.scene])
+    durations = play_durations(scene_class)
+    ranges = split_ranges(durations, max(1, args.jobs))
+    print(f"{args.scene}: {len(durations)} animations, {sum(durations):.1f} s, rendering in {len(ranges)} parts")
+
+    def render_part(part):
+        first, last = ranges[part]
+        part_args = [
+            "--config_file", str(worker_config(job, part)),
+            "-n", f"{first},{last}",
+            "-o", f"{args.scene}_part{part}",
+            *extra_args,
+        ]
+        return render(job, args.quality, part_args, log_name=f"{file.stem}.{args.scene}.part{part}")
+
+    with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+        results = list(pool.map(render_part, range(len(ranges))))
+    for part, (seconds, returncode, log_file) in enumerate(results):
+        first, last = ranges[part]
+        status = "ok" if returncode == 0 else f"FAILED, see {log_file}"
+        print(f"  part {part}: animations {first}-{last}  {seconds:8.1f} s  {status}")
+    if any(returncode != 0 for _, returncode, _ in results):
+        sys.exit("Not joining the parts: a part failed")
+
+    # Every part writes into the same quality folder; the newest part 0 tells which one
+    video_root = HERE / "media" / "videos" / file.stem
+    first_part = max(video_root.glob(f"*/{args.scene}_part0.mp4"), key=lambda path: path.stat().st_mtime)
+    part_files = [first_part.with_name(f"{args.scene}_part{part}.mp4") for part in range(len(ranges))]
+    output_file = first_part.with_name(f"{args.scene}.mp4")
+    concatenate(part_files, output_file)
+    for part_file in part_files:
+        part_file.unlink()
+    print(f"Joined {len(part_files)} parts into {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,13 @@
 
 from manim import *
 import numpy as np
+from render_setup import install_all
+from packed_surface import PackedSurface
 
 # Set background color
 config.background_color = ManimColor("#030303")
+# Render speed-ups and tools shared by every scene (see render_setup.py)
+install_all()
 
 class ScalarField3DTransform(ThreeDScene):
     def construct(self):
@@ -34,27 +38,27 @@ class ScalarField3DTransform(ThreeDScene):
         z_label = MathTex("z").next_to(axes_3D.z_axis.get_end(), UP * 0.75, buff=0.2).rotate(PI / 2, axis=RIGHT)
 
         # Physics-related Scalar Fields
-        surface_1 = Surface(
+        surface_1 = PackedSurface(
             lambda u, v: np.array([u, v, np.sin(np.sqrt(u**2 + v**2))]),  # Wave propagation
             u_range=[-3, 3], v_range=[-3, 3], resolution=(150, 150)
         )
 
-        surface_2 = Surface(
+        surface_2 = PackedSurface(
             lambda u, v: np.array([u, v, np.cos(u) * np.cos(v)]),  # Harmonic potential
             u_range=[-3, 3], v_range=[-3, 3], resolution=(150, 150)
         )
 
-        surface_3 = Surface(
+        surface_3 = PackedSurface(
             lambda u, v: np.array([u, v, 2 * np.exp(-u**2 - v**2)]),  # Higher peak Gaussian distribution
             u_range=[-3, 3], v_range=[-3, 3], resolution=(150, 150)
         )
 
-        surface_4 = Surface(
+        surface_4 = PackedSurface(
             lambda u, v: np.array([u, v, np.tanh(u * v)]),  # Hyperbolic field
             u_range=[-3, 3], v_range=[-3, 3], resolution=(150, 150)
         )
 
-        surface_5 = Surface(
+        surface_5 = PackedSurface(
             lambda u, v: np.array([u, v, np.log(1 + u**2 + v**2)]),  # Logarithmic potential
             u_range=[-3, 3], v_range=[-3, 3], resolution=(150, 150)
         )
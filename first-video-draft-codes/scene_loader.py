@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+# Helpers for loading the scene files in this folder from other scripts
+# (the TeX pre-pass, render tools, ...) the same way `manim file.py` does.
+
+import importlib.util
+import sys
+from pathlib import Path
+
+from manim import Scene
+
+
+def load_module(file_name):
+    """Import a scene file by path, with its folder on sys.path like the manim CLI"""
+    file_path = Path(file_name).absolute()
+    module_name = file_path.stem.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    if str(file_path.parent) not in sys.path:
+        sys.path.insert(0, str(file_path.parent))
+    spec.loader.exec_module(module)
+    return module
+
+
+def scene_classes(module):
+    """All Scene subclasses defined in (not imported into) a scene module"""
+    return [
+        obj for obj in vars(module).values()
+        if isinstance(obj, type) and issubclass(obj, Scene) and obj.__module__ == module.__name__
+    ]
+
+
+def load_scenes(file_name, scene_names=()):
+    """Scene classes from a file, optionally restricted to the given class names"""
+    classes = scene_classes(load_module(file_name))
+    if scene_names:
+        by_name = {cls.__name__: cls for cls in classes}
+        missing = [name for name in scene_names if name not in by_name]
+        if missing:
+            raise ValueError(f"{file_name} has no scene(s) named {', '.join(missing)}")
+        classes = [by_name[name] for name in scene_names]
+    return classes
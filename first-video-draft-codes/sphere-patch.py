@@ -1,4 +1,8 @@
 from manim import *
+from render_setup import install_all
+
+# Render speed-ups and tools shared by every scene (see render_setup.py)
+install_all()
 
 class SphereWithPatch(ThreeDScene):
     # Function to create and add patches with normal vectors
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The helper modules are imported by file name, as the scenes import them
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,54 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("manim")
+
+from batched_fields import evaluate_field
+
+
+def grid():
+    xs, ys = np.meshgrid(np.arange(-3, 3.5, 0.5), np.arange(-3, 3.5, 0.5), indexing="ij")
+    return np.stack([xs.ravel(), ys.ravel(), np.full(xs.size, 0.5)], axis=1)
+
+
+def per_point(func, points):
+    return np.array([func(point) for point in points], dtype=float)
+
+
+def test_broadcasting_function_is_evaluated_once_on_the_grid():
+    calls = []
+
+    def func(pos):
+        calls.append(np.shape(pos))
+        return np.array([-pos[1], pos[0], np.sin(pos[2])])
+
+    points = grid()
+    values = evaluate_field(func, points)
+    assert calls[0] == (3, len(points))
+    # The batched call plus the sample-point check, not one call per point
+    assert len(calls) < len(points) // 10
+    np.testing.assert_allclose(values, per_point(func, points))
+
+
+def test_reducing_function_falls_back_to_per_point():
+    def func(pos):
+        return pos / np.linalg.norm(pos)
+
+    points = grid()
+    np.testing.assert_allclose(evaluate_field(func, points), per_point(func, points))
+
+
+def test_ragged_function_falls_back_to_per_point():
+    def func(pos):
+        return np.array([-pos[1], pos[0], 0])
+
+    points = grid()
+    np.testing.assert_allclose(evaluate_field(func, points), per_point(func, points))
+
+
+def test_infinities_become_zero():
+    def func(pos):
+        return np.array([1 / pos[0], pos[1], pos[2]])
+
+    points = np.array([[0.0, 1.0, 2.0], [2.0, 1.0, 0.0]])
+    np.testing.assert_allclose(evaluate_field(func, points), [[0.0, 1.0, 2.0], [0.5, 1.0, 0.0]])
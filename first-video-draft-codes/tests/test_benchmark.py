@@ -0,0 +1,49 @@
+from benchmark import NOISE_FLOORS, regressions
+
+BASELINE = {
+    "a.py:Slow": {"wall": 40.0, "draw_ms": 12.0, "peak_rss_mb": 300.0, "output_kb": 900.0},
+    "b.py:Fast": {"wall": 2.0, "construct": 0.4, "tex": 0.1},
+}
+
+
+def test_no_change_is_no_regression():
+    assert regressions(BASELINE, BASELINE, 0.15) == []
+
+
+def test_slowdown_over_threshold_and_floor_is_found():
+    results = {"a.py:Slow": {**BASELINE["a.py:Slow"], "wall": 50.0}, "b.py:Fast": BASELINE["b.py:Fast"]}
+    assert regressions(results, BASELINE, 0.15) == [("a.py:Slow", "wall", 40.0, 50.0)]
+
+
+def test_slowdown_within_threshold_is_ignored():
+    results = {"a.py:Slow": {**BASELINE["a.py:Slow"], "wall": 45.0}}
+    assert regressions(results, BASELINE, 0.15) == []
+
+
+def test_relative_slowdown_below_noise_floor_is_ignored():
+    # +100 % but only 0.1 s, under the 0.2 s floor for construct
+    results = {"b.py:Fast": {**BASELINE["b.py:Fast"], "construct": 0.5}}
+    assert NOISE_FLOORS["construct"] > 0.1
+    assert regressions(results, BASELINE, 0.15) == []
+
+
+def test_every_metric_is_compared():
+    results = {"a.py:Slow": {"wall": 60.0, "draw_ms": 20.0, "peak_rss_mb": 500.0, "output_kb": 2000.0}}
+    found = {metric for _, metric, _, _ in regressions(results, BASELINE, 0.15)}
+    assert found == {"wall", "draw_ms", "peak_rss_mb", "output_kb"}
+
+
+def test_speedups_are_not_regressions():
+    results = {"a.py:Slow": {"wall": 10.0, "draw_ms": 3.0, "peak_rss_mb": 100.0, "output_kb": 100.0}}
+    assert regressions(results, BASELINE, 0.0) == []
+
+
+def test_missing_scenes_and_metrics_are_skipped():
+    results = {
+        "a.py:Slow": {"wall": 80.0, "draw_ms": None},
+        "b.py:Fast": None,
+        "c.py:New": {"wall": 999.0},
+    }
+    # peak_rss_mb is None on platforms without os.wait4
+    baseline = {**BASELINE, "a.py:Slow": {**BASELINE["a.py:Slow"], "peak_rss_mb": None}}
+    assert regressions(results, baseline, 0.15) == [("a.py:Slow", "wall", 40.0, 80.0)]
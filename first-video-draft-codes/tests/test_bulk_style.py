@@ -0,0 +1,44 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+manim = pytest.importorskip("manim")
+
+from bulk_style import install_bulk_styling, set_color_by_gradient, set_opacity
+
+COLORS = [manim.RED, manim.YELLOW, manim.BLUE]
+
+
+def shapes():
+    return manim.VGroup(manim.Square(), manim.VGroup(manim.Circle(), manim.Triangle()), manim.Line(), manim.Dot())
+
+
+def test_gradient_matches_manim():
+    expected, bulk = shapes(), shapes()
+    expected.set_color_by_gradient(*COLORS)
+    assert set_color_by_gradient(bulk, *COLORS) is True
+    for want, got in zip(expected.family_members_with_points(), bulk.family_members_with_points()):
+        np.testing.assert_allclose(got.fill_rgbas, want.fill_rgbas, atol=1e-12)
+        np.testing.assert_allclose(got.stroke_rgbas, want.stroke_rgbas, atol=1e-12)
+
+
+def test_opacity_matches_manim():
+    expected, bulk = shapes(), shapes()
+    expected.set_opacity(0.45)
+    assert set_opacity(bulk, 0.45) is True
+    for want, got in zip(expected.get_family(), bulk.get_family()):
+        np.testing.assert_allclose(got.fill_rgbas, want.fill_rgbas, atol=1e-12)
+        np.testing.assert_allclose(got.stroke_rgbas, want.stroke_rgbas, atol=1e-12)
+        np.testing.assert_allclose(got.background_stroke_rgbas, want.background_stroke_rgbas, atol=1e-12)
+
+
+def test_gradient_of_an_empty_group_does_nothing():
+    assert set_color_by_gradient(manim.VGroup(), *COLORS) is True
+
+
+def test_patched_gradient_of_an_empty_group(monkeypatch):
+    # Restored after the test, so other tests see manim's own methods
+    for name in ("set_submobject_colors_by_gradient", "set_opacity"):
+        monkeypatch.setattr(manim.VMobject, name, getattr(manim.VMobject, name))
+    install_bulk_styling()
+    group = manim.VGroup()
+    assert group.set_color_by_gradient(*COLORS) is group
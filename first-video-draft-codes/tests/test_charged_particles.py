@@ -0,0 +1,69 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("manim")
+
+from charged_particles import boris_push, simulate
+
+
+def test_magnetic_rotation_keeps_speed_exactly():
+    rng = np.random.default_rng(0)
+    positions, velocities = rng.normal(size=(20, 3)), rng.normal(size=(20, 3))
+    q_over_m = rng.normal(size=20)
+    E, B = np.zeros((20, 3)), rng.normal(size=(20, 3)) * 5
+    speeds = np.linalg.norm(velocities, axis=1)
+    for _ in range(1000):
+        positions, velocities = boris_push(positions, velocities, q_over_m, E, B, 0.01)
+    np.testing.assert_allclose(np.linalg.norm(velocities, axis=1), speeds, rtol=1e-12)
+
+
+def test_uniform_electric_field_matches_closed_form():
+    start, velocity, acceleration = np.array([1.0, -2.0, 0.5]), np.array([0.3, 1.0, 0.0]), np.array([0.0, -0.8, 0.4])
+    trajectories = simulate(start, velocity, q_over_m=2.0, E=acceleration / 2, duration=3, dt=1 / 60)
+    times = trajectories.times[:, None]
+    expected = start + velocity * times + 0.5 * acceleration * times ** 2
+    np.testing.assert_allclose(trajectories.positions[:, 0], expected, atol=1e-10)
+    np.testing.assert_allclose(trajectories.velocities[:-1, 0], velocity + acceleration * times[:-1], atol=1e-10)
+
+
+def test_gyration_keeps_energy_and_radius():
+    # q/m = 1, |B| = 2, speed 3: radius 1.5, period pi, 20 turns
+    trajectories = simulate([0.0, 0.0, 0.0], [0.0, 3.0, 0.0], q_over_m=1.0, B=[0.0, 0.0, 2.0], duration=20 * np.pi)
+    speeds = np.linalg.norm(trajectories.velocities[:-1, 0], axis=1)
+    np.testing.assert_allclose(speeds, 3, rtol=1e-4)
+    center = np.array([1.5, 0.0, 0.0])
+    radii = np.linalg.norm(trajectories.positions[:, 0] - center, axis=1)
+    np.testing.assert_allclose(radii, 1.5, rtol=1e-3)
+
+
+def test_crossed_fields_conserve_energy_and_drift():
+    # Starting at rest in E = y, B = z, the particle rolls along x at E/B = 0.5 on cycloids
+    E, B = np.array([0.0, 1.0, 0.0]), np.array([0.0, 0.0, 2.0])
+    period = np.pi
+    trajectories = simulate([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], q_over_m=1.0, E=E, B=B, duration=10 * period)
+    positions, velocities = trajectories.positions[:-1, 0], trajectories.velocities[:-1, 0]
+    energy = 0.5 * np.sum(velocities ** 2, axis=1) - positions @ E
+    np.testing.assert_allclose(energy, 0, atol=1e-4)
+    end = trajectories.positions[-1, 0]
+    np.testing.assert_allclose(end, [0.5 * 10 * period, 0.0, 0.0], atol=1e-3)
+
+
+def test_particles_are_independent_of_the_batch():
+    rng = np.random.default_rng(3)
+    starts, velocities = rng.normal(size=(6, 3)), rng.normal(size=(6, 3))
+    q_over_m = np.array([1.0, -1.0, 0.5, 2.0, -0.3, 1.5])
+    fields = dict(E=[0.2, 0.0, -0.1], B=[0.0, 0.5, 1.0], duration=2)
+    together = simulate(starts, velocities, q_over_m, **fields)
+    for index in range(6):
+        alone = simulate(starts[index], velocities[index], q_over_m[index], **fields)
+        np.testing.assert_allclose(together.positions[:, index], alone.positions[:, 0], atol=1e-12)
+
+
+def test_adaptive_steps_limit_the_gyration_angle():
+    trajectories = simulate([0.0, 0.0, 0.0], [1.0, 0.0, 0.0], q_over_m=1.0, B=[0.0, 0.0, 40.0], duration=1,
+                            dt=1 / 30, adaptive=True, max_rotation=0.1)
+    steps = np.diff(trajectories.times)
+    assert trajectories.times[-1] == pytest.approx(1)
+    assert np.all(steps * 40 <= 0.1 + 1e-9)
+    speeds = np.linalg.norm(trajectories.velocities[:-1, 0], axis=1)
+    np.testing.assert_allclose(speeds, 1, rtol=1e-2)
@@ -0,0 +1,44 @@
+from checkpoints import source_digest
+
+SCENE = '''from manim import *
+
+
+class Lecture(Scene):
+    def construct(self):
+        box = make_box()
+        self.play(Create(box))
+        checkpoint(self, "act2")
+        self.play(FadeOut(box))
+        self.wait()
+
+
+def make_box():
+    return Square(side_length=2)
+'''
+MARK = 8
+
+
+def digest(tmp_path, text):
+    file = tmp_path / "scene.py"
+    file.write_text(text, encoding="utf-8")
+    return source_digest(file, MARK)
+
+
+def test_editing_after_the_mark_keeps_the_digest(tmp_path):
+    edited = SCENE.replace("self.wait()", "self.wait(3)\n        self.play(Create(Circle()))")
+    assert digest(tmp_path, edited) == digest(tmp_path, SCENE)
+
+
+def test_editing_before_the_mark_changes_the_digest(tmp_path):
+    edited = SCENE.replace("self.play(Create(box))", "self.play(Create(box), run_time=2)")
+    assert digest(tmp_path, edited) != digest(tmp_path, SCENE)
+
+
+def test_editing_a_helper_below_construct_changes_the_digest(tmp_path):
+    edited = SCENE.replace("side_length=2", "side_length=3")
+    assert digest(tmp_path, edited) != digest(tmp_path, SCENE)
+
+
+def test_editing_the_imports_changes_the_digest(tmp_path):
+    edited = SCENE.replace("from manim import *", "from manim import *\nfrom instanced_arrows import InstancedArrows")
+    assert digest(tmp_path, edited) != digest(tmp_path, SCENE)
@@ -0,0 +1,114 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from coulomb_field import ChargeTree, as_field_function, clear_of_sources, direct_field, field_directions, superposition_field
+
+
+def charge_cloud(count, seed, signed=False):
+    rng = np.random.default_rng(seed)
+    sources = rng.uniform(-2, 2, size=(count, 3))
+    charges = rng.uniform(0.5, 1.5, size=count)
+    if signed:
+        charges *= rng.choice([-1, 1], size=count)
+    return sources, charges
+
+
+def relative_error(field, reference):
+    return np.linalg.norm(field - reference) / np.linalg.norm(reference)
+
+
+def test_direct_field_of_one_charge_is_coulomb():
+    points = np.array([[1.0, 0.0, 0.0], [0.0, -2.0, 0.0], [1.0, 1.0, 1.0]])
+    field = direct_field(np.zeros((1, 3)), np.array([3.0]), points)
+    distances = np.linalg.norm(points, axis=1, keepdims=True)
+    np.testing.assert_allclose(field, 3 * points / distances ** 3)
+
+
+def test_point_on_a_charge_feels_only_the_others():
+    sources = np.array([[0.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+    field = direct_field(sources, np.array([1.0, -1.0]), sources)
+    np.testing.assert_allclose(field, [[0.25, 0.0, 0.0], [0.25, 0.0, 0.0]])
+
+
+def test_direct_field_chunks_match_one_pass(monkeypatch):
+    sources, charges = charge_cloud(50, 0, signed=True)
+    points = np.random.default_rng(1).uniform(-3, 3, size=(200, 3))
+    reference = direct_field(sources, charges, points)
+    monkeypatch.setattr("coulomb_field.CHUNK_PAIRS", 120)
+    np.testing.assert_allclose(direct_field(sources, charges, points), reference, rtol=1e-12)
+
+
+@pytest.mark.parametrize("signed", [False, True])
+def test_tree_matches_direct_sum(signed):
+    sources, charges = charge_cloud(3000, 2, signed)
+    points = np.random.default_rng(3).uniform(-4, 4, size=(500, 3))
+    reference = direct_field(sources, charges, points)
+    assert relative_error(ChargeTree(sources, charges).field(points, theta=0.5), reference) < 1e-2
+
+
+def test_smaller_theta_is_more_accurate():
+    sources, charges = charge_cloud(3000, 4)
+    points = np.random.default_rng(5).uniform(-4, 4, size=(300, 3))
+    reference = direct_field(sources, charges, points)
+    tree = ChargeTree(sources, charges)
+    errors = [relative_error(tree.field(points, theta), reference) for theta in (0.8, 0.4, 0.2)]
+    assert errors[0] > errors[1] > errors[2]
+
+
+def test_zero_theta_is_the_direct_sum():
+    sources, charges = charge_cloud(400, 6, signed=True)
+    points = np.random.default_rng(7).uniform(-3, 3, size=(100, 3))
+    field = ChargeTree(sources, charges, leaf_size=8).field(points, theta=0)
+    np.testing.assert_allclose(field, direct_field(sources, charges, points), rtol=1e-9, atol=1e-12)
+
+
+def test_tree_handles_points_on_charges():
+    sources, charges = charge_cloud(500, 8)
+    field = ChargeTree(sources, charges).field(sources, theta=0.5)
+    assert np.all(np.isfinite(field))
+    assert relative_error(field, direct_field(sources, charges, sources)) < 1e-2
+
+
+def test_superposition_methods_agree():
+    sources, charges = charge_cloud(200, 9, signed=True)
+    points = np.random.default_rng(10).uniform(-3, 3, size=(50, 3))
+    direct = superposition_field(sources, charges, points, method="direct")
+    np.testing.assert_allclose(superposition_field(sources, charges, points), direct)
+    assert relative_error(superposition_field(sources, charges, points, method="tree"), direct) < 1e-2
+    with pytest.raises(ValueError):
+        superposition_field(sources, charges, points, method="fmm")
+
+
+def test_field_function_takes_scene_shaped_positions():
+    sources, charges = charge_cloud(100, 11)
+    points = np.random.default_rng(12).uniform(-3, 3, size=(40, 3))
+    expected = direct_field(sources, charges, points)
+    for kwargs in ({}, {"method": "tree", "theta": 0}):
+        func = as_field_function(sources, charges, **kwargs)
+        np.testing.assert_allclose(func(points.T), expected.T, rtol=1e-9)
+        np.testing.assert_allclose(func(points[0]), expected[0], rtol=1e-9)
+
+
+@pytest.mark.parametrize("method", ["direct", "tree"])
+def test_one_charge_for_all_sources(method):
+    sources, _ = charge_cloud(30, 13)
+    points = np.random.default_rng(14).uniform(-3, 3, size=(20, 3))
+    func = as_field_function(sources, 2.0, method=method, theta=0)
+    np.testing.assert_allclose(func(points.T).T, direct_field(sources, np.full(30, 2.0), points), rtol=1e-9)
+
+
+def test_field_directions_fall_back_where_the_field_vanishes():
+    field = np.array([[3.0, 0.0, 4.0], [0.0, 0.0, 0.0]])
+    directions = field_directions(field, [0.0, 1.0, 0.0])
+    np.testing.assert_allclose(directions, [[0.6, 0.0, 0.8], [0.0, 1.0, 0.0]])
+
+
+def test_clear_of_sources_drops_points_on_charges():
+    sources = np.array([[0.0, -3.0, 0.0], [1.0, -3.0, 0.0], [0.0, 3.0, 0.0]])
+    points = np.array([[0.0, -3.0, 0.0], [0.0, -2.0, 0.0], [1.0, -3.0 + 1e-9, 0.0], [0.0, 3.0, 0.0], [0.5, 0.0, 0.0]])
+    np.testing.assert_array_equal(clear_of_sources(points, sources), [False, True, False, False, True])
+
+
+def test_clear_of_sources_without_sources_keeps_every_point():
+    assert clear_of_sources(np.zeros((4, 3)), np.zeros((0, 3))).all()
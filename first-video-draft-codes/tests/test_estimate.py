@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("manim")
+
+from estimate import DEFAULT_COSTS, estimate, new_play
+from frame_stream import BUFFER_COUNT
+
+COSTS = {"frame_ms_per_mpixel": 4.0, "mobject_ms": 0.05, "curve_ms": 0.004, "encode_ms_per_mpixel": 5.0,
+         "extra_mb": 10.0}
+
+
+def play(label, frames, drawn, mobjects, curves):
+    return {**new_play(label), "frames": frames, "drawn": drawn, "mobjects": mobjects, "curves": curves}
+
+
+def counts(**overrides):
+    return {
+        "pixels": 2_000_000,
+        "construct": play("construct", 1, 1, 10, 100),
+        "plays": [play("Create", 60, 60, 600, 6000), play("Wait", 30, 1, 20, 200)],
+        "dry_run_seconds": 2.0,
+        "peak_rss_mb": 150.0,
+        **overrides,
+    }
+
+
+def test_time_adds_drawing_and_encoding_to_the_dry_run():
+    seconds, _ = estimate(counts(), COSTS)
+    # 62 drawn frames of 2 megapixels, 630 mobjects and 6300 curves; 91 encoded frames
+    draw_ms = 62 * 4.0 * 2 + 630 * 0.05 + 6300 * 0.004
+    encode_ms = 91 * 5.0 * 2
+    assert seconds == pytest.approx(2.0 + (draw_ms + encode_ms) / 1000)
+
+
+def test_frozen_frames_are_encoded_but_not_drawn():
+    frozen = counts(plays=[play("Wait", 30, 1, 20, 200)])
+    redrawn = counts(plays=[play("Wait", 30, 30, 20, 200)])
+    difference = estimate(redrawn, COSTS)[0] - estimate(frozen, COSTS)[0]
+    assert difference == pytest.approx(29 * 4.0 * 2 / 1000)
+
+
+def test_memory_adds_the_frame_buffers():
+    _, peak_mb = estimate(counts(), COSTS)
+    assert peak_mb == pytest.approx(150.0 + BUFFER_COUNT * 2_000_000 * 4 / 1024 ** 2 + 10.0)
+
+
+def test_unknown_peak_memory_stays_unknown():
+    assert estimate(counts(peak_rss_mb=None), DEFAULT_COSTS)[1] is None
+
+
+def test_scene_without_plays_costs_its_construct():
+    seconds, _ = estimate(counts(plays=[]), COSTS)
+    assert seconds == pytest.approx(2.0 + (1 * 4.0 * 2 + 10 * 0.05 + 100 * 0.004 + 1 * 5.0 * 2) / 1000)
@@ -0,0 +1,60 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("manim")
+
+from instanced_arrows import gradient_rgbs, rotation_matrices
+
+
+def unit_rows(rows):
+    rows = np.asarray(rows, dtype=float)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+@pytest.mark.parametrize("source", [[1, 0, 0], [0, 0, 1], [0.3, -1.2, 0.5]])
+def test_rotations_take_source_onto_targets(source):
+    source = np.array(source, dtype=float)
+    targets = unit_rows(np.random.default_rng(1).normal(size=(50, 3)))
+    matrices = rotation_matrices(source, targets)
+    np.testing.assert_allclose(matrices @ (source / np.linalg.norm(source)), targets, atol=1e-12)
+
+
+def test_rotations_are_proper():
+    targets = unit_rows(np.random.default_rng(2).normal(size=(50, 3)))
+    matrices = rotation_matrices(np.array([0.0, 1.0, 0.0]), targets)
+    np.testing.assert_allclose(matrices @ matrices.transpose(0, 2, 1), np.broadcast_to(np.eye(3), matrices.shape), atol=1e-12)
+    np.testing.assert_allclose(np.linalg.det(matrices), 1, atol=1e-12)
+
+
+def test_targets_need_not_be_unit_length():
+    source = np.array([1.0, 0.0, 0.0])
+    targets = np.array([[0.0, 3.0, 0.0], [0.0, 0.0, 0.2]])
+    np.testing.assert_allclose(rotation_matrices(source, targets) @ source, unit_rows(targets), atol=1e-12)
+
+
+def test_same_direction_is_identity():
+    source = np.array([0.0, 0.0, 2.0])
+    matrices = rotation_matrices(source, np.array([[0.0, 0.0, 1.0]]))
+    np.testing.assert_allclose(matrices[0], np.eye(3), atol=1e-12)
+
+
+@pytest.mark.parametrize("source", [[1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1]])
+def test_opposite_direction_is_a_half_turn(source):
+    source = np.array(source, dtype=float)
+    (matrix,) = rotation_matrices(source, -source[None, :])
+    np.testing.assert_allclose(matrix @ source, -source, atol=1e-12)
+    np.testing.assert_allclose(matrix @ matrix.T, np.eye(3), atol=1e-12)
+    np.testing.assert_allclose(np.linalg.det(matrix), 1, atol=1e-12)
+
+
+@pytest.mark.parametrize("colors", [["#FC6255", "#58C4DD"], ["#FC6255", "#FFFF00", "#58C4DD"], ["#83C167"]])
+@pytest.mark.parametrize("length", [1, 2, 5, 9])
+def test_gradient_matches_color_gradient(colors, length):
+    from manim import color_gradient, color_to_rgb
+
+    expected = np.array([color_to_rgb(color) for color in color_gradient(colors, length)])
+    np.testing.assert_allclose(gradient_rgbs(colors, length), expected, atol=1e-12)
+
+
+def test_empty_gradient():
+    assert gradient_rgbs(["#FC6255", "#58C4DD"], 0).shape == (0, 3)
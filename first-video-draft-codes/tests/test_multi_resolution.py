@@ -0,0 +1,60 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("manim")
+
+from multi_resolution import area_resize
+
+
+def reference_resize(frame, height, width):
+    """Area average by explicit overlaps of every output pixel with every input pixel"""
+
+    def weights(count, size):
+        edges = np.linspace(0, count, size + 1)
+        overlaps = np.zeros((size, count))
+        for out in range(size):
+            for pixel in range(count):
+                overlaps[out, pixel] = max(0.0, min(edges[out + 1], pixel + 1) - max(edges[out], pixel))
+        return overlaps / overlaps.sum(axis=1, keepdims=True)
+
+    rows, columns = weights(frame.shape[0], height), weights(frame.shape[1], width)
+    values = np.einsum("ip,jq,pqc->ijc", rows, columns, frame.astype(float))
+    return np.clip(values + 0.5, 0, 255).astype(np.uint8)
+
+
+def random_frame(height, width, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+
+
+def test_same_size_is_unchanged():
+    frame = random_frame(9, 16)
+    np.testing.assert_array_equal(area_resize(frame, 9, 16), frame)
+
+
+def test_integer_factor_averages_blocks():
+    frame = random_frame(8, 12)
+    expected = frame.astype(float).reshape(4, 2, 4, 3, 4).mean(axis=(1, 3))
+    np.testing.assert_array_equal(area_resize(frame, 4, 4), np.clip(expected + 0.5, 0, 255).astype(np.uint8))
+
+
+@pytest.mark.parametrize("shape", [(6, 10), (5, 7), (4, 9), (7, 3)])
+def test_fractional_factor_matches_overlap_weights(shape):
+    frame = random_frame(18, 32, seed=1)
+    result = area_resize(frame, *shape)
+    assert result.shape == (*shape, 4)
+    assert result.dtype == np.uint8
+    # float32 sums may round a half-way value the other way
+    difference = result.astype(int) - reference_resize(frame, *shape).astype(int)
+    assert np.abs(difference).max() <= 1
+
+
+def test_constant_frame_stays_constant():
+    frame = np.full((1080, 1920, 4), [12, 200, 99, 255], dtype=np.uint8)
+    result = area_resize(frame, 480, 854)
+    assert np.all(result == [12, 200, 99, 255])
+
+
+def test_mean_brightness_is_kept():
+    frame = random_frame(360, 640, seed=2)
+    result = area_resize(frame, 240, 427)
+    np.testing.assert_allclose(result.reshape(-1, 4).mean(axis=0), frame.reshape(-1, 4).mean(axis=0), atol=0.6)
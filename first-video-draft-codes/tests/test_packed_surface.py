@@ -0,0 +1,86 @@
+import math
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+manim = pytest.importorskip("manim")
+
+import packed_surface
+from packed_surface import adaptive_tessellate, cached_tessellation, grid_cells, tessellate, uv_values
+
+
+def bowl(u, v):
+    return np.array([u, v, u ** 2 + 0.5 * v ** 2])
+
+
+def wave(u, v):
+    return np.array([np.cos(u) * (2 + np.sin(v)), np.sin(u) * (2 + np.sin(v)), np.cos(v)])
+
+
+def scalar_wave(u, v):
+    # Only works on one point at a time, like many hand-written surface functions
+    return np.array([math.cos(u) * (2 + math.sin(v)), math.sin(u) * (2 + math.sin(v)), math.cos(v)])
+
+
+@pytest.mark.parametrize("func", [wave, scalar_wave])
+@pytest.mark.parametrize("resolution", [5, (6, 3)])
+def test_tessellate_matches_surface(func, resolution):
+    u_range, v_range = [0, 2 * np.pi], [-1, 1.5]
+    surface = manim.Surface(func, u_range=u_range, v_range=v_range, resolution=resolution)
+    points, cells = tessellate(func, u_range, v_range, resolution)
+    faces = surface.submobjects
+    assert points.shape == (len(faces), 16, 3)
+    for face, face_points, cell in zip(faces, points, cells):
+        np.testing.assert_allclose(cell, [face.u1, face.u2, face.v1, face.v2])
+        # Anchors are the same function values; handles go through the same 1e-5 pull-in
+        np.testing.assert_allclose(face_points[::4], face.points[::4], atol=1e-12)
+        np.testing.assert_allclose(face_points, face.points, atol=1e-6)
+
+
+def test_adaptive_flat_surface_stays_coarse():
+    def plane(u, v):
+        return np.array([u, v, 0.3 * u - 0.2 * v])
+
+    points, cells = adaptive_tessellate(plane, [-2, 2], [-2, 2], 16, max_depth=2)
+    np.testing.assert_allclose(cells, grid_cells(*uv_values([-2, 2], [-2, 2], 4)))
+    assert points.shape == (16, 16, 3)
+
+
+def test_fully_refined_adaptive_tessellation_is_the_uniform_grid():
+    points, cells = adaptive_tessellate(bowl, [-1, 1], [-1, 1], 8, face_budget=10 ** 6, tolerance=0, max_depth=3)
+    uniform_points, uniform_cells = tessellate(bowl, [-1, 1], [-1, 1], 8)
+    np.testing.assert_allclose(cells, uniform_cells, atol=1e-12)
+    np.testing.assert_allclose(points, uniform_points, atol=1e-6)
+
+
+def test_adaptive_tessellation_keeps_the_face_budget_and_covers_the_range():
+    points, cells = adaptive_tessellate(wave, [0, 2 * np.pi], [-1, 1], 32, face_budget=40, tolerance=0)
+    assert len(cells) <= 40
+    assert len(points) == len(cells)
+    areas = (cells[:, 1] - cells[:, 0]) * (cells[:, 3] - cells[:, 2])
+    assert areas.sum() == pytest.approx(2 * np.pi * 2)
+
+
+def test_disk_cache_keeps_its_size_bound(tmp_path, monkeypatch):
+    monkeypatch.setenv("MANIM_SURFACE_CACHE", str(tmp_path))
+    monkeypatch.setattr(packed_surface, "_tessellations", {})
+    cached_tessellation(bowl, [-1, 1], [-1, 1], 10)
+    (entry,) = tmp_path.glob("*.npz")
+    os.utime(entry, (1000, 1000))
+    # Room for two 10x10 tessellations, not three
+    monkeypatch.setenv("MANIM_SURFACE_CACHE_MAX_MB", str(2.5 * entry.stat().st_size / 1024 ** 2))
+    cached_tessellation(bowl, [-1, 1], [-1, 2], 10)
+    cached_tessellation(bowl, [-1, 1], [-1, 3], 10)
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+    assert not entry.exists()
+
+
+def test_disk_cache_serves_the_same_points(tmp_path, monkeypatch):
+    monkeypatch.setenv("MANIM_SURFACE_CACHE", str(tmp_path))
+    monkeypatch.setattr(packed_surface, "_tessellations", {})
+    points, cells = cached_tessellation(bowl, [-1, 1], [-1, 1], 6)
+    monkeypatch.setattr(packed_surface, "_tessellations", {})
+    cached_points, cached_cells = cached_tessellation(bowl, [-1, 1], [-1, 1], 6)
+    np.testing.assert_array_equal(cached_points, points)
+    np.testing.assert_array_equal(cached_cells, cells)
@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from render_split import split_ranges
+
+
+def assert_covers(ranges, count):
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == count - 1
+    for (_, last), (first, _) in zip(ranges, ranges[1:]):
+        assert first == last + 1
+    assert all(first <= last for first, last in ranges)
+    # manim treats an upper bound of 0 in `-n first,last` as no bound at all
+    assert all(last > 0 for _, last in ranges) or ranges == [(0, 0)]
+
+
+def test_equal_durations_split_evenly():
+    assert split_ranges([1.0] * 8, 4) == [(0, 1), (2, 3), (4, 5), (6, 7)]
+
+
+@pytest.mark.parametrize("parts", [2, 3, 8])
+def test_first_play_never_ends_a_range(parts):
+    durations = [5.0, 1.0, 1.0, 1.0, 1.0, 1.0]
+    ranges = split_ranges(durations, parts)
+    assert ranges[0] == (0, 1)
+    assert_covers(ranges, len(durations))
+
+
+def test_one_part_is_the_whole_scene():
+    assert split_ranges([0.5, 2.0, 1.0], 1) == [(0, 2)]
+
+
+def test_single_play_scene():
+    assert split_ranges([3.0], 4) == [(0, 0)]
+
+
+def test_more_parts_than_plays():
+    assert split_ranges([1.0, 1.0, 1.0], 8) == [(0, 1), (2, 2)]
+
+
+@pytest.mark.parametrize("durations", [[1.0, 1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 2.0, 0.0, 1.0, 0.0]])
+def test_zero_length_calls_never_add_a_range(durations):
+    ranges = split_ranges(durations, 2)
+    assert len(ranges) <= 2
+    assert_covers(ranges, len(durations))
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 5, 8])
+def test_ranges_cover_every_play_in_order(parts):
+    durations = [0.3, 2.0, 1.0, 0.0, 4.5, 1.0, 1.0, 0.2, 3.0, 1.0, 0.7]
+    ranges = split_ranges(durations, parts)
+    assert len(ranges) <= parts
+    assert_covers(ranges, len(durations))
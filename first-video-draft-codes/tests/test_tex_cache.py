@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("manim")
+
+from tex_cache import TexStore
+
+
+def glyphs(seed):
+    rng = np.random.default_rng(seed)
+    return [(rng.random((8, 3)), rng.random((1, 4)), rng.random((1, 4)), 4.0) for _ in range(3)]
+
+
+def entry_size(store, key):
+    return store._path(key).stat().st_size
+
+
+def test_put_then_get_returns_the_glyphs(tmp_path):
+    store = TexStore(tmp_path)
+    stored = glyphs(0)
+    store.put("ab12", stored)
+    loaded = store.get("ab12")
+    assert len(loaded) == len(stored)
+    for (points, fill, stroke, width), expected in zip(loaded, stored):
+        np.testing.assert_array_equal(points, expected[0])
+        np.testing.assert_array_equal(fill, expected[1])
+        np.testing.assert_array_equal(stroke, expected[2])
+        assert width == expected[3]
+
+
+def test_missing_key_is_none(tmp_path):
+    assert TexStore(tmp_path).get("cd34") is None
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    store = TexStore(tmp_path, max_bytes=10 ** 9)
+    for age, key in enumerate(["aa01", "bb02", "cc03"]):
+        store.put(key, glyphs(0))
+        os.utime(store._path(key), (1000 + age, 1000 + age))
+    # Reading aa01 makes bb02 the least recently used entry
+    store.get("aa01")
+    store.max_bytes = 2.5 * entry_size(store, "aa01")
+    store.evict()
+    assert "aa01" in store
+    assert "bb02" not in store
+    assert "cc03" in store
+
+
+def test_put_over_the_bound_evicts(tmp_path):
+    store = TexStore(tmp_path, max_bytes=10 ** 9)
+    store.put("aa01", glyphs(0))
+    os.utime(store._path("aa01"), (1000, 1000))
+    store.max_bytes = 1.5 * entry_size(store, "aa01")
+    store.put("bb02", glyphs(0))
+    assert "aa01" not in store
+    assert "bb02" in store
+
+
+def test_overwriting_an_entry_does_not_count_it_twice(tmp_path):
+    store = TexStore(tmp_path, max_bytes=10 ** 9)
+    store.put("aa01", glyphs(0))
+    store.max_bytes = 2.5 * entry_size(store, "aa01")
+    store.put("bb02", glyphs(0))
+    for _ in range(5):
+        store.put("aa01", glyphs(0))
+    assert "aa01" in store
+    assert "bb02" in store
+
+
+def test_read_only_store_writes_nothing(tmp_path):
+    store = TexStore(tmp_path / "store", read_only=True)
+    store.put("aa01", glyphs(0))
+    assert "aa01" not in store
+    assert not (tmp_path / "store").exists()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+# Batched LaTeX pre-pass for a scene.
+#
+# Every MathTex normally costs its own latex + dvisvgm launch. This script runs a
+# scene's construct() once without rendering, records every TeX document the scene
+# asks for, typesets all of them in one multi-page LaTeX run and splits the result
+# back into one SVG per expression. The SVGs are written into manim's tex folder
+# under the same hash manim uses, so the real render finds them all cached.
+#
+# Usage (from this folder):
+#   python tex_batch.py cross_product_ab.py VectorCrossProductAB
+#   manim -pqh cross_product_ab.py VectorCrossProductAB
+#
+# Expressions that only appear mid-animation (always_redraw values between the
+# start and end of a play) are not seen by the pre-pass and still compile lazily.
+
+import argparse
+import subprocess
+import tempfile
+from pathlib import Path
+
+from manim import config, logger, tempconfig
+from manim.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+from manim.mobject.text import tex_mobject
+from manim.utils import tex_file_writing
+from manim.utils.tex_file_writing import tex_hash
+
+from scene_loader import load_scenes
+from tex_cache import has_tex
+
+# At most 999: page files are named with three digits
+PAGES_PER_RUN = 200
+PAGE_ENVIRONMENT = "manimpage"
+PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10" viewBox="0 0 10 10">'
+    '<path d="M0 0 H10 V10 H0 Z"/></svg>'
+)
+
+
+def tex_dir():
+    path = config.get_dir("tex_dir")
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def tex_code(expression, environment=None, tex_template=None):
+    """The full .tex document manim would write for this expression"""
+    tex_template = tex_template or config["tex_template"]
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+def cached_svg_path(code):
+    return tex_dir() / (tex_hash(code) + ".svg")
+
+
+def placeholder_svg():
+    # Kept out of the tex folder so nothing mistakes it for typeset output
+    path = Path(tempfile.gettempdir()) / "tex_batch_placeholder.svg"
+    if not path.exists():
+        path.write_text(PLACEHOLDER_SVG, encoding="utf-8")
+    return path
+
+
+def collect_tex(scene_class):
+    """Run construct() without rendering and return {tex code: (expression, environment, template)}"""
+    requests = {}
+
+    def record(expression, environment=None, tex_template=None):
+        tex_template = tex_template or config["tex_template"]
+        code = tex_code(expression, environment, tex_template)
+        svg_file = cached_svg_path(code)
+        if svg_file.exists() or has_tex(svg_file):
+            return svg_file
+        requests.setdefault(code, (expression, environment, tex_template))
+        return placeholder_svg()
+
+    original = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = record
+    try:
+        with tempconfig({"dry_run": True}):
+            scene_class(skip_animations=True).render()
+    except Exception as error:
+        # Placeholder glyphs can upset layout code; keep whatever was recorded
+        logger.warning(f"TeX pre-pass of {scene_class.__name__} stopped early: {error!r}")
+    finally:
+        tex_mobject.tex_to_svg_file = original
+        # The placeholder must not leak into a real render in this process
+        SVG_HASH_TO_MOB_MAP.clear()
+    return requests
+
+
+def _split_document(code):
+    preamble, _, rest = code.partition(r"\begin{document}")
+    body, _, _ = rest.partition(r"\end{document}")
+    return preamble, body
+
+
+def _multi_page_preamble(preamble):
+    """Turn the standalone documentclass into multi-page mode, or None if that isn't possible"""
+    head, marker, tail = preamble.partition("{standalone}")
+    if not marker or r"\documentclass" not in head:
+        return None
+    if head.rstrip().endswith("]"):
+        head = head.rstrip()[:-1] + f",multi={PAGE_ENVIRONMENT}]"
+    else:
+        head = head + f"[multi={PAGE_ENVIRONMENT}]"
+    return head + marker + tail + "\n" + rf"\newenvironment{{{PAGE_ENVIRONMENT}}}{{}}{{}}" + "\n"
+
+
+def _compile_pages(preamble, codes, tex_template):
+    """Typeset all documents sharing a preamble in one run and split them into cached SVGs"""
+    pages = [
+        rf"\begin{{{PAGE_ENVIRONMENT}}}" + _split_document(code)[1] + rf"\end{{{PAGE_ENVIRONMENT}}}"
+        for code in codes
+    ]
+    document = preamble + "\\begin{document}\n" + "\n".join(pages) + "\n\\end{document}\n"
+    batch_name = "batch_" + tex_hash(document)
+    batch_file = tex_dir() / (batch_name + ".tex")
+    batch_file.write_text(document, encoding="utf-8")
+
+    compiler = tex_template.tex_compiler
+    command = [compiler, "-interaction=batchmode", "-halt-on-error", f"-output-directory={tex_dir()}"]
+    if compiler == "xelatex":
+        command.append("-no-pdf")
+    subprocess.run(command + [str(batch_file)], check=True, stdout=subprocess.DEVNULL)
+
+    dvi_file = batch_file.with_suffix(tex_template.output_format)
+    # A plain %p is zero-padded to the width of the page count; a fixed width keeps the names predictable
+    page_pattern = tex_dir() / (batch_name + "-%3p.svg")
+    subprocess.run(
+        ["dvisvgm", str(dvi_file), "--page=1-", "-n", "-v", "0", "-o", str(page_pattern)],
+        check=True, stdout=subprocess.DEVNULL,
+    )
+    for page_number, code in enumerate(codes, start=1):
+        page_file = tex_dir() / f"{batch_name}-{page_number:03d}.svg"
+        page_file.replace(cached_svg_path(code))
+
+
+def compile_batched(requests):
+    """Compile recorded expressions with one LaTeX run per preamble (and per PAGES_PER_RUN pages)"""
+    groups = {}
+    for code in requests:
+        preamble = _multi_page_preamble(_split_document(code)[0])
+        groups.setdefault(preamble, []).append(code)
+
+    for preamble, codes in groups.items():
+        tex_template = requests[codes[0]][2]
+        if preamble is None or tex_template.output_format == ".pdf":
+            _compile_one_by_one(codes, requests)
+            continue
+        for start in range(0, len(codes), PAGES_PER_RUN):
+            chunk = codes[start:start + PAGES_PER_RUN]
+            try:
+                _compile_pages(preamble, chunk, tex_template)
+            except (subprocess.CalledProcessError, FileNotFoundError) as error:
+                # One bad expression halts the whole run; let manim report it precisely
+                logger.warning(f"Batched TeX run failed ({error}), compiling {len(chunk)} expressions one by one")
+                _compile_one_by_one(chunk, requests)
+
+
+def _compile_one_by_one(codes, requests):
+    for code in codes:
+        expression, environment, tex_template = requests[code]
+        tex_file_writing.tex_to_svg_file(expression, environment=environment, tex_template=tex_template)
+
+
+def prewarm_scene(scene_class):
+    """Make sure every TeX expression the scene builds up front is already typeset"""
+    requests = collect_tex(scene_class)
+    if requests:
+        logger.info(f"{scene_class.__name__}: typesetting {len(requests)} TeX expressions in one pass")
+        compile_batched(requests)
+    return len(requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Typeset all TeX of a scene in one batched LaTeX run.")
+    parser.add_argument("file", help="scene file, e.g. cross_product_ab.py")
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: every scene in the file)")
+    args = parser.parse_args()
+    for scene_class in load_scenes(Path(args.file), args.scenes):
+        prewarm_scene(scene_class)
+
+
+if __name__ == "__main__":
+    main()
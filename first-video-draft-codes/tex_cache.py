@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+
+# Persistent, content-addressed store of typeset TeX.
+#
+# manim already skips latex when media/Tex/<hash>.svg exists, but it still parses
+# that SVG into bezier paths in every process, and the cache lives per project
+# folder. This store keeps the *parsed* point arrays of every MathTex, keyed by the
+# full .tex document (expression + template preamble, so font packages are part of
+# the key) and the manim version, in one folder that every scene and machine can
+# share. On a hit neither latex, dvisvgm nor the SVG parser runs.
+#
+# Settings (environment variables):
+#   MANIM_TEX_STORE            store folder (default: ~/.cache/manim-tex-store)
+#   MANIM_TEX_STORE_MAX_MB     size bound, least recently used entries are evicted (default: 512)
+#   MANIM_TEX_STORE_READ_ONLY  "1" to only read, e.g. a render box shipped with a pre-warmed store
+#
+# Scenes enable it through render_setup.install_all(), which calls install_tex_cache().
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from manim import VMobject, __version__, config
+from manim.mobject.svg.svg_mobject import SVGMobject
+from manim.mobject.text import tex_mobject
+from manim.mobject.text.tex_mobject import SingleStringMathTex
+from manim.utils.tex_file_writing import tex_hash
+
+DEFAULT_STORE = Path.home() / ".cache" / "manim-tex-store"
+
+
+class TexStore:
+    def __init__(self, root, max_bytes=512 * 1024 ** 2, read_only=False):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.read_only = read_only
+        self._size = None
+        if not read_only:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(tex_file_hash):
+        """Content address of one typeset document (tex_hash of the full .tex source)"""
+        return hashlib.sha256(f"{tex_file_hash}|manim-{__version__}".encode()).hexdigest()
+
+    def _path(self, key):
+        return self.root / key[:2] / (key + ".npz")
+
+    def __contains__(self, key):
+        return self._path(key).exists()
+
+    def get(self, key):
+        """List of (points, fill_rgbas, stroke_rgbas, stroke_width) per glyph, or None"""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                count = int(data["count"])
+                glyphs = [
+                    (data[f"points_{i}"], data[f"fill_{i}"], data[f"stroke_{i}"], float(data["stroke_widths"][i]))
+                    for i in range(count)
+                ]
+        except (OSError, KeyError, ValueError):
+            return None
+        if not self.read_only:
+            # Touch for LRU eviction
+            os.utime(path)
+        return glyphs
+
+    def put(self, key, glyphs):
+        if self.read_only:
+            return
+        arrays = {"count": np.array(len(glyphs)), "stroke_widths": np.array([g[3] for g in glyphs], dtype=float)}
+        for i, (points, fill, stroke, _) in enumerate(glyphs):
+            arrays[f"points_{i}"] = points
+            arrays[f"fill_{i}"] = fill
+            arrays[f"stroke_{i}"] = stroke
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        # Write then rename, so readers on other processes/machines never see half a file
+        handle, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(handle, "wb") as temp_file:
+            np.savez(temp_file, **arrays)
+        try:
+            # Overwriting an entry only adds the difference in size
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(temp_name, path)
+        self._grow(path.stat().st_size - replaced)
+
+    def _entries(self):
+        return list(self.root.glob("*/*.npz"))
+
+    def _grow(self, added):
+        if self._size is None:
+            self._size = sum(entry.stat().st_size for entry in self._entries())
+        else:
+            self._size += added
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Drop least recently used entries until the store is at 90% of its bound"""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort()
+        size = sum(item[1] for item in entries)
+        for _, entry_size, entry in entries:
+            if size <= 0.9 * self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
+
+
+_store = None
+_original_tex_to_svg_file = tex_mobject.tex_to_svg_file
+_original_generate_mobject = SVGMobject.generate_mobject
+
+
+def get_store():
+    return _store
+
+
+def has_tex(svg_file):
+    """Whether the store already holds the typeset result for a media/Tex/<hash>.svg path"""
+    return _store is not None and TexStore.key(Path(svg_file).stem) in _store
+
+
+def _tex_to_svg_file(expression, environment=None, tex_template=None):
+    tex_template = tex_template or config["tex_template"]
+    if environment is not None:
+        code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+    else:
+        code = tex_template.get_texcode_for_expression(expression)
+    svg_file = config.get_dir("tex_dir") / (tex_hash(code) + ".svg")
+    if has_tex(svg_file):
+        # generate_mobject below reads the glyphs from the store, the file itself is not needed
+        return svg_file
+    return _original_tex_to_svg_file(expression, environment=environment, tex_template=tex_template)
+
+
+def _generate_mobject(self):
+    is_typeset_tex = (
+        isinstance(self, SingleStringMathTex)
+        and Path(self.file_name).parent.resolve() == config.get_dir("tex_dir").resolve()
+    )
+    if _store is None or not is_typeset_tex:
+        return _original_generate_mobject(self)
+    key = TexStore.key(Path(self.file_name).stem)
+    glyphs = _store.get(key)
+    if glyphs is not None:
+        for points, fill, stroke, stroke_width in glyphs:
+            glyph = VMobject()
+            glyph.set_points(points)
+            glyph.fill_rgbas = fill
+            glyph.stroke_rgbas = stroke
+            glyph.stroke_width = stroke_width
+            self.add(glyph)
+        return
+    _original_generate_mobject(self)
+    _store.put(key, [
+        (glyph.points.copy(), glyph.fill_rgbas.copy(), glyph.stroke_rgbas.copy(), glyph.stroke_width)
+        for glyph in self.submobjects
+    ])
+
+
+def install_tex_cache(root=None, max_mb=None, read_only=None):
+    """Route every MathTex through the shared store (arguments override the environment)"""
+    global _store
+    root = root or os.environ.get("MANIM_TEX_STORE") or DEFAULT_STORE
+    if max_mb is None:
+        max_mb = float(os.environ.get("MANIM_TEX_STORE_MAX_MB", 512))
+    if read_only is None:
+        read_only = os.environ.get("MANIM_TEX_STORE_READ_ONLY", "") not in ("", "0")
+    _store = TexStore(root, max_bytes=int(max_mb * 1024 ** 2), read_only=read_only)
+    tex_mobject.tex_to_svg_file = _tex_to_svg_file
+    SVGMobject.generate_mobject = _generate_mobject
+    return _store
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# Updaters that move a mobject rigidly without rebuilding it.
+#
+# The rotating vectors were driven with
+#   vec.add_updater(lambda vec: vec.become(vec_copy.copy().rotate(theta * DEGREES, about_point=origin)))
+# which deep-copies the arrow (every submobject, every array) and then copies it
+# again into vec on every frame. add_transform_updater keeps the mobject's geometry
+# at binding time as its base and, every frame, writes matrix @ base + offset
+# straight into the point arrays the mobject already has. No mobject is created and
+# no array is allocated.
+#
+#   add_transform_updater(vector_b, lambda: rotation(theta_tracker.get_value() * DEGREES, about_point=plane.get_origin()))
+#   label_center = label.get_center()
+#   add_transform_updater(label, lambda: orbit(theta_tracker.get_value() * DEGREES, label_center, about_point=...))
+#
+# The transform function returns a (3x3 matrix, offset) pair; rotation() and orbit()
+# build the two the scenes need. Style is left alone, like become() from an
+# unchanged copy would leave it.
+
+import numpy as np
+from manim import *
+
+
+def rotation(angle, axis=OUT, about_point=ORIGIN):
+    """(matrix, offset) of Mobject.rotate(angle, axis, about_point=about_point)"""
+    matrix = rotation_matrix(angle, axis)
+    about_point = np.asarray(about_point, dtype=float)
+    return matrix, about_point - matrix @ about_point
+
+
+def orbit(angle, point, axis=OUT, about_point=ORIGIN):
+    """(matrix, offset) carrying point around about_point without turning the mobject,
+    i.e. .rotate(angle, about_point=about_point).rotate(-angle) on a mobject centred at point"""
+    point = np.asarray(point, dtype=float)
+    about_point = np.asarray(about_point, dtype=float)
+    return np.eye(3), rotation_matrix(angle, axis) @ (point - about_point) + about_point - point
+
+
+def add_transform_updater(mob, transform):
+    """Every frame, set mob's points to transform()'s matrix and offset applied to its current points"""
+    members = mob.family_members_with_points()
+    base = [member.points.copy() for member in members]
+
+    def update(_):
+        matrix, offset = transform()
+        for member, points in zip(members, base):
+            if member.points.shape != points.shape:
+                # An animation swapped the array out; allocate once and write in place again afterwards
+                member.points = np.empty_like(points)
+            np.matmul(points, matrix.T, out=member.points)
+            member.points += offset
+
+    mob.add_updater(update)
+    return mob
@@ -1,10 +1,17 @@
 from manim import *
 import numpy as np
+from render_setup import install_all
+from cached_redraw import always_redraw
+from checkpoints import checkpoint
+from instanced_arrows import InstancedArrows
+from coulomb_field import charge_sources, clear_of_sources, field_directions, superposition_field
 from manim_physics import *
 import time
 
 # Set background color
 config.background_color = ManimColor("#030303")
+# Render speed-ups and tools shared by every scene (see render_setup.py)
+install_all()
 
 class UniformElectricField3D(ThreeDScene):
     MathTex.set_default(font_size=42)
@@ -145,14 +152,15 @@ class UniformElectricField3D(ThreeDScene):
         self.wait(2)
         
         # Generate all field vectors in a VGroup for efficient rendering
-        field_vectors = VGroup()
-        for x in x_range:
-            for y in y_range:
-                for z in z_range:
-                    start_point = np.array([x, y, z])
-                    end_point = start_point + field_direction * field_length
-                    field_vector = Arrow(start=start_point, end=end_point, color=WHITE).scale(scale_factor).rotate(PI/2, axis=UP)
-                    field_vectors.add(field_vector)
+        # One template arrow, placed at every grid point in a single array operation
+        field_vector = Arrow(start=ORIGIN, end=field_direction * field_length, color=WHITE).scale(scale_factor).rotate(PI/2, axis=UP)
+        grid_points = np.array([[x, y, z] for x in x_range for y in y_range for z in z_range])
+        # Point every arrow along the field the plate charges actually produce (see coulomb_field.py)
+        sources, charges = charge_sources(plus_charges, minus_charges)
+        # The grid's outer layer lies on the positive plate, where the field is undefined
+        grid_points = grid_points[clear_of_sources(grid_points, sources)]
+        field = superposition_field(sources, charges, grid_points)
+        field_vectors = InstancedArrows(field_vector, anchors=grid_points, directions=field_directions(field, field_direction))
                     
         self.play(Create(field_vectors), rate_func=smooth, run_time=1.5)
         self.wait(2)
@@ -182,6 +190,8 @@ class UniformElectricField3D(ThreeDScene):
         plus_charge = Charge(1).rotate(PI/2, axis=RIGHT)
         minus_charge = Charge(-1).rotate(PI/2, axis=RIGHT)
         
+        # Resume point for editing Act 2 alone (see checkpoints.py)
+        checkpoint(self, "act2")
         # Create the description box with the desired text
         description2 = self.create_description_box(r"\text{Act 2: Release charged particles from \textit{rest}.").scale(0.9)
         
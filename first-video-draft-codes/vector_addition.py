@@ -1,8 +1,12 @@
 from manim import *
 import numpy as np
+from render_setup import install_all
+from cached_redraw import always_redraw
 
 # Set background color
 config.background_color = ManimColor("#030303")
+# Render speed-ups and tools shared by every scene (see render_setup.py)
+install_all()
 
 class VectorsIn2D(Scene):
     MathTex.set_default(font_size=32)
@@ -2,9 +2,14 @@
 
 from manim import *
 import numpy as np
+from batched_fields import FieldMorph, GridArrowVectorField
+from render_setup import install_all
+from cached_redraw import always_redraw
 
 # Set background color
 config.background_color = ManimColor("#030303")
+# Render speed-ups and tools shared by every scene (see render_setup.py)
+install_all()
 
 class VectorField3DTransform(ThreeDScene):
     def construct(self):
@@ -49,27 +54,27 @@ class VectorField3DTransform(ThreeDScene):
         # Define new vector field functions with their corresponding labels and colors
         functions_2D = [
             {
-                "func": lambda pos: np.array([-pos[1], pos[0], 0]),  # Rotation around the origin
+                "func": lambda pos: np.array([-pos[1], pos[0], np.zeros_like(pos[0])]),  # Rotation around the origin
                 "label": r"\vec{F}(x, y) = -y\hat{i} + x\hat{j}",
                 "color": [RED, PURPLE],
             },
             {
-                "func": lambda pos: np.array([pos[0] * np.sin(pos[1]), pos[1] * np.cos(pos[0]), 0]),  # Sin-Cos pattern
+                "func": lambda pos: np.array([pos[0] * np.sin(pos[1]), pos[1] * np.cos(pos[0]), np.zeros_like(pos[0])]),  # Sin-Cos pattern
                 "label": r"\vec{F}(x, y) = x\sin(y)\hat{i} + y\cos(x)\hat{j}",
                 "color": [YELLOW, BLUE],
             },
             {
-                "func": lambda pos: np.array([np.exp(-pos[0]**2), np.exp(-pos[1]**2), 0]),  # Gaussian decay
+                "func": lambda pos: np.array([np.exp(-pos[0]**2), np.exp(-pos[1]**2), np.zeros_like(pos[0])]),  # Gaussian decay
                 "label": r"\vec{F}(x, y) = e^{-x^2}\hat{i} + e^{-y^2}\hat{j}",
                 "color": [GREEN, ORANGE],
             },
             {
-                "func": lambda pos: np.array([np.tan(pos[0]), np.tan(pos[1]), 0]),  # Tangent field
+                "func": lambda pos: np.array([np.tan(pos[0]), np.tan(pos[1]), np.zeros_like(pos[0])]),  # Tangent field
                 "label": r"\vec{F}(x, y) = \tan(x)\hat{i} + \tan(y)\hat{j}",
                 "color": [BLUE, RED],
             },
             {
-                "func": lambda pos: np.array([np.sin(pos[0] * pos[1]), np.cos(pos[0] + pos[1]), 0]),  # Mixed sin-cos pattern
+                "func": lambda pos: np.array([np.sin(pos[0] * pos[1]), np.cos(pos[0] + pos[1]), np.zeros_like(pos[0])]),  # Mixed sin-cos pattern
                 "label": r"\vec{F}(x, y) = \sin(xy)\hat{i} + \cos(x + y)\hat{j}",
                 "color": [PURPLE, YELLOW],
             },
@@ -77,7 +82,7 @@ class VectorField3DTransform(ThreeDScene):
     
         # Create the initial vector field and label
         initial_field_data = functions_2D[0]
-        vector_field_2D = ArrowVectorField(
+        vector_field_2D = GridArrowVectorField(
             initial_field_data["func"],
             colors=initial_field_data["color"],
             x_range=[-3, 3],
@@ -93,7 +98,7 @@ class VectorField3DTransform(ThreeDScene):
 
         # Iterate through the remaining fun vector field functions
         for field_data in functions_2D[1:]:
-            new_vector_field_2D = ArrowVectorField(
+            new_vector_field_2D = GridArrowVectorField(
                 field_data["func"],
                 colors=field_data["color"],
                 x_range=[-3, 3],
@@ -103,7 +108,7 @@ class VectorField3DTransform(ThreeDScene):
             new_label = MathTex(field_data["label"]).move_to(RIGHT * 0 + UP * -4.0 + OUT * 0).set_color_by_gradient(*field_data["color"])
 
             self.play(
-                Transform(vector_field_2D, new_vector_field_2D),
+                FieldMorph(vector_field_2D, new_vector_field_2D),
                 Transform(label, new_label),
                 run_time=3,
             )
@@ -134,7 +139,7 @@ class VectorField3DTransform(ThreeDScene):
         self.play(Create(axes_3D), Write(x_label), Write(y_label), Write(z_label), run_time=1.0, rate_func=smooth)
         
         # Vector Field 1: Rotation in 3D Space
-        vector_field_1 = ArrowVectorField(
+        vector_field_1 = GridArrowVectorField(
             lambda pos: np.array([-pos[1], pos[0], pos[2]]),
             colors=[RED, PURPLE],
             x_range=[-3, 3, 0.75],
@@ -144,7 +149,7 @@ class VectorField3DTransform(ThreeDScene):
         )
         
         # Vector Field 2: Sin-Cos Field in 3D
-        vector_field_2 = ArrowVectorField(
+        vector_field_2 = GridArrowVectorField(
             lambda pos: np.array([np.sin(pos[0]), np.cos(pos[1]), np.sin(pos[2])]),
             colors=[YELLOW, GREEN],
             x_range=[-3, 3, 0.75],
@@ -154,7 +159,7 @@ class VectorField3DTransform(ThreeDScene):
         )
         
         # Vector Field 3: Complex Scaling Field
-        vector_field_3 = ArrowVectorField(
+        vector_field_3 = GridArrowVectorField(
             lambda pos: np.array([pos[0] * np.sin(pos[1]), pos[1] * np.cos(pos[2]), pos[2] * np.sin(pos[0])]),
             colors=[BLUE, ORANGE],
             x_range=[-3, 3, 0.75],
@@ -164,7 +169,7 @@ class VectorField3DTransform(ThreeDScene):
         )
         
         # Vector Field 4: Gaussian Decay Field
-        vector_field_4 = ArrowVectorField(
+        vector_field_4 = GridArrowVectorField(
             lambda pos: np.array([np.exp(-pos[0]**2), np.exp(-pos[1]**2), np.exp(-pos[2]**2)]),
             colors=[GREEN, PINK],
             x_range=[-3, 3, 0.75],
@@ -174,7 +179,7 @@ class VectorField3DTransform(ThreeDScene):
         )
         
         # Vector Field 5: Tangent Field in 3D
-        vector_field_5 = ArrowVectorField(
+        vector_field_5 = GridArrowVectorField(
             lambda pos: np.array([np.tan(pos[0]), np.tan(pos[1]), np.tan(pos[2])]),
             colors=[PURPLE, YELLOW],
             x_range=[-3, 3, 0.75],
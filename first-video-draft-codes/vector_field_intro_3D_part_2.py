@@ -2,9 +2,14 @@
 
 from manim import *
 import numpy as np
+from batched_fields import FieldMorph, GridArrowVectorField
+from render_setup import install_all
+from cached_redraw import always_redraw
 
 # Set background color
 config.background_color = ManimColor("#030303")
+# Render speed-ups and tools shared by every scene (see render_setup.py)
+install_all()
 
 class VectorField3DTransform(ThreeDScene):
 	def construct(self):
@@ -39,7 +44,7 @@ class VectorField3DTransform(ThreeDScene):
 		z_label = always_redraw(lambda: MathTex("z").next_to(axes_3D.z_axis.get_end(), UP*0.75, buff=0.2).rotate(PI/2, axis=RIGHT))
 		
 		# Vector Field 1: Rotation in 3D Space
-		vector_field_1 = ArrowVectorField(
+		vector_field_1 = GridArrowVectorField(
 			lambda pos: np.array([-pos[1], pos[0], pos[2]]),
 			colors=[RED, PURPLE],
 			x_range=[-3, 3, 0.75],
@@ -49,7 +54,7 @@ class VectorField3DTransform(ThreeDScene):
 		)
 		
 		# Vector Field 2: Sin-Cos Field in 3D
-		vector_field_2 = ArrowVectorField(
+		vector_field_2 = GridArrowVectorField(
 			lambda pos: np.array([np.sin(pos[0]), np.cos(pos[1]), np.sin(pos[2])]),
 			colors=[YELLOW, GREEN],
 			x_range=[-3, 3, 0.75],
@@ -59,7 +64,7 @@ class VectorField3DTransform(ThreeDScene):
 		)
 		
 		# Vector Field 3: Complex Scaling Field
-		vector_field_3 = ArrowVectorField(
+		vector_field_3 = GridArrowVectorField(
 			lambda pos: np.array([pos[0] * np.sin(pos[1]), pos[1] * np.cos(pos[2]), pos[2] * np.sin(pos[0])]),
 			colors=[BLUE, ORANGE],
 			x_range=[-3, 3, 0.75],
@@ -69,7 +74,7 @@ class VectorField3DTransform(ThreeDScene):
 		)
 		
 		# Vector Field 4: Gaussian Decay Field
-		vector_field_4 = ArrowVectorField(
+		vector_field_4 = GridArrowVectorField(
 			lambda pos: np.array([np.exp(-pos[0]**2), np.exp(-pos[1]**2), np.exp(-pos[2]**2)]),
 			colors=[GREEN, PINK],
 			x_range=[-3, 3, 0.75],
@@ -79,7 +84,7 @@ class VectorField3DTransform(ThreeDScene):
 		)
 		
 		# Vector Field 5: Tangent Field in 3D
-		vector_field_5 = ArrowVectorField(
+		vector_field_5 = GridArrowVectorField(
 			lambda pos: np.array([np.tan(pos[0]), np.tan(pos[1]), np.tan(pos[2])]),
 			colors=[PURPLE, YELLOW],
 			x_range=[-3, 3, 0.75],
@@ -125,28 +130,28 @@ class VectorField3DTransform(ThreeDScene):
 		create_fixed_label(label_5)
 		
 		self.play(
-			Transform(vector_field_5, vector_field_4),
+			FieldMorph(vector_field_5, vector_field_4),
 			Transform(label_5, label_4),
 			run_time=2
 		)
 		self.wait(2)
 		
 		self.play(
-			Transform(vector_field_5, vector_field_3),
+			FieldMorph(vector_field_5, vector_field_3),
 			Transform(label_5, label_3),
 			run_time=2
 		)
 		self.wait(2)
 		
 		self.play(
-			Transform(vector_field_5, vector_field_2),
+			FieldMorph(vector_field_5, vector_field_2),
 			Transform(label_5, label_2),
 			run_time=2
 		)
 		self.wait(2)
 		
 		self.play(
-			Transform(vector_field_5, vector_field_1),
+			FieldMorph(vector_field_5, vector_field_1),
 			Transform(label_5, label_1),
 			run_time=2
 		)
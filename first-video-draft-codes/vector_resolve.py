@@ -2,9 +2,15 @@
 
 from manim import *  # Version 0.18.0
 import numpy as np
+from render_setup import install_all
+from cached_redraw import always_redraw
+from numeric_formula import NumericFormula
+from transform_updaters import add_transform_updater, orbit, rotation
 
 # Set background color
 config.background_color = ManimColor("#030303")
+# Render speed-ups and tools shared by every scene (see render_setup.py)
+install_all()
 
 class VectorResolution(Scene):
     def construct(self):
@@ -62,60 +68,60 @@ class VectorResolution(Scene):
         theta_tracker = ValueTracker(0)
         # Headers and dynamically updated mathematical notations
         header_vector = MathTex(r"\text{Vector Notation}").to_corner(UP + RIGHT, buff=1)
-        vector_component_text = always_redraw(lambda: MathTex(
-            r"\vec{B} = "
-            + f"{round(2.0 * np.cos(theta_tracker.get_value() * DEGREES), 2)} \\hat{{i}} + "
-            + f"{round(2.0 * np.sin(theta_tracker.get_value() * DEGREES), 2)} \\hat{{j}}"
-        ).next_to(header_vector, DOWN, aligned_edge=LEFT).set_color_by_gradient(BLUE, GREEN))
+        vector_component_text = NumericFormula(r"\vec{B} = ", 2.0, r"\hat{i} + ", 0.0, r"\hat{j}")
+        vector_component_text.add_updater(lambda text: text.set_values(
+            2.0 * np.cos(theta_tracker.get_value() * DEGREES),
+            2.0 * np.sin(theta_tracker.get_value() * DEGREES),
+        ).next_to(header_vector, DOWN, aligned_edge=LEFT).set_color_by_gradient(BLUE, GREEN), call_updater=True)
 
         header_components = MathTex(r"\text{Components}").next_to(vector_component_text, DOWN, buff=0.4)
-        bx_by_text = always_redraw(lambda: VGroup(
-            MathTex(
-                r"B_x = |\vec{B}|\cos\theta = "
-                + f"{round(2.0 * np.cos(theta_tracker.get_value() * DEGREES), 2)}"
-            ),
-            MathTex(
-                r"B_y = |\vec{B}|\sin\theta = "
-                + f"{round(2.0 * np.sin(theta_tracker.get_value() * DEGREES), 2)}"
-            )
-        ).arrange(DOWN, aligned_edge=LEFT).next_to(header_components, DOWN, buff=0.4).set_color_by_gradient(YELLOW, ORANGE))
+        bx_by_text = VGroup(
+            NumericFormula(r"B_x = |\vec{B}|\cos\theta = ", 2.0),
+            NumericFormula(r"B_y = |\vec{B}|\sin\theta = ", 0.0),
+        )
+
+        def update_bx_by_text(group):
+            group[0].set_values(2.0 * np.cos(theta_tracker.get_value() * DEGREES))
+            group[1].set_values(2.0 * np.sin(theta_tracker.get_value() * DEGREES))
+            group.arrange(DOWN, aligned_edge=LEFT).next_to(header_components, DOWN, buff=0.4).set_color_by_gradient(YELLOW, ORANGE)
+        bx_by_text.add_updater(update_bx_by_text, call_updater=True)
 
         header_magnitude = MathTex(r"\text{Magnitude}").next_to(bx_by_text, DOWN, buff=0.4)
-        magnitude_text = always_redraw(lambda: MathTex(
-            r"|\vec{B}| = \sqrt{B_x^2 + B_y^2} = "
-            + f"{round(np.sqrt((2.0 * np.cos(theta_tracker.get_value() * DEGREES))**2 + (2.0 * np.sin(theta_tracker.get_value() * DEGREES))**2), 2)}"
-        ).next_to(header_magnitude, DOWN, buff=0.4).set_color_by_gradient(GREEN, BLUE))
+        magnitude_text = NumericFormula(r"|\vec{B}| = \sqrt{B_x^2 + B_y^2} = ", 2.0)
+        magnitude_text.add_updater(lambda text: text.set_values(
+            np.sqrt((2.0 * np.cos(theta_tracker.get_value() * DEGREES))**2 + (2.0 * np.sin(theta_tracker.get_value() * DEGREES))**2)
+        ).next_to(header_magnitude, DOWN, buff=0.4).set_color_by_gradient(GREEN, BLUE), call_updater=True)
 
         header_unit_vector = MathTex(r"\text{Unit Vector}").next_to(magnitude_text, DOWN, buff=0.4)
-        unit_vector_text = always_redraw(lambda: MathTex(
-            r"\hat{n}_B = \frac{\vec{B}}{|\vec{B}|} = "
-            + f"{round(np.cos(theta_tracker.get_value() * DEGREES) / np.linalg.norm([np.cos(theta_tracker.get_value() * DEGREES), np.sin(theta_tracker.get_value() * DEGREES)]), 2)} \\hat{{i}} + "
-            + f"{round(np.sin(theta_tracker.get_value() * DEGREES) / np.linalg.norm([np.cos(theta_tracker.get_value() * DEGREES), np.sin(theta_tracker.get_value() * DEGREES)]), 2)} \\hat{{j}}"
-        ).next_to(header_unit_vector, DOWN, buff=0.4).set_color_by_gradient(RED, YELLOW))
+        unit_vector_text = NumericFormula(r"\hat{n}_B = \frac{\vec{B}}{|\vec{B}|} = ", 1.0, r"\hat{i} + ", 0.0, r"\hat{j}")
+        unit_vector_text.add_updater(lambda text: text.set_values(
+            np.cos(theta_tracker.get_value() * DEGREES) / np.linalg.norm([np.cos(theta_tracker.get_value() * DEGREES), np.sin(theta_tracker.get_value() * DEGREES)]),
+            np.sin(theta_tracker.get_value() * DEGREES) / np.linalg.norm([np.cos(theta_tracker.get_value() * DEGREES), np.sin(theta_tracker.get_value() * DEGREES)]),
+        ).next_to(header_unit_vector, DOWN, buff=0.4).set_color_by_gradient(RED, YELLOW), call_updater=True)
 
         # Theta text 1: 0 to 90 degrees
-        theta_text_1 = always_redraw(lambda: MathTex(
-            r"\theta = \tan^{-1}\frac{|B_y|}{|B_x|} = "
-            + f"{round(np.degrees(np.arctan(abs(np.sin(theta_tracker.get_value() * DEGREES)) / abs(np.cos(theta_tracker.get_value() * DEGREES)))), 2)}^\circ"
-        ).move_to(RIGHT * 0 + UP * 2.5 + OUT * 0).set_color_by_gradient(RED, ORANGE))
+        theta_text_1 = NumericFormula(r"\theta = \tan^{-1}\frac{|B_y|}{|B_x|} = ", 0.0, r"^\circ")
+        theta_text_1.add_updater(lambda text: text.set_values(
+            np.degrees(np.arctan(abs(np.sin(theta_tracker.get_value() * DEGREES)) / abs(np.cos(theta_tracker.get_value() * DEGREES))))
+        ).move_to(RIGHT * 0 + UP * 2.5 + OUT * 0).set_color_by_gradient(RED, ORANGE), call_updater=True)
         
         # Theta text 2: π - arctan(...) = result
-        theta_text_2 = always_redraw(lambda: MathTex(
-            r"\theta = \pi - \tan^{-1}\frac{|B_y|}{|B_x|} = "
-            + f"{round(180 - abs(np.degrees(np.arctan(np.sin(theta_tracker.get_value() * DEGREES) / np.cos(theta_tracker.get_value() * DEGREES)))), 2)}^\circ"
-        ).move_to(RIGHT * -4.85 + UP * 3.0 + OUT * 0).set_color_by_gradient(BLUE, PURPLE))
+        theta_text_2 = NumericFormula(r"\theta = \pi - \tan^{-1}\frac{|B_y|}{|B_x|} = ", 0.0, r"^\circ")
+        theta_text_2.add_updater(lambda text: text.set_values(
+            180 - abs(np.degrees(np.arctan(np.sin(theta_tracker.get_value() * DEGREES) / np.cos(theta_tracker.get_value() * DEGREES))))
+        ).move_to(RIGHT * -4.85 + UP * 3.0 + OUT * 0).set_color_by_gradient(BLUE, PURPLE), call_updater=True)
         
         # Theta text 3: π + arctan(...) = result
-        theta_text_3 = always_redraw(lambda: MathTex(
-            r"\theta = \pi + \tan^{-1}\frac{|B_y|}{|B_x|} = "
-            + f"{round(180 + abs(np.degrees(np.arctan(np.sin(theta_tracker.get_value() * DEGREES) / np.cos(theta_tracker.get_value() * DEGREES)))), 2)}^\circ"
-        ).move_to(RIGHT * -4.85 + UP * -3.0 + OUT * 0).set_color_by_gradient(GREEN, YELLOW))
+        theta_text_3 = NumericFormula(r"\theta = \pi + \tan^{-1}\frac{|B_y|}{|B_x|} = ", 0.0, r"^\circ")
+        theta_text_3.add_updater(lambda text: text.set_values(
+            180 + abs(np.degrees(np.arctan(np.sin(theta_tracker.get_value() * DEGREES) / np.cos(theta_tracker.get_value() * DEGREES))))
+        ).move_to(RIGHT * -4.85 + UP * -3.0 + OUT * 0).set_color_by_gradient(GREEN, YELLOW), call_updater=True)
         
         # Theta text 4: 2π - arctan(...) = result
-        theta_text_4 = always_redraw(lambda: MathTex(
-            r"\theta = 2\pi - \tan^{-1}\frac{|B_y|}{|B_x|} = "
-            + f"{round(360 - abs(np.degrees(np.arctan(np.sin(theta_tracker.get_value() * DEGREES) / np.cos(theta_tracker.get_value() * DEGREES)))), 2)}^\circ"
-        ).move_to(RIGHT * 0.5 + UP * -3.25 + OUT * 0).set_color_by_gradient(GRAY_A, YELLOW_C))
+        theta_text_4 = NumericFormula(r"\theta = 2\pi - \tan^{-1}\frac{|B_y|}{|B_x|} = ", 0.0, r"^\circ")
+        theta_text_4.add_updater(lambda text: text.set_values(
+            360 - abs(np.degrees(np.arctan(np.sin(theta_tracker.get_value() * DEGREES) / np.cos(theta_tracker.get_value() * DEGREES))))
+        ).move_to(RIGHT * 0.5 + UP * -3.25 + OUT * 0).set_color_by_gradient(GRAY_A, YELLOW_C), call_updater=True)
         # Add elements to the scene
         self.play(Create(plane), Write(x_label), Write(y_label), rate_func=exponential_decay, run_time=1.5)
         self.play(
@@ -131,27 +137,23 @@ class VectorResolution(Scene):
         )
         self.wait(2)
 
-        # Smoothly rotate vector B using a ValueTracker
-        vector_b_copy = vector_b.copy()
-        vector_b_label_copy = vector_b_label.copy()
-        unit_vector_b_copy = unit_vector_b.copy()
-        unit_vector_b_label_copy = unit_vector_b_label.copy()
+        # Smoothly rotate vector B using a ValueTracker; the labels orbit with it but stay upright
+        vector_b_label_center = vector_b_label.get_center()
+        unit_vector_b_label_center = unit_vector_b_label.get_center()
 
-        vector_b.add_updater(lambda vec: vec.become(
-            vector_b_copy.copy().rotate(theta_tracker.get_value() * DEGREES, about_point=plane.get_origin())
+        add_transform_updater(vector_b, lambda: rotation(
+            theta_tracker.get_value() * DEGREES, about_point=plane.get_origin()
         ))
-        vector_b_label.add_updater(lambda lbl: lbl.become(
-            vector_b_label_copy.copy().rotate(theta_tracker.get_value() * DEGREES, about_point=plane.get_origin())
-            .rotate(-theta_tracker.get_value() * DEGREES)
+        add_transform_updater(vector_b_label, lambda: orbit(
+            theta_tracker.get_value() * DEGREES, vector_b_label_center, about_point=plane.get_origin()
         ))
         
         # Update unit vector to follow vector B's direction
-        unit_vector_b.add_updater(lambda uvec: uvec.become(
-            unit_vector_b_copy.copy().rotate(theta_tracker.get_value() * DEGREES, about_point=plane.get_origin())
+        add_transform_updater(unit_vector_b, lambda: rotation(
+            theta_tracker.get_value() * DEGREES, about_point=plane.get_origin()
         ))
-        unit_vector_b_label.add_updater(lambda lbl: lbl.become(
-            unit_vector_b_label_copy.copy().rotate(theta_tracker.get_value() * DEGREES, about_point=plane.get_origin())
-            .rotate(-theta_tracker.get_value() * DEGREES)
+        add_transform_updater(unit_vector_b_label, lambda: orbit(
+            theta_tracker.get_value() * DEGREES, unit_vector_b_label_center, about_point=plane.get_origin()
         ))
 
         # Updaters to keep the vertical and horizontal lines in sync